@@ -0,0 +1,84 @@
+"""Excel reader engine benchmark.
+
+Times a full sheet read, a header probe (``nrows=0``) and listing sheet names
+with every installed engine, and shows which engine ``select_engine`` picks.
+Pass workbooks to measure; without arguments synthetic workbooks of several
+sizes are generated. Run from the repository root:
+
+    python -m benchmarks.bench_excel [--repeat N] [workbook ...]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from src.table_modifier.file_interface.excel import (
+    ENGINE_SUFFIXES,
+    EXCEL_ENGINES,
+    engine_available,
+    select_engine,
+)
+
+SYNTHETIC_ROWS = (1_000, 20_000, 100_000)
+
+
+def make_workbooks(directory: Path) -> List[Path]:
+    paths = []
+    rng = np.random.default_rng(0)
+    for rows in SYNTHETIC_ROWS:
+        df = pd.DataFrame(
+            {
+                "id": np.arange(rows),
+                "name": [f"customer {i}" for i in range(rows)],
+                "amount": rng.random(rows) * 1000,
+                "date": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            }
+        )
+        path = directory / f"sample_{rows}.xlsx"
+        df.to_excel(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(path: Path, repeat: int) -> None:
+    size_kb = path.stat().st_size / 1024
+    print(f"{path.name} ({size_kb:,.0f} KB)  auto: full={select_engine(path)} partial={select_engine(path, partial=True)}")
+    print(f"    {'engine':<10} {'full read':>12} {'header':>12} {'sheets':>12}")
+    for engine in EXCEL_ENGINES:
+        if not engine_available(engine) or path.suffix.lower() not in ENGINE_SUFFIXES[engine]:
+            continue
+        full = best_of(lambda: pd.read_excel(path, engine=engine), repeat)
+        header = best_of(lambda: pd.read_excel(path, engine=engine, nrows=0), repeat)
+        sheets = best_of(lambda: pd.ExcelFile(path, engine=engine).sheet_names, repeat)
+        print(f"    {engine:<10} {full * 1000:>9.1f} ms {header * 1000:>9.1f} ms {sheets * 1000:>9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("workbooks", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = args.workbooks or make_workbooks(Path(tmp))
+        for path in paths:
+            bench(path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Import-time benchmark for the CLI and GUI entry points.
+
+Runs ``python -X importtime`` in a fresh interpreter per target and reports the
+cumulative import time plus the slowest modules. Run from the repository root:
+
+    python -m benchmarks.bench_import [--top N]
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import List, Tuple
+
+TARGETS = [
+    "src.table_modifier.cli",
+    "src.table_modifier.file_interface.factory",
+    "src.table_modifier.config.state",
+    "src.table_modifier.gui.main_window",
+]
+
+
+def import_times(module: str) -> List[Tuple[int, str]]:
+    """Return (cumulative_us, module) rows reported by -X importtime for module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    rows: List[Tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.strip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=5, help="slowest modules to list per target")
+    args = parser.parse_args()
+    for target in TARGETS:
+        try:
+            rows = import_times(target)
+        except RuntimeError as e:
+            print(f"{target:<45} failed: {e}")
+            continue
+        total = next((us for us, name in rows if name == target), 0)
+        print(f"{target:<45} {total / 1000:>8.1f} ms")
+        for us, name in sorted(rows, reverse=True)[1:args.top + 1]:
+            print(f"    {name:<41} {us / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
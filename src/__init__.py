@@ -1,12 +1,30 @@
-import asyncio
+import importlib
 import logging
 import sys
 from typing import Any, Optional, Type
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from qasync import QEventLoop
+# Qt and the GUI are imported on first use, so non-GUI entry points (the CLI,
+# tests, scripts) importing anything under ``src`` don't pay for them.
+_LAZY_ATTRS = {
+    "QApplication": "PyQt6.QtWidgets",
+    "QMessageBox": "PyQt6.QtWidgets",
+    "QEventLoop": "qasync",
+    "MainWindow": "src.table_modifier.gui.main_window",
+}
 
-from src.table_modifier.gui.main_window import MainWindow
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported global (honours values already bound, e.g. by tests)."""
+    return globals()[name] if name in globals() else __getattr__(name)
 
 
 logging.basicConfig(
@@ -29,9 +47,11 @@ def excepthook(
     """
     logging.critical("Unhandled exception", exc_info=(exc_type, exc_value, exc_traceback))
     error_message = f"An unexpected error occurred:\n{exc_value}"
-    app = QApplication.instance()
+    # Without Qt loaded there can't be a QApplication; don't import it just to check
+    qt_loaded = "QApplication" in globals() or "PyQt6.QtWidgets" in sys.modules
+    app = _lazy("QApplication").instance() if qt_loaded else None
     if app is not None:
-        QMessageBox.critical(None, "Application Error", error_message)
+        _lazy("QMessageBox").critical(None, "Application Error", error_message)
     else:
         # Fallback for early exceptions before QApplication is created
         sys.stderr.write(error_message + "\n")
@@ -49,12 +69,14 @@ def run() -> None:
     - qasync integrates the asyncio loop with Qt; we drive the UI via loop.run_forever().
     - Creation of QApplication and the event loop happens here to avoid side effects on import.
     """
-    app = QApplication(sys.argv)
-    loop = QEventLoop(app)
+    import asyncio
+
+    app = _lazy("QApplication")(sys.argv)
+    loop = _lazy("QEventLoop")(app)
     asyncio.set_event_loop(loop)
 
     with loop:
-        main_window = MainWindow()
+        main_window = _lazy("MainWindow")()
         main_window.show()
         loop.run_forever()
 
@@ -58,7 +58,7 @@ class ColumnTypeClassifier:
 
         # Loop through candidates and adjust scores based on parent-child relationships
         for candidate in list(candidates.keys()):
-            detector = self.registry._registry[candidate]
+            detector = self.registry.get(candidate)
             parent = detector.parent_type()
             if parent and parent in candidates:
                 # If this candidate has a parent, adjust its score based on the parents score
@@ -71,20 +71,25 @@ class ColumnTypeClassifier:
             example_values=[v for v in values if str(v).strip()][:3]
         )
 
-TextDetector()
-BooleanDetector()
-NumericDetector()
-NameDetector()
-CompanyNameDetector()
-DunsDetector()
-CountryCodeDetector()
-NumericalCategoryDetector()
-TextCategoryDetector()
-CountryNameDetector()
-CurrencyCodeDetector()
-PhoneNumberDetector()
-NordicRegistrationNumberDetector()
-SwedishRegistrationNumberDetector()
-NorwegianRegistrationNumberDetector()
-DanishRegistrationNumberDetector()
-FinnishRegistrationNumberDetector()
\ No newline at end of file
+# Instantiated on first use: detectors compile their patterns in __init__
+for _detector in (
+    TextDetector,
+    BooleanDetector,
+    NumericDetector,
+    NameDetector,
+    CompanyNameDetector,
+    DunsDetector,
+    CountryCodeDetector,
+    NumericalCategoryDetector,
+    TextCategoryDetector,
+    CountryNameDetector,
+    CurrencyCodeDetector,
+    PhoneNumberDetector,
+    NordicRegistrationNumberDetector,
+    SwedishRegistrationNumberDetector,
+    NorwegianRegistrationNumberDetector,
+    DanishRegistrationNumberDetector,
+    FinnishRegistrationNumberDetector,
+):
+    DetectorRegistry.register_lazy(_detector)
+del _detector
@@ -35,7 +35,7 @@ class Detector(ABC):
         parent = self.parent_type()
         while parent:
             depth += 1
-            parent = DetectorRegistry._registry[parent].parent_type()  # type: ignore[attr-defined]
+            parent = DetectorRegistry.get(parent).parent_type()
         return depth
 
     def checks(self) -> List[AbstractCheck[Any]]:
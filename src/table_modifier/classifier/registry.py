@@ -1,13 +1,32 @@
 import logging
 from threading import RLock
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 
 class DetectorRegistry:
+    """Registry of detector instances keyed by type name.
+
+    Detectors can be registered lazily as factories (usually the class); they
+    are instantiated, compiling their checks, the first time detectors are requested.
+    """
+
     _registry: Dict[str, "Detector"] = {}
+    _pending: List[Callable[[], "Detector"]] = []
     _lock: RLock = RLock()
     _logger = logging.getLogger(__name__)
 
+    @classmethod
+    def register_lazy(cls, factory: Callable[[], "Detector"]) -> None:
+        """Queue a detector factory; instances register themselves when created."""
+        with cls._lock:
+            cls._pending.append(factory)
+
+    @classmethod
+    def _ensure_loaded(cls) -> None:
+        with cls._lock:
+            while cls._pending:
+                cls._pending.pop(0)()
+
     @classmethod
     def register(cls, detector: "Detector") -> None:
         with cls._lock:
@@ -17,4 +36,11 @@ class DetectorRegistry:
     @classmethod
     def get_detectors(cls) -> List["Detector"]:
         with cls._lock:
+            cls._ensure_loaded()
             return list(cls._registry.values())
+
+    @classmethod
+    def get(cls, type_name: str) -> "Detector":
+        with cls._lock:
+            cls._ensure_loaded()
+            return cls._registry[type_name]
@@ -36,8 +36,8 @@ class ClassificationResult:
         for candidate in top_candidates:
             depth = 0
             current = candidate
-            while DetectorRegistry._registry[current].parent_type():  # type: ignore[index]
-                current = DetectorRegistry._registry[current].parent_type()  # type: ignore[index]
+            while DetectorRegistry.get(current).parent_type():
+                current = DetectorRegistry.get(current).parent_type()
                 depth += 1
 
             if depth > best_depth:
@@ -55,8 +55,8 @@ class ClassificationResult:
             return None
         current = best_type
         # Walk up to top-most ancestor
-        while DetectorRegistry._registry[current].parent_type():  # type: ignore[index]
-            current = DetectorRegistry._registry[current].parent_type()  # type: ignore[index]
+        while DetectorRegistry.get(current).parent_type():
+            current = DetectorRegistry.get(current).parent_type()
         return current
 
     def __repr__(self):
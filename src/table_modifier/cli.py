@@ -1,7 +1,6 @@
 # src/table_modifier/cli.py
 import click
 from src.table_modifier.localization import String
-from src.table_modifier.file_interface.factory import load
 
 @click.command(help=String.translate("cli_help"))
 @click.option('--lang', '-l', default='en', help="Language code for messages")
@@ -9,6 +8,9 @@ from src.table_modifier.file_interface.factory import load
 @click.argument('output_path', type=click.Path())
 def main(lang, input_path, output_path):
   """Load, process and save a table file."""
+  # Imported here so `--help` doesn't pay for the file interfaces
+  from src.table_modifier.file_interface.factory import load
+
   String.set_language(lang)
   click.echo(String.translate("processing_file", file=input_path))
   table = load(input_path)
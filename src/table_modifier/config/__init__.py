@@ -22,8 +22,42 @@ controls = {
             "type": "combo",
             "name": "processing.csv_delimiter",
             "label": "CSV Delimiter",
-            "items": [",", "\t", ";"],
-            "default": ",",
+            "items": ["auto", ",", "\t", ";", "|"],
+            "default": "auto",
+        },
+        {
+            "type": "combo",
+            "name": "processing.csv_encoding",
+            "label": "CSV Encoding",
+            "items": ["auto", "utf-8", "cp1252", "latin-1", "utf-16"],
+            "default": "auto",
+        },
+        {
+            "type": "combo",
+            "name": "processing.output_compression",
+            "label": "CSV output compression",
+            "items": ["input", "none", "gzip", "zstd", "bz2", "xz", "zip"],
+            "default": "input",
+        },
+        {
+            "type": "combo",
+            "name": "excel.engine",
+            "label": "Excel reader engine",
+            "items": ["auto", "calamine", "openpyxl", "xlrd"],
+            "default": "auto",
+        },
+        {
+            "type": "checkbox",
+            "name": "processing.isolate",
+            "label": "Run processing in a separate process",
+            "default": False,
+        },
+        {
+            "type": "combo",
+            "name": "processing.memory_limit_mb",
+            "label": "Worker memory limit (MB, 0 = unlimited)",
+            "items": ["0", "2048", "4096", "8192", "16384", "32768"],
+            "default": "0",
         },
         {
             "type": "checkbox",
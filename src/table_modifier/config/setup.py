@@ -2,3 +2,25 @@ from pathlib import Path
 ROOT_PATH: Path = Path(__file__)
 while not ROOT_PATH.joinpath("README.md").exists():
     ROOT_PATH = ROOT_PATH.parent
+
+APP_NAME = "table_modifier"
+# Used when platformdirs is missing, so caches and state still persist
+FALLBACK_USER_DIR: Path = Path.home() / f".{APP_NAME}"
+
+
+def user_cache_path() -> Path:
+    """Per-user cache directory (platformdirs' when installed)."""
+    try:
+        from platformdirs import user_cache_dir
+    except Exception:  # pragma: no cover - declared dependency
+        return FALLBACK_USER_DIR / "cache"
+    return Path(user_cache_dir(APP_NAME))
+
+
+def user_data_path() -> Path:
+    """Per-user data directory (platformdirs' when installed)."""
+    try:
+        from platformdirs import user_data_dir
+    except Exception:  # pragma: no cover - declared dependency
+        return FALLBACK_USER_DIR / "data"
+    return Path(user_data_dir(APP_NAME))
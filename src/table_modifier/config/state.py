@@ -1,12 +1,16 @@
 import logging
 from threading import Lock
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, TYPE_CHECKING
 
 from src.table_modifier.file_interface.protocol import FileInterfaceProtocol
 from src.table_modifier.file_interface.utils import from_file_path, FilePath
 from src.table_modifier.file_status import FileStatus
 from src.table_modifier.signals import EMIT
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.table_modifier.config.store import StateStore
+
 
 class FileList:
     """
@@ -100,47 +104,163 @@ class Container:
 
 
 class State:
+    """Application state: tracked files plus a flat map of named controls.
+
+    Controls use copy-on-write snapshots. Readers get the current read-only
+    mapping without copying or locking; writers build a new mapping and swap it
+    in atomically, bumping ``version``. Values inside a snapshot are shared, so
+    copy nested dicts/lists before changing them and write them back with
+    update_control().
+
+    With a StateStore attached, persisted controls are loaded on first access
+    and changes to them are written back in the background.
+    """
+
+    # Serializes writers only; readers never take it
     _controls_lock: Lock = Lock()
 
     def __init__(self):
         self.container: Container = Container()
         self.tracked_files: FileList = FileList("tracked_files")
-        self._controls: Dict[str, Any] = {}
+        self._controls: Mapping[str, Any] = MappingProxyType({})
+        self._version: int = 0
+        self._store: Optional["StateStore"] = None
+        # Store whose controls haven't been merged in yet (loaded on first access)
+        self._unloaded_store: Optional["StateStore"] = None
         self._logger = logging.getLogger(self.__class__.__name__)
 
+    @property
+    def store(self) -> Optional["StateStore"]:
+        return self._store
+
+    def attach_store(self, store: Optional["StateStore"]) -> None:
+        """Persist controls through store (None detaches); loading is deferred."""
+        with self._controls_lock:
+            self._store = store
+            self._unloaded_store = store
+
+    def _snapshot(self) -> Mapping[str, Any]:
+        if self._unloaded_store is not None:
+            self._load_store()
+        return self._controls
+
+    def _load_store(self) -> None:
+        with self._controls_lock:
+            store = self._unloaded_store
+            if store is None:
+                return
+            self._unloaded_store = None
+            persisted = store.load_controls()
+            if persisted:
+                self._swap({**self._controls, **persisted})
+
+    def _persist(self, name_id: str, value: Any, removed: bool = False) -> None:
+        store = self._store
+        if store is None or not store.persists(name_id):
+            return
+        if removed:
+            store.stage_delete(name_id)
+        else:
+            store.stage(name_id, value)
+
+    def _swap(self, new_controls: Dict[str, Any]) -> None:
+        """Install new_controls as the current snapshot (caller holds the lock)."""
+        self._controls = MappingProxyType(new_controls)
+        self._version += 1
+
     def add_control(self, name_id: str, value: Any = None):
         """Add a control with an initial value; emits a 'control.added' event."""
+        self._snapshot()
         with self._controls_lock:
-            if name_id in self._controls:
-                self._logger.warning(
-                    f"Control '{name_id}' already exists; updating its value."
-                )
-                self.update_control(name_id, value)
-            else:
-                self._controls[name_id] = value
-                EMIT(f"control.{name_id}.added", control=name_id, value=value)
+            exists = name_id in self._controls
+            if not exists:
+                self._swap({**self._controls, name_id: value})
+        if exists:
+            self._logger.warning(
+                f"Control '{name_id}' already exists; updating its value."
+            )
+            self.update_control(name_id, value)
+        else:
+            self._persist(name_id, value)
+            EMIT(f"control.{name_id}.added", control=name_id, value=value)
         self._logger.debug(f"Control '{name_id}' added with value: {value}")
 
     @property
-    def controls(self) -> Dict[str, Any]:
-        """Return a copy of current controls state."""
+    def controls(self) -> Mapping[str, Any]:
+        """Return the current read-only snapshot of controls (no copy is made)."""
+        return self._snapshot()
+
+    @controls.setter
+    def controls(self, new_controls: Mapping[str, Any]) -> None:
+        """Replace all controls at once; emits a 'controls.replaced' event."""
+        self._snapshot()
         with self._controls_lock:
-            return self._controls.copy()
+            self._swap(dict(new_controls))
+        if self._store is not None:
+            for name_id in self._store.keys:
+                self._persist(name_id, new_controls.get(name_id), removed=name_id not in new_controls)
+        EMIT("controls.replaced", version=self._version)
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every change, for cheap change detection."""
+        return self._version
+
+    def get_bool(self, name_id: str, default: bool = False) -> bool:
+        value = self._snapshot().get(name_id)
+        return default if value is None else bool(value)
+
+    def get_int(self, name_id: str, default: int = 0) -> int:
+        try:
+            return int(self._snapshot().get(name_id) or default)
+        except (TypeError, ValueError):
+            return default
+
+    def get_str(self, name_id: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._snapshot().get(name_id)
+        return default if value in (None, "") else str(value)
+
+    def get_mapping(self, name_id: str) -> Mapping[str, Any]:
+        """Return a dict-valued control, or an empty mapping if unset or not a dict."""
+        value = self._snapshot().get(name_id)
+        return value if isinstance(value, Mapping) else MappingProxyType({})
 
     def maybe_store(self):
-        """Placeholder for persisting state to disk or config."""
-        self._logger.warning("State is not stored; implement storage logic if needed.")
+        """Flush pending writes to the attached store, if any."""
+        if self._store is None:
+            self._logger.warning("State is not stored; no state store attached.")
+            return
+        self._store.flush()
+
+    def record_run(self, source: Optional[str], rows: int, elapsed: float, throughput: float) -> None:
+        """Add a processing run to the stored metrics history (no-op without a store)."""
+        if self._store is not None:
+            self._store.record_run(source, rows, elapsed, throughput)
 
     def update_control(self, name_id: str, new_value: Any = None):
         """Update a control value and emit an 'updated' event."""
+        self._snapshot()
         with self._controls_lock:
-            self._controls[name_id] = new_value
-            EMIT(f"control.{name_id}.updated", control=name_id, new_value=new_value)
+            self._swap({**self._controls, name_id: new_value})
+        self._persist(name_id, new_value)
+        EMIT(f"control.{name_id}.updated", control=name_id, new_value=new_value)
         self._logger.debug(f"Control '{name_id}' updated to: {new_value}")
 
+    def remove_control(self, name_id: str) -> None:
+        """Remove a control if present and emit a 'removed' event."""
+        self._snapshot()
+        with self._controls_lock:
+            if name_id not in self._controls:
+                return
+            new_controls = dict(self._controls)
+            del new_controls[name_id]
+            self._swap(new_controls)
+        self._persist(name_id, None, removed=True)
+        EMIT(f"control.{name_id}.removed", control=name_id)
+
     def __setitem__(self, name_id: str, value: Any) -> None:
         """Dict-like assignment for controls, delegates to update_control."""
         self.update_control(name_id, value)
 
 
-state = State()
\ No newline at end of file
+state = State()
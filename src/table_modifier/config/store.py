@@ -0,0 +1,193 @@
+"""SQLite-backed persistence for selected controls and processing run history.
+
+Writes are staged in memory and flushed by a background thread once no new
+write arrived for ``debounce_ms``, so bursts of GUI edits become a single
+transaction off the GUI thread. Reads are on demand: State loads the persisted
+controls on first access and the run history is only queried when asked for.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from src.table_modifier.config.setup import user_data_path
+from src.table_modifier.signals import DEFAULT_DEBOUNCE_MS
+
+logger = logging.getLogger(__name__)
+
+# Controls worth keeping across restarts
+PERSISTED_CONTROLS: FrozenSet[str] = frozenset(
+    {
+        "map.mapping.by_source",
+        "map.order.by_source",
+        "map.skip_rows.by_source",
+        "processing.last_elapsed",
+        "processing.last_throughput",
+    }
+)
+
+# Upper bound for the stored run history; older runs are pruned on flush
+DEFAULT_MAX_RUNS = 1000
+
+_DELETED = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS controls (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    source TEXT,
+    rows INTEGER,
+    elapsed REAL,
+    throughput REAL
+);
+"""
+
+
+class StateStore:
+    """Durable store for persisted controls and processing metrics."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        keys: FrozenSet[str] = PERSISTED_CONTROLS,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+        max_runs: int = DEFAULT_MAX_RUNS,
+    ) -> None:
+        self.path = Path(path)
+        self.keys = keys
+        self.debounce = debounce_ms / 1000.0
+        self.max_runs = max_runs
+        self._cond = threading.Condition()
+        # Held while a batch is taken and written, so batches commit in order
+        self._write_lock = threading.Lock()
+        self._pending: Dict[str, Any] = {}
+        self._pending_runs: List[tuple] = []
+        self._deadline = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._initialized = False
+
+    def persists(self, name: str) -> bool:
+        return name in self.keys
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        if not self._initialized:
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def load_controls(self) -> Dict[str, Any]:
+        """Return all persisted controls; unreadable entries are skipped."""
+        if not self.path.exists():
+            return {}
+        out: Dict[str, Any] = {}
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute("SELECT name, value FROM controls").fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Could not load stored state from %s: %s", self.path, e)
+            return {}
+        for name, value in rows:
+            try:
+                out[name] = json.loads(value)
+            except ValueError:
+                logger.debug("Skipping unreadable stored control %s", name)
+        return out
+
+    def runs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Return the most recent processing runs, newest first."""
+        self.flush()
+        if not self.path.exists():
+            return []
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT ts, source, rows, elapsed, throughput FROM runs ORDER BY id DESC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        keys = ("ts", "source", "rows", "elapsed", "throughput")
+        return [dict(zip(keys, r)) for r in rows]
+
+    def stage(self, name: str, value: Any) -> None:
+        """Queue a control write; serialized now so later mutations don't leak in."""
+        try:
+            encoded = json.dumps(value, default=str)
+        except (TypeError, ValueError) as e:
+            logger.debug("Not persisting control %s: %s", name, e)
+            return
+        self._queue(lambda: self._pending.__setitem__(name, encoded))
+
+    def stage_delete(self, name: str) -> None:
+        self._queue(lambda: self._pending.__setitem__(name, _DELETED))
+
+    def record_run(self, source: Optional[str], rows: int, elapsed: float, throughput: float) -> None:
+        """Queue a processing run for the metrics history."""
+        run = (time.time(), source, int(rows), float(elapsed), float(throughput))
+        self._queue(lambda: self._pending_runs.append(run))
+
+    def _queue(self, apply) -> None:
+        with self._cond:
+            apply()
+            self._deadline = time.monotonic() + self.debounce
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="StateStoreWriter", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not (self._pending or self._pending_runs):
+                    self._cond.wait()
+                # Debounce: wait until writes have been quiet for the interval
+                while (self._pending or self._pending_runs) and time.monotonic() < self._deadline:
+                    self._cond.wait(self._deadline - time.monotonic())
+            self.flush()
+
+    def flush(self) -> None:
+        """Write everything staged so far, synchronously."""
+        with self._write_lock:
+            with self._cond:
+                pending, self._pending = self._pending, {}
+                runs, self._pending_runs = self._pending_runs, []
+            if not pending and not runs:
+                return
+            now = time.time()
+            try:
+                with closing(self._connect()) as conn, conn:
+                    for name, value in pending.items():
+                        if value is _DELETED:
+                            conn.execute("DELETE FROM controls WHERE name = ?", (name,))
+                        else:
+                            conn.execute(
+                                "INSERT INTO controls (name, value, updated) VALUES (?, ?, ?) "
+                                "ON CONFLICT(name) DO UPDATE SET value = excluded.value, updated = excluded.updated",
+                                (name, value, now),
+                            )
+                    if runs:
+                        conn.executemany(
+                            "INSERT INTO runs (ts, source, rows, elapsed, throughput) VALUES (?, ?, ?, ?, ?)",
+                            runs,
+                        )
+                        conn.execute(
+                            "DELETE FROM runs WHERE id <= (SELECT MAX(id) FROM runs) - ?",
+                            (self.max_runs,),
+                        )
+            except sqlite3.Error as e:
+                logger.warning("Could not write state to %s: %s", self.path, e)
+
+
+def default_state_store() -> StateStore:
+    """Return a StateStore in the user's data directory."""
+    return StateStore(user_data_path() / "state.sqlite3")
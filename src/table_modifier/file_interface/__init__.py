@@ -1,2 +1,37 @@
-import src.table_modifier.file_interface.csv
-import src.table_modifier.file_interface.excel
+"""Tabular file interfaces.
+
+Handlers are registered with the factory by suffix and imported on first use,
+so importing this package (or the factory) doesn't pull in pandas.
+"""
+
+from src.table_modifier.file_interface.factory import FileInterfaceFactory
+from src.table_modifier.file_interface.formats import (
+    CSV_EXTENSIONS, CSV_SIGNATURES, EXCEL_EXTENSIONS, EXCEL_SIGNATURES,
+)
+
+FileInterfaceFactory.register_lazy(
+    "src.table_modifier.file_interface.csv:CSVFileInterface",
+    CSV_EXTENSIONS,
+    CSV_SIGNATURES,
+)
+FileInterfaceFactory.register_lazy(
+    "src.table_modifier.file_interface.excel:ExcelFileInterface",
+    EXCEL_EXTENSIONS,
+    EXCEL_SIGNATURES,
+)
+
+_LAZY_ATTRS = {
+    "CSVFileInterface": "src.table_modifier.file_interface.csv",
+    "ExcelFileInterface": "src.table_modifier.file_interface.excel",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,184 @@
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
 from src.table_modifier.file_interface.protocol import FileInterfaceProtocol
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import pandas as pd
+
+    from src.table_modifier.file_interface.cache import ParseCache
+
+# Rows read per chunk when streaming records
+STREAM_CHUNK_ROWS = 10_000
+# Pending appended row dicts are turned into a frame once this many accumulate
+APPEND_COMPACT_ROWS = 50_000
+# ... and pending frames are combined once this many accumulate
+APPEND_COMPACT_FRAMES = 1_000
+
+
+def iter_records(df: "pd.DataFrame") -> Iterator[Dict[str, Any]]:
+    """Yield the rows of df as plain dicts with native Python values.
+
+    Converting whole columns with ``tolist`` and zipping them is several times
+    faster than ``to_dict("records")`` or ``itertuples``.
+    """
+    keys = list(df.columns)
+    values = [df.iloc[:, i].tolist() for i in range(len(keys))]
+    for row in zip(*values):
+        yield dict(zip(keys, row))
+
+
+class AppendBuffer:
+    """Rows and frames appended to an interface, combined only when needed.
+
+    Appending with ``pd.concat`` each time copies everything appended so far, so
+    many small batches cost quadratic time. The buffer just collects them and
+    ``materialize`` concatenates once; pending row dicts and small frames are
+    compacted along the way so their overhead stays bounded.
+    """
+
+    def __init__(
+        self, compact_rows: int = APPEND_COMPACT_ROWS, compact_frames: int = APPEND_COMPACT_FRAMES
+    ) -> None:
+        self.compact_rows = compact_rows
+        self.compact_frames = compact_frames
+        self._frames: List["pd.DataFrame"] = []
+        self._records: List[Dict[str, Any]] = []
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __bool__(self) -> bool:
+        return bool(self._frames or self._records)
+
+    def add_records(self, records: List[Dict[str, Any]]) -> None:
+        self._records.extend(records)
+        self.rows += len(records)
+        if len(self._records) >= self.compact_rows:
+            self._compact_records()
+
+    def add_frame(self, df: "pd.DataFrame") -> None:
+        # Records appended earlier must stay ahead of this frame
+        self._compact_records()
+        # A shallow copy is enough: with copy-on-write later edits to df don't leak in
+        self._frames.append(df.copy(deep=False))
+        self.rows += len(df)
+        if len(self._frames) >= self.compact_frames:
+            self._frames = [self._concat(self._frames)]
+
+    def _compact_records(self) -> None:
+        if self._records:
+            import pandas as pd
+
+            self._frames.append(pd.DataFrame(self._records))
+            self._records = []
+
+    @staticmethod
+    def _concat(frames: List["pd.DataFrame"]) -> "pd.DataFrame":
+        if len(frames) == 1:
+            return frames[0]
+        import pandas as pd
+
+        return pd.concat(frames, ignore_index=True)
+
+    def materialize(self, base: Optional["pd.DataFrame"] = None) -> Optional["pd.DataFrame"]:
+        """Return base with everything appended, emptying the buffer."""
+        self._compact_records()
+        frames = ([base] if base is not None else []) + self._frames
+        self._frames = []
+        self.rows = 0
+        return self._concat(frames) if frames else base
+
 
 class BaseInterface(FileInterfaceProtocol):
+    # Lower-case suffixes the factory indexes this handler under
+    extensions: ClassVar[Tuple[str, ...]] = ()
+
+    # Set by FileInterfaceFactory.create for handlers that support it
+    supports_parse_cache: bool = False
+    parse_cache: Optional["ParseCache"] = None
+
+    # Loaded or appended data, read and written through ``_df``
+    _frame: Optional["pd.DataFrame"] = None
+    _pending: Optional[AppendBuffer] = None
+
+    @classmethod
+    def sniff(cls, file_path: str, head: bytes) -> bool:
+        """Return True if the content (head = first bytes) is in this format."""
+        return False
+
+    @property
+    def _df(self) -> Optional["pd.DataFrame"]:
+        """The in-memory frame, with any buffered appends combined into it first."""
+        if self._pending:
+            self._frame = self._pending.materialize(self._frame)
+        self._pending = None
+        return self._frame
+
+    @_df.setter
+    def _df(self, df: Optional["pd.DataFrame"]) -> None:
+        # Replacing the frame (e.g. on load) drops appends not yet combined, as before
+        self._frame = df
+        self._pending = None
+
+    def _append_buffer(self) -> AppendBuffer:
+        if self._pending is None:
+            self._pending = AppendBuffer()
+        return self._pending
+
+    def stream_rows(
+        self, columns: Optional[Sequence[str]] = None, chunksize: int = STREAM_CHUNK_ROWS
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream rows as dicts, reading chunksize rows at a time.
+
+        columns limits (and orders) the keys of each record; unknown names raise KeyError.
+        """
+        for chunk in self._record_chunks(list(columns) if columns is not None else None, chunksize):
+            yield from iter_records(chunk)
+
+    def _record_chunks(self, columns: Optional[List[str]], chunksize: int) -> Iterator["pd.DataFrame"]:
+        """Chunks for stream_rows; formats that can skip unwanted columns while parsing override this."""
+        for chunk in self.iter_load(chunksize=chunksize):
+            yield chunk if columns is None else chunk[columns]
+
+    def read_rows(self, start: int, count: int) -> "pd.DataFrame":
+        """Return data rows start..start+count-1; formats with random access override this."""
+        import pandas as pd
+
+        start, count = max(0, int(start)), max(0, int(count))
+        end = start + count
+        parts = []
+        pos = 0
+        chunks = self.iter_load(chunksize=max(count, STREAM_CHUNK_ROWS))
+        try:
+            for chunk in chunks:
+                if pos + len(chunk) > start:
+                    parts.append(chunk.iloc[max(0, start - pos):end - pos])
+                pos += len(chunk)
+                if pos >= end:
+                    break
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        if not parts:
+            return pd.DataFrame(columns=self.get_headers() or [])
+        return pd.concat(parts, ignore_index=True)
+
+    def read_head(self, count: int) -> "pd.DataFrame":
+        """Return the first count data rows; formats that read whole tables override this."""
+        return self.read_rows(0, count)
+
+    def count_rows(self) -> Optional[int]:
+        """Number of data rows if known without a full read, else None."""
+        return None
+
+    def _cache_key(self, *parts: Any) -> Optional[str]:
+        """Return the parse-cache key for this source and read options, if caching is on."""
+        if self.parse_cache is None:
+            return None
+        return self.parse_cache.key_for(self.path, *parts)
+
     def __hash__(self) -> int:
         """Support hashing by using the file path."""
         return hash(self.path)
@@ -0,0 +1,173 @@
+"""Columnar sidecar cache for slow-to-parse sources (e.g. Excel workbooks).
+
+The first full read of a cacheable source writes a Parquet sidecar into a cache
+directory; later reads of the unchanged source are served from the sidecar.
+Entries are keyed by path, mtime, size, sheet and skip rows, so any change to
+the source (or to how it is read) naturally misses the cache.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+import pandas as pd
+
+from src.table_modifier.config.setup import user_cache_path
+
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Default upper bound for the whole cache directory (2 GiB)
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+
+class ParseCache:
+    """Size-bounded LRU directory of Parquet sidecars.
+
+    Recency is tracked through file mtimes: a cache hit touches the sidecar and
+    eviction removes the least recently used sidecars first.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        """Return True if the Parquet backend (pyarrow) is installed."""
+        return pq is not None
+
+    def key_for(self, path: str | Path, *parts: Any) -> Optional[str]:
+        """Return a cache key for the source at path, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        raw = "|".join(
+            [Path(path).resolve().as_posix(), str(st.st_mtime_ns), str(st.st_size)]
+            + [repr(p) for p in parts]
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def contains(self, key: str) -> bool:
+        return pq is not None and self._path_for(key).is_file()
+
+    def schema(self, key: str) -> Optional[pd.DataFrame]:
+        """Return an empty DataFrame with the cached columns and dtypes, if cached."""
+        if not self.contains(key):
+            return None
+        try:
+            return pq.read_schema(self._path_for(key)).empty_table().to_pandas()
+        except Exception as e:
+            logger.debug("Could not read cached schema %s: %s", key, e)
+            return None
+
+    def get(self, key: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame (optionally only some columns), or None on a miss."""
+        if not self.contains(key):
+            return None
+        path = self._path_for(key)
+        try:
+            df = pd.read_parquet(path, columns=columns)
+        except Exception as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", path.name, e)
+            self._discard(path)
+            return None
+        self._touch(path)
+        return df
+
+    def iter_batches(
+        self, key: str, chunksize: int, columns: Optional[List[str]] = None
+    ) -> Optional[Iterator[pd.DataFrame]]:
+        """Return an iterator of chunksize-row DataFrames from the sidecar, or None on a miss."""
+        if not self.contains(key):
+            return None
+        path = self._path_for(key)
+        self._touch(path)
+
+        def _batches() -> Iterator[pd.DataFrame]:
+            offset = 0
+            for batch in pq.ParquetFile(path).iter_batches(
+                batch_size=max(1, int(chunksize)), columns=columns
+            ):
+                df = batch.to_pandas()
+                # Keep a continuous index across chunks, like pandas' chunked readers
+                df.index = pd.RangeIndex(offset, offset + len(df))
+                offset += len(df)
+                yield df
+
+        return _batches()
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Store df under key; returns False if the frame can't be stored as Parquet."""
+        if pq is None:
+            return False
+        path = self._path_for(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+        except Exception as e:
+            # Mixed-type object columns or non-string column names can't be stored
+            logger.debug("Not caching %s: %s", key, e)
+            self._discard(tmp)
+            return False
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Remove least recently used sidecars until the directory fits max_bytes."""
+        with self._lock:
+            entries = []
+            for p in self.directory.glob(f"*{self.suffix}"):
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                self._discard(p)
+                total -= size
+
+    def clear(self) -> None:
+        """Remove every sidecar from the cache directory."""
+        with self._lock:
+            for p in self.directory.glob(f"*{self.suffix}"):
+                self._discard(p)
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def default_parse_cache() -> Optional[ParseCache]:
+    """Return a ParseCache in the user's cache directory, or None without pyarrow."""
+    if not ParseCache.available():
+        return None
+    return ParseCache(user_cache_path() / "parse_cache")
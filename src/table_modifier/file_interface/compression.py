@@ -0,0 +1,192 @@
+"""Helpers for compressed tabular files (``.csv.gz``, ``.csv.zst``, ``.zip`` …).
+
+pandas already stream-decompresses while parsing when given a compressed path;
+these helpers cover the remaining pieces: recognising compressed names,
+opening a decompressed byte or text stream for sniffing, choosing
+compression options (e.g. multi-threaded zstd) when writing, and opening a
+compressing text stream that output can be written to chunk by chunk.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, IO, Optional, Tuple, Union
+
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Compression method by (last) file suffix, using pandas' method names
+COMPRESSION_BY_SUFFIX: Dict[str, str] = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+    ".zip": "zip",
+}
+
+SUFFIX_BY_COMPRESSION: Dict[str, str] = {v: k for k, v in COMPRESSION_BY_SUFFIX.items()}
+
+
+def split_compression(file_path: Union[str, Path]) -> Tuple[str, Optional[str]]:
+    """Return (format_suffix, compression) for a path.
+
+    Examples:
+        "a.csv"      -> (".csv", None)
+        "a.csv.gz"   -> (".csv", "gzip")
+        "a.zip"      -> ("", "zip")
+    """
+    suffixes = [s.lower() for s in Path(str(file_path)).suffixes]
+    if not suffixes:
+        return "", None
+    method = COMPRESSION_BY_SUFFIX.get(suffixes[-1])
+    if method is None:
+        return suffixes[-1], None
+    return (suffixes[-2] if len(suffixes) >= 2 else ""), method
+
+
+def strip_compression(file_path: Union[str, Path]) -> Path:
+    """Return the path without its compression suffix, if any."""
+    p = Path(str(file_path))
+    _, method = split_compression(p)
+    return p.with_suffix("") if method else p
+
+
+def zip_member(file_path: Union[str, Path], suffix: str = ".csv") -> Optional[str]:
+    """Return the name of the single ``suffix`` member of a zip archive, else None."""
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            members = [i.filename for i in zf.infolist() if not i.is_dir()]
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if len(members) == 1 and members[0].lower().endswith(suffix):
+        return members[0]
+    return None
+
+
+def open_text(
+    file_path: Union[str, Path],
+    encoding: str = "utf-8",
+    newline: Optional[str] = "",
+    errors: str = "strict",
+) -> IO[str]:
+    """Open a (possibly compressed) file as a decompressing text stream."""
+    _, method = split_compression(file_path)
+    if method is None:
+        return open(file_path, mode="r", newline=newline, encoding=encoding, errors=errors)
+    if method == "gzip":
+        return gzip.open(file_path, mode="rt", newline=newline, encoding=encoding, errors=errors)
+    if method == "bz2":
+        return bz2.open(file_path, mode="rt", newline=newline, encoding=encoding, errors=errors)
+    if method == "xz":
+        return lzma.open(file_path, mode="rt", newline=newline, encoding=encoding, errors=errors)
+    if method == "zstd":
+        if zstandard is None:
+            raise ValueError("Reading .zst files requires the 'zstandard' package")
+        return zstandard.open(file_path, mode="rt", newline=newline, encoding=encoding, errors=errors)
+    # zip: the member stream keeps the archive's file handle alive after close()
+    with zipfile.ZipFile(file_path) as zf:
+        members = [i.filename for i in zf.infolist() if not i.is_dir()]
+        if len(members) != 1:
+            raise ValueError(f"Expected exactly one file in {file_path}, found {len(members)}")
+        raw = zf.open(members[0])
+    return io.TextIOWrapper(raw, encoding=encoding, newline=newline, errors=errors)
+
+
+def open_binary(file_path: Union[str, Path]) -> IO[bytes]:
+    """Open a (possibly compressed) file as a decompressing byte stream."""
+    _, method = split_compression(file_path)
+    if method is None:
+        return open(file_path, mode="rb")
+    if method == "gzip":
+        return gzip.open(file_path, mode="rb")
+    if method == "bz2":
+        return bz2.open(file_path, mode="rb")
+    if method == "xz":
+        return lzma.open(file_path, mode="rb")
+    if method == "zstd":
+        if zstandard is None:
+            raise ValueError("Reading .zst files requires the 'zstandard' package")
+        return zstandard.open(file_path, mode="rb")
+    with zipfile.ZipFile(file_path) as zf:
+        members = [i.filename for i in zf.infolist() if not i.is_dir()]
+        if len(members) != 1:
+            raise ValueError(f"Expected exactly one file in {file_path}, found {len(members)}")
+        return zf.open(members[0])
+
+
+def _archive_member(file_path: Union[str, Path]) -> str:
+    # Name the archive member after the archive itself (a.csv.zip -> a.csv)
+    member = strip_compression(file_path).name
+    if not Path(member).suffix:
+        member = f"{member}.csv"
+    return member
+
+
+class _ArchiveMemberWriter(io.TextIOWrapper):
+    """Text stream into a zip member that closes the archive along with the member."""
+
+    def __init__(self, archive: zipfile.ZipFile, member: str, encoding: str, newline: Optional[str]) -> None:
+        super().__init__(archive.open(member, mode="w", force_zip64=True), encoding=encoding, newline=newline)
+        self._archive = archive
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._archive.close()
+
+
+def open_text_write(
+    file_path: Union[str, Path],
+    encoding: str = "utf-8",
+    newline: Optional[str] = "",
+    name: Union[str, Path, None] = None,
+) -> IO[str]:
+    """Open file_path as a compressing text stream for writing.
+
+    The compression (and zip member name) follows name, which defaults to
+    file_path; pass the final name when writing to a temporary file first.
+    zstd output uses all cores, as with write_compression.
+    """
+    name = file_path if name is None else name
+    _, method = split_compression(name)
+    if method is None:
+        return open(file_path, mode="w", newline=newline, encoding=encoding)
+    if method == "gzip":
+        return gzip.open(file_path, mode="wt", newline=newline, encoding=encoding)
+    if method == "bz2":
+        return bz2.open(file_path, mode="wt", newline=newline, encoding=encoding)
+    if method == "xz":
+        return lzma.open(file_path, mode="wt", newline=newline, encoding=encoding)
+    if method == "zstd":
+        if zstandard is None:
+            raise ValueError("Writing .zst files requires the 'zstandard' package")
+        return zstandard.open(
+            file_path, mode="wt", cctx=zstandard.ZstdCompressor(threads=-1), newline=newline, encoding=encoding
+        )
+    archive = zipfile.ZipFile(file_path, mode="w", compression=zipfile.ZIP_DEFLATED)
+    try:
+        return _ArchiveMemberWriter(archive, _archive_member(name), encoding, newline)
+    except Exception:
+        archive.close()
+        raise
+
+
+def write_compression(file_path: Union[str, Path]) -> Union[str, Dict[str, Any], None]:
+    """Return the pandas ``compression=`` argument for writing to file_path.
+
+    zstd output uses all cores when the zstandard package is available.
+    """
+    _, method = split_compression(file_path)
+    if method is None:
+        return None
+    if method == "zstd":
+        return {"method": "zstd", "threads": -1}
+    if method == "zip":
+        return {"method": "zip", "archive_name": _archive_member(file_path)}
+    return method
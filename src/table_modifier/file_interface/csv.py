@@ -1,48 +1,95 @@
 import csv
 import logging
 import os
+import threading
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional, Iterator, Dict, List, Any
+from typing import Optional, Iterator, Dict, List, Any, Tuple, ClassVar
 
-import pandas as pd
 from pandas import DataFrame, read_csv
 
 from .base import BaseInterface
+from .compression import open_text, open_text_write, split_compression, write_compression, zip_member
+from .dialect import CSVDialect, CSVEncodingError, detect_dialect
+from .row_index import DEFAULT_STEP, RowIndex, RowIndexCache, indexable
 from .factory import FileInterfaceFactory
-from .utils import FilePath
+from .formats import CSV_EXTENSIONS, ZIP_MAGIC
+from .utils import FilePath, fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Delimiter/encoding setting meaning "detect from the file"
+AUTO_DELIMITER = "auto"
+AUTO_ENCODING = "auto"
+
 
 class CSVFileInterface(BaseInterface):
     file_type = "csv"
+    extensions = CSV_EXTENSIONS
+    # Shared by all CSV interfaces; the GUI swaps in one that keeps sidecars on disk
+    row_indexes: ClassVar[RowIndexCache] = RowIndexCache()
+    row_index_step: ClassVar[int] = DEFAULT_STEP
 
     def __init__(self, file_path: FilePath, **kwargs):
         self._cached_headers: Optional[List[str]] = None
         self.path = Path(file_path)
         self._df: Optional[DataFrame] = None
         self._file = None
-        self._delimiter = kwargs.get("delimiter", ",")
+        # None (or "auto") detects the delimiter along with the rest of the dialect
+        self._delimiter: Optional[str] = kwargs.get("delimiter")
+        self._encoding: Optional[str] = kwargs.get("encoding")
+        self._dialect: Optional[CSVDialect] = None
+        self._dialect_key: Optional[Tuple[Any, Optional[str], Optional[str]]] = None
         self._skip_rows: int = 0
         self._skip_rows_list: Optional[List[int]] = None
 
+    def set_delimiter(self, delimiter: Optional[str]) -> None:
+        """Force the delimiter used for reading and writing; None or "auto" detects it."""
+        self._delimiter = delimiter
+        self._cached_headers = None
+
+    def set_encoding(self, encoding: Optional[str]) -> None:
+        """Force the encoding used for reading and writing; None or "auto" detects it."""
+        self._encoding = encoding
+        self._cached_headers = None
+
+    @property
+    def dialect(self) -> CSVDialect:
+        """The file's dialect, detected once per file version and used by every reader and writer.
+
+        Raises CSVEncodingError if the file doesn't decode with a configured encoding.
+        """
+        forced = None if self._delimiter in (None, "", AUTO_DELIMITER) else self._delimiter
+        encoding = None if self._encoding in (None, "", AUTO_ENCODING) else self._encoding
+        key = (fingerprint(self.path), forced, encoding)
+        if self._dialect is None or key != self._dialect_key:
+            try:
+                self._dialect = detect_dialect(self.path, forced, encoding)
+            except CSVEncodingError:
+                raise
+            except (OSError, ValueError) as e:
+                # Unreadable (or not yet written): readers will report the real error
+                logger.debug("Using the default CSV dialect for %s: %s", self.path, e)
+                self._dialect = CSVDialect(delimiter=forced or ",", encoding=encoding or "utf-8")
+            if self._dialect_key is not None and key != self._dialect_key:
+                self._cached_headers = None
+            self._dialect_key = key
+        return self._dialect
+
     def get_headers(self, sheet_name: str = None) -> List[str] | None:
         """
         Returns the header row of the CSV file if it exists.
-        If no header is present, returns None.
+        Files without a header row get generated names (column_1, column_2, …);
+        returns None if the file can't be found.
         """
+        dialect = self.dialect
         if self._cached_headers is None:
             try:
-                with open(self.path, newline="", encoding="utf-8") as f:
-                    sample = f.read(2048)
-                    f.seek(0)
-                    try:
-                        dialect = csv.Sniffer().sniff(sample, delimiters=self._delimiter)
-                        reader = csv.reader(f, dialect)
-                    except csv.Error:
-                        reader = csv.reader(f, delimiter=self._delimiter)
-                    headers = next(reader, None)
-                    self._cached_headers = headers
+                with open_text(self.path, encoding=dialect.encoding, errors=dialect.encoding_errors) as f:
+                    row = next(csv.reader(f, **dialect.reader_kwargs()), None)
+                if row is not None and not dialect.has_header:
+                    row = [f"column_{i + 1}" for i in range(len(row))]
+                self._cached_headers = row
             except FileNotFoundError:
                 logger.error("CSV file not found: %s", self.path)
                 self._cached_headers = None
@@ -50,10 +97,25 @@ class CSVFileInterface(BaseInterface):
 
     @classmethod
     def can_handle(cls, file_path: str) -> bool:
-        return os.path.splitext(str(file_path))[1].lower() == ".csv"
+        """Accept .csv plus compressed variants (.csv.gz, .csv.zst, …) and single-CSV zips."""
+        fmt, compression = split_compression(file_path)
+        if fmt == ".csv":
+            return True
+        return compression == "zip" and fmt == "" and zip_member(file_path) is not None
+
+    @classmethod
+    def sniff(cls, file_path: str, head: bytes) -> bool:
+        """Recognise zip archives holding a single CSV, whatever their name."""
+        return head.startswith(ZIP_MAGIC) and zip_member(file_path) is not None
+
+    @property
+    def compression(self) -> Optional[str]:
+        """Compression method inferred from the file name (e.g. 'gzip'), or None."""
+        return split_compression(self.path)[1]
 
     def __enter__(self) -> "CSVFileInterface":
-        self._file = open(self.path, mode="r", newline="", encoding="utf-8")
+        dialect = self.dialect
+        self._file = open_text(self.path, encoding=dialect.encoding, errors=dialect.encoding_errors)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> bool:
@@ -68,10 +130,21 @@ class CSVFileInterface(BaseInterface):
             return self._skip_rows_list
         return self._skip_rows
 
+    def _read_kwargs(self) -> Dict[str, Any]:
+        """``read_csv`` arguments shared by every read path: dialect and skip rows."""
+        dialect = self.dialect
+        kwargs = dialect.read_kwargs()
+        kwargs["skiprows"] = self._pandas_skiprows()
+        # With rows skipped, the first row kept is the header by definition
+        if not dialect.has_header and not self._skip_rows and not self._skip_rows_list:
+            kwargs["header"] = None
+            kwargs["names"] = self.get_headers()
+        return kwargs
+
     def load(self) -> DataFrame:
         logger.debug("Loading CSV from %s", self.path)
         try:
-            df = read_csv(self.path, skiprows=self._pandas_skiprows())
+            df = read_csv(self.path, **self._read_kwargs())
         except Exception as e:
             logger.error("Failed to load CSV: %s", e)
             raise
@@ -79,7 +152,7 @@ class CSVFileInterface(BaseInterface):
         return df
 
     def iter_load(self, chunksize: int = 1_000) -> Iterator[DataFrame]:
-        return read_csv(self.path, skiprows=self._pandas_skiprows(), chunksize=chunksize)
+        return read_csv(self.path, chunksize=chunksize, **self._read_kwargs())
 
     def iter_columns(
         self, value_count: Optional[int] = None, chunksize: int = 1_000
@@ -89,31 +162,103 @@ class CSVFileInterface(BaseInterface):
         If value_count is specified, only yield that many values per column.
         Skips bad lines to avoid parser errors.
         """
-        for chunk in read_csv(self.path, skiprows=self._pandas_skiprows(), chunksize=chunksize, on_bad_lines='skip'):
+        for chunk in read_csv(self.path, chunksize=chunksize, on_bad_lines='skip', **self._read_kwargs()):
             for col in chunk.columns:
                 col_series = chunk[col]
                 if value_count:
                     col_series = col_series.head(value_count)
                 yield col_series.to_frame()
 
-    def stream_rows(self) -> Iterator[Dict[str, Any]]:
-        for chunk in self.iter_load(chunksize=1):
-            # chunksize=1 ensures one row per chunk
-            yield chunk.iloc[0].to_dict()
+    def _record_chunks(self, columns: Optional[List[str]], chunksize: int) -> Iterator[DataFrame]:
+        kwargs = self._read_kwargs()
+        if columns is not None:
+            missing = [c for c in columns if c not in (self.get_headers() or [])]
+            if missing:
+                raise KeyError(f"Columns not in {self.path.name}: {missing}")
+            # Only parse the projected columns
+            kwargs["usecols"] = columns
+        with read_csv(self.path, chunksize=chunksize, **kwargs) as reader:
+            for chunk in reader:
+                yield chunk if columns is None else chunk[columns]
 
     def append_df(self, df: DataFrame) -> None:
-        if self._df is None:
-            # Initialize with provided df
-            self._df = df.copy()
-        else:
-            self._df = pd.concat([self._df, df], ignore_index=True)
+        # Buffered; combined into _df in one go when it's next read (e.g. on save)
+        self._append_buffer().add_frame(df)
 
     def append_list(self, data: List[Dict[str, Any]]) -> None:
-        # Convert list of dicts to DataFrame and append
-        import pandas as pd
+        self._append_buffer().add_records(data)
+
+    def row_index(self) -> Optional[RowIndex]:
+        """Byte-offset index of the file's records, or None if it can't be indexed."""
+        dialect = self.dialect
+        if not indexable(self.path, dialect.encoding, dialect.escapechar):
+            return None
+        return self.row_indexes.get(
+            self.path, dialect.quotechar, dialect.lineterminator, self.row_index_step
+        )
+
+    def _skipped_lines(self) -> List[int]:
+        """Line numbers skipped, as pandas counts lines for ``skiprows``."""
+        if self._skip_rows_list is not None:
+            return self._skip_rows_list
+        return list(range(self._skip_rows))
+
+    @staticmethod
+    def _skipped_records(index: RowIndex, lines: List[int]) -> List[int]:
+        """Records removed by skipping lines (skipping a blank line removes none)."""
+        records = (index.record_of(line) for line in lines if line < index.lines)
+        return sorted(r for r in records if r is not None)
+
+    def read_rows(self, start: int, count: int) -> DataFrame:
+        """Return data rows start..start+count-1 (after the header and skipped rows).
+
+        With a row index the read seeks close to start and parses at most one
+        index step of rows ahead of it; otherwise the rows before start are parsed.
+        Reads within the first index step never need (or build) the index.
+        """
+        start, count = max(0, int(start)), max(0, int(count))
+        kwargs = self._read_kwargs()
+        index = self.row_index() if count and start >= self.row_index_step else None
+        if index is None:
+            df = read_csv(self.path, nrows=start + count, **kwargs)
+            return df.iloc[start:].reset_index(drop=True)
 
-        new_df = pd.DataFrame(data)
-        self.append_df(new_df)
+        names = list(read_csv(self.path, nrows=0, **kwargs).columns)
+        skipped_lines = self._skipped_lines()
+        # Records are numbered over the whole file: find the one holding data row start
+        record = start + (1 if kwargs.get("header", 0) == 0 else 0)
+        for s in self._skipped_records(index, skipped_lines):
+            if s > record:
+                break
+            record += 1
+        if record >= index.records:
+            return DataFrame(columns=names)
+        offset, lead = index.seek(record)
+        # The window is parsed from the indexed record before the wanted one; pandas
+        # numbers its lines from there, so lines are skipped by their absolute number
+        first_line = index.line_of(record - lead)
+        wanted_line = index.line_of(record)
+        later_skips = {s for s in skipped_lines if s > wanted_line}
+
+        def skip(line: int) -> bool:
+            line += first_line
+            return line < wanted_line or line in later_skips
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return read_csv(
+                f, header=None, names=names, skiprows=skip if lead or later_skips else None,
+                nrows=count, **self.dialect.read_kwargs()
+            )
+
+    def count_rows(self) -> Optional[int]:
+        """Number of data rows, from the row index (None if the file can't be indexed)."""
+        index = self.row_index()
+        if index is None:
+            return None
+        skipped = self._skipped_records(index, self._skipped_lines())
+        header = 1 if self._read_kwargs().get("header", 0) == 0 else 0
+        return max(0, index.records - len(skipped) - header)
 
     def set_header_rows_to_skip(self, header_rows: int) -> None:
         self._skip_rows = max(0, int(header_rows))
@@ -124,8 +269,7 @@ class CSVFileInterface(BaseInterface):
 
     @property
     def encoding(self) -> str:
-        # We default to utf-8 for reading/writing unless overridden
-        return "utf-8"
+        return self.dialect.encoding
 
     def save(self) -> None:
         """
@@ -136,12 +280,18 @@ class CSVFileInterface(BaseInterface):
     def save_as(self, file_path: str) -> None:
         if self._df is None:
             raise RuntimeError("No DataFrame loaded to save")
-        self._df.to_csv(file_path, index=False)
+        # Written in the source's dialect; compression follows the target extension (e.g. out.csv.zst)
+        self._df.to_csv(
+            file_path,
+            index=False,
+            compression=write_compression(file_path),
+            **self.dialect.write_kwargs(),
+        )
 
     def get_schema(self) -> Dict[str, str]:
         if self._df is None:
             # Peek at first row
-            df = read_csv(self.path, skiprows=self._pandas_skiprows(), nrows=1)
+            df = read_csv(self.path, nrows=1, **self._read_kwargs())
         else:
             df = self._df
         return {str(col): str(dtype) for col, dtype in df.dtypes.items()}
@@ -155,4 +305,104 @@ class CSVFileInterface(BaseInterface):
             raise ValueError("Empty column name detected in CSV")
 
 
+class CSVStreamWriter:
+    """Constant-memory CSV output sink.
+
+    Once ``open(file_path)`` has been called, chunks are written as they
+    arrive through a text stream that compresses as the target's name says
+    (``out.csv.gz``, ``out.csv.zst`` …), into a temporary file next to the
+    target that ``save_as`` moves into place. Chunks appended before ``open``
+    are buffered and written by ``save_as``. Like ExcelStreamWriter, it can
+    only be saved once.
+    """
+
+    file_type = "csv"
+
+    def __init__(self, dialect: Optional[CSVDialect] = None) -> None:
+        self.dialect = dialect or CSVDialect()
+        self.rows_written = 0
+        # Set by callers that fall back to accumulating a frame; written on save
+        self._df: Optional[DataFrame] = None
+        self._buffered: List[DataFrame] = []
+        self._handle = None
+        self._target: Optional[Path] = None
+        self._part: Optional[Path] = None
+        self._header: Optional[List[str]] = None
+        self._saved = False
+
+    def set_delimiter(self, delimiter: Optional[str]) -> None:
+        """Write with delimiter instead of the dialect's; None or "auto" keeps it."""
+        if delimiter not in (None, "", AUTO_DELIMITER):
+            self.dialect = replace(self.dialect, delimiter=delimiter)
+
+    def set_encoding(self, encoding: Optional[str]) -> None:
+        """Write in encoding instead of the dialect's; None or "auto" keeps it."""
+        if encoding not in (None, "", AUTO_ENCODING):
+            self.dialect = replace(self.dialect, encoding=encoding)
+
+    def open(self, file_path: str) -> None:
+        """Start streaming into file_path; buffered chunks are written now."""
+        if self._handle is not None or self._saved:
+            raise RuntimeError("Output has already been opened")
+        self._target = Path(file_path)
+        self._part = self._target.with_name(
+            f".{self._target.name}.{os.getpid()}.{threading.get_ident()}.part"
+        )
+        self._handle = open_text_write(self._part, self.dialect.encoding, name=self._target)
+        buffered, self._buffered = self._buffered, []
+        for df in buffered:
+            self._write(df)
+
+    def _write(self, df: DataFrame) -> None:
+        columns = [str(c) for c in df.columns]
+        first = self._header is None
+        if first:
+            self._header = columns
+        elif columns != self._header:
+            df = df.set_axis(columns, axis=1).reindex(columns=self._header)
+        kwargs = self.dialect.write_kwargs()
+        # The stream does the encoding
+        kwargs.pop("encoding")
+        df.to_csv(self._handle, index=False, header=first, **kwargs)
+        self.rows_written += len(df)
+
+    def append_df(self, df: DataFrame) -> None:
+        if self._saved:
+            raise RuntimeError("Output has already been saved")
+        if self._handle is None:
+            self._buffered.append(df)
+        else:
+            self._write(df)
+
+    def append_list(self, data: List[Dict[str, Any]]) -> None:
+        self.append_df(DataFrame(data))
+
+    def save_as(self, file_path: str) -> None:
+        if self._saved:
+            raise RuntimeError("Output has already been saved")
+        if self._handle is None:
+            self.open(file_path)
+        if self._df is not None:
+            df, self._df = self._df, None
+            self._write(df)
+        handle, self._handle = self._handle, None
+        handle.close()
+        os.replace(self._part, file_path)
+        self._saved = True
+
+    def discard(self) -> None:
+        """Drop a partially written output (e.g. after a failed run)."""
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:
+                pass
+        if self._part is not None and not self._saved:
+            try:
+                self._part.unlink()
+            except OSError:
+                pass
+
+
 FileInterfaceFactory.register(CSVFileInterface)
\ No newline at end of file
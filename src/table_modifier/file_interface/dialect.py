@@ -0,0 +1,306 @@
+"""CSV dialect detection shared by every CSV read and write path.
+
+A file's dialect — delimiter, quoting, escaping, header presence, encoding and
+line terminator — is detected once from a sample of its (decompressed) start
+and cached by path and fingerprint, so the headers shown for mapping and the
+rows later read by the engine are always parsed the same way.
+
+Encodings are told apart by byte-order mark, then byte statistics over the
+first megabyte: valid UTF-8, NUL-heavy UTF-16, else cp1252 (latin-1 if bytes
+undefined in cp1252 occur). A configured encoding is checked against the same
+sample, so a wrong choice fails before parsing starts rather than minutes in.
+"""
+
+import codecs
+import csv
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.table_modifier.file_interface.compression import open_binary
+from src.table_modifier.file_interface.utils import Fingerprint, fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bytes sampled from the start of a file for dialect sniffing
+SAMPLE_BYTES = 64 * 1024
+# Bytes checked when detecting or validating the encoding
+ENCODING_SAMPLE_BYTES = 1024 * 1024
+# Delimiters considered when none is configured
+CANDIDATE_DELIMITERS = ",;\t|"
+# Detected dialects kept in memory (most recently used)
+MAX_CACHED_DIALECTS = 256
+
+# Longest BOMs first: the UTF-32 LE BOM starts with the UTF-16 LE one
+_BOMS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Bytes with no character assigned in cp1252
+_CP1252_UNDEFINED = frozenset(b"\x81\x8d\x8f\x90\x9d")
+# Share of NUL bytes in alternate positions that marks BOM-less UTF-16
+_UTF16_NUL_RATIO = 0.3
+
+# Decode error handler for files sampled as UTF-8: stray legacy bytes further
+# in (e.g. one "Malmö" written by a cp1252 export) decode as cp1252.
+CP1252_FALLBACK = "table_modifier.cp1252_fallback"
+
+
+def _cp1252_fallback(error: UnicodeError) -> Tuple[str, int]:
+    if not isinstance(error, UnicodeDecodeError):
+        raise error
+    return error.object[error.start:error.end].decode("cp1252", errors="replace"), error.end
+
+
+codecs.register_error(CP1252_FALLBACK, _cp1252_fallback)
+
+
+class CSVEncodingError(ValueError):
+    """The file does not decode with the configured encoding."""
+
+
+_NUMBER = re.compile(r"^[+-]?(\d+([.,]\d*)?|[.,]\d+)([eE][+-]?\d+)?$")
+
+
+@dataclass(frozen=True)
+class CSVDialect:
+    delimiter: str = ","
+    quotechar: str = '"'
+    escapechar: Optional[str] = None
+    doublequote: bool = True
+    has_header: bool = True
+    encoding: str = "utf-8"
+    lineterminator: str = "\n"
+    # Decode error handler used while reading (see CP1252_FALLBACK)
+    encoding_errors: str = "strict"
+
+    def reader_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for ``csv.reader``."""
+        return {
+            "delimiter": self.delimiter,
+            "quotechar": self.quotechar,
+            "escapechar": self.escapechar,
+            "doublequote": self.doublequote,
+        }
+
+    def read_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for ``pandas.read_csv`` (line endings are handled by the parser)."""
+        return {
+            "sep": self.delimiter,
+            "quotechar": self.quotechar,
+            "escapechar": self.escapechar,
+            "doublequote": self.doublequote,
+            "encoding": self.encoding,
+            "encoding_errors": self.encoding_errors,
+        }
+
+    def write_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for ``DataFrame.to_csv``, writing the file back in the same dialect."""
+        return {
+            "sep": self.delimiter,
+            "quotechar": self.quotechar,
+            "escapechar": self.escapechar,
+            "doublequote": self.doublequote,
+            "encoding": self.encoding,
+            "lineterminator": self.lineterminator,
+        }
+
+
+def _decodes(head: bytes, encoding: str, truncated: bool) -> Optional[UnicodeDecodeError]:
+    """Return the error decoding head strictly, if any (a cut-off final character is fine)."""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(head, final=not truncated)
+    except UnicodeDecodeError as e:
+        return e
+    return None
+
+
+def detect_encoding(head: bytes, truncated: bool = False) -> str:
+    """Guess the encoding of a sample from its BOM or byte statistics."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    # Checked first: ASCII text in UTF-16 is also valid UTF-8
+    probe = head[:4096]
+    half = max(1, len(probe) // 2)
+    if probe[1::2].count(0) / half > _UTF16_NUL_RATIO:
+        return "utf-16-le"
+    if probe[0::2].count(0) / half > _UTF16_NUL_RATIO:
+        return "utf-16-be"
+    if _decodes(head, "utf-8", truncated) is None:
+        return "utf-8"
+    if _CP1252_UNDEFINED.intersection(head):
+        return "latin-1"
+    return "cp1252"
+
+
+def check_encoding(head: bytes, encoding: str, truncated: bool = False) -> None:
+    """Raise CSVEncodingError if the sample doesn't decode as encoding."""
+    try:
+        error = _decodes(head, encoding, truncated)
+    except LookupError as e:
+        raise CSVEncodingError(f"Unknown encoding: {encoding}") from e
+    if error is not None:
+        raise CSVEncodingError(
+            f"Not valid {encoding} at byte {error.start}; try another CSV encoding"
+        ) from error
+
+
+def _line_terminator(text: str) -> str:
+    i = text.find("\n")
+    j = text.find("\r")
+    if j != -1 and (i == -1 or j < i):
+        return "\r\n" if text.startswith("\r\n", j) else "\r"
+    return "\n"
+
+
+def _complete_lines(text: str, truncated: bool) -> str:
+    """Drop a trailing partial line so the sniffer only sees whole records."""
+    if not truncated:
+        return text
+    cut = max(text.rfind("\n"), text.rfind("\r"))
+    return text[:cut + 1] if cut > 0 else text
+
+
+def _guess_delimiter(text: str, candidates: str) -> str:
+    """Fallback when the sniffer gives up: the candidate most used on the first line."""
+    first = text.splitlines()[0] if text else ""
+    counts = {d: first.count(d) for d in candidates}
+    best = max(counts, key=lambda d: counts[d]) if counts else ","
+    return best if counts.get(best) else (candidates[0] if len(candidates) == 1 else ",")
+
+
+def _looks_like_data(row: Optional[list]) -> bool:
+    """A first row made only of numbers is data, not a header.
+
+    Deliberately conservative: text headers over text columns are common and
+    a header-less file is far rarer than a misdetected one.
+    """
+    if not row:
+        return False
+    return all(_NUMBER.match(field.strip()) for field in row)
+
+
+def sniff_dialect(
+    head: bytes,
+    truncated: bool = False,
+    delimiter: Optional[str] = None,
+    encoding: Optional[str] = None,
+) -> CSVDialect:
+    """Detect the dialect of a sample of raw (decompressed) bytes.
+
+    A given delimiter or encoding is used as-is (the encoding is checked against
+    the whole sample); the rest of the dialect is still detected.
+    """
+    if encoding:
+        check_encoding(head, encoding, truncated)
+        errors = "strict"
+    else:
+        encoding = detect_encoding(head, truncated)
+        # Only the sample was seen; don't let a stray legacy byte later on fail the read
+        errors = CP1252_FALLBACK if encoding in ("utf-8", "utf-8-sig") else "strict"
+    if len(head) > SAMPLE_BYTES:
+        head, truncated = head[:SAMPLE_BYTES], True
+    # The BOM-aware codecs drop the mark while decoding
+    text = head.decode(encoding, errors="replace")
+    lineterminator = _line_terminator(text)
+    sample = _complete_lines(text, truncated)
+    if not sample.strip():
+        return CSVDialect(
+            delimiter=delimiter or ",",
+            encoding=encoding,
+            lineterminator=lineterminator,
+            encoding_errors=errors,
+        )
+
+    candidates = delimiter or CANDIDATE_DELIMITERS
+    quotechar = '"'
+    try:
+        sniffed = csv.Sniffer().sniff(sample, delimiters=candidates)
+        found, quotechar = sniffed.delimiter, sniffed.quotechar or '"'
+    except csv.Error:
+        found = _guess_delimiter(sample, candidates)
+    delimiter = delimiter or found
+
+    escapechar = "\\" if "\\" + quotechar in sample else None
+    doublequote = escapechar is None or quotechar * 2 in sample
+    first = next(
+        csv.reader(
+            sample.splitlines()[:1],
+            delimiter=delimiter,
+            quotechar=quotechar,
+            escapechar=escapechar,
+            doublequote=doublequote,
+        ),
+        None,
+    )
+    return CSVDialect(
+        delimiter=delimiter,
+        quotechar=quotechar,
+        escapechar=escapechar,
+        doublequote=doublequote,
+        has_header=not _looks_like_data(first),
+        encoding=encoding,
+        lineterminator=lineterminator,
+        encoding_errors=errors,
+    )
+
+
+def read_sample(path: str | Path, size: int = ENCODING_SAMPLE_BYTES) -> Tuple[bytes, bool]:
+    """Return (first size decompressed bytes, whether the file continues past them)."""
+    parts = []
+    remaining = size + 1
+    with open_binary(path) as f:
+        # Decompressing readers may return short reads before the end
+        while remaining > 0:
+            part = f.read(remaining)
+            if not part:
+                break
+            parts.append(part)
+            remaining -= len(part)
+    head = b"".join(parts)
+    return head[:size], len(head) > size
+
+
+_cache: "OrderedDict[Tuple[str, Fingerprint, Optional[str], Optional[str]], CSVDialect]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def detect_dialect(
+    path: str | Path, delimiter: Optional[str] = None, encoding: Optional[str] = None
+) -> CSVDialect:
+    """Return the dialect of the CSV file at path, detecting it at most once per file version.
+
+    Raises FileNotFoundError (or another OSError) if the file can't be read and
+    CSVEncodingError if it doesn't decode with the given encoding.
+    """
+    fp = fingerprint(path)
+    if fp is None:
+        raise FileNotFoundError(f"CSV file not found: {path}")
+    key = (str(Path(path)), fp, delimiter, encoding)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+    head, truncated = read_sample(path)
+    dialect = sniff_dialect(head, truncated, delimiter, encoding)
+    logger.debug("Detected CSV dialect for %s: %s", path, dialect)
+    with _cache_lock:
+        _cache[key] = dialect
+        while len(_cache) > MAX_CACHED_DIALECTS:
+            _cache.popitem(last=False)
+    return dialect
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
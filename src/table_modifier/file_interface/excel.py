@@ -1,15 +1,78 @@
+import importlib.util
 import os
+import zipfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Dict, Any, Optional, List
+from typing import ClassVar, Iterator, Dict, Any, Optional, List
 import pandas as pd
 
 from .base import BaseInterface
 from .utils import FilePath
 from .factory import FileInterfaceFactory
+from .formats import EXCEL_EXTENSIONS, OLE2_MAGIC, ZIP_MAGIC
+
+try:
+    import openpyxl  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    openpyxl = None
+
+# Rows per worksheet, including the header row
+EXCEL_MAX_ROWS = 1_048_576
+
+# pandas reader engines, fastest first, with the module providing each
+EXCEL_ENGINES: Dict[str, str] = {
+    "calamine": "python_calamine",
+    "openpyxl": "openpyxl",
+    "xlrd": "xlrd",
+}
+ENGINE_SUFFIXES: Dict[str, tuple] = {
+    "calamine": (".xls", ".xlsx", ".xlsm", ".xlsb", ".ods"),
+    "openpyxl": (".xlsx", ".xlsm"),
+    "xlrd": (".xls",),
+}
+# calamine parses a whole sheet even when only the header is wanted, while
+# openpyxl's read-only reader streams; above this size partial reads use openpyxl
+# (see benchmarks/bench_excel.py)
+PARTIAL_READ_STREAMING_MIN_BYTES = 256 * 1024
+
+
+@lru_cache(maxsize=None)
+def engine_available(engine: str) -> bool:
+    module = EXCEL_ENGINES.get(engine)
+    return module is not None and importlib.util.find_spec(module) is not None
+
+
+def select_engine(file_path: FilePath, preferred: Optional[str] = None, partial: bool = False) -> Optional[str]:
+    """Pick the pandas engine for reading file_path.
+
+    An installed preferred engine that supports the file type wins. Otherwise
+    calamine is used when installed, except for partial reads (headers, schema)
+    of large .xlsx files, which openpyxl streams. Returns None to
+    leave the choice to pandas (openpyxl for .xlsx, xlrd for .xls).
+    """
+    suffix = Path(str(file_path)).suffix.lower()
+    if preferred and preferred != "auto":
+        if suffix in ENGINE_SUFFIXES.get(preferred, ()) and engine_available(preferred):
+            return preferred
+    if partial and suffix in ENGINE_SUFFIXES["openpyxl"] and engine_available("openpyxl"):
+        try:
+            large = os.path.getsize(file_path) >= PARTIAL_READ_STREAMING_MIN_BYTES
+        except OSError:
+            large = False
+        if large:
+            return "openpyxl"
+    if suffix in ENGINE_SUFFIXES["calamine"] and engine_available("calamine"):
+        return "calamine"
+    return None
 
 
 class ExcelFileInterface(BaseInterface):
     file_type = "excel"
+    # Workbook parsing is slow; allow a columnar sidecar cache
+    supports_parse_cache = True
+    extensions = EXCEL_EXTENSIONS
+    # Reader engine for all instances ("auto" or None: see select_engine)
+    default_engine: ClassVar[Optional[str]] = None
 
     def __init__(self, file_path: FilePath, sheet_name: Optional[str] = None):
         """
@@ -21,6 +84,21 @@ class ExcelFileInterface(BaseInterface):
         self._df: Optional[pd.DataFrame] = None
         self._skip_rows: int = 0
         self._skip_rows_list: Optional[List[int]] = None
+        # Overrides default_engine for this instance
+        self.engine_preference: Optional[str] = None
+
+    @classmethod
+    def set_default_engine(cls, engine: Optional[str]) -> None:
+        cls.default_engine = None if engine in (None, "", "auto") else engine
+
+    def _engine(self, partial: bool = False) -> Dict[str, Any]:
+        """pandas ``engine=`` keyword for a read (empty to use pandas' default)."""
+        engine = select_engine(self.path, self.engine_preference or self.default_engine, partial)
+        return {"engine": engine} if engine else {}
+
+    def _excel_file(self) -> pd.ExcelFile:
+        # Only used for sheet names, which every engine reads without parsing sheets
+        return pd.ExcelFile(self.path, **self._engine())
 
     def get_headers(self, sheet_name: str = None) -> Optional[list[str]]:
         """
@@ -29,31 +107,59 @@ class ExcelFileInterface(BaseInterface):
         """
         self._ensure_sheet()
         sheet: int | str = sheet_name or self.sheet_name or 0
-        df = pd.read_excel(self.path, sheet_name=sheet, nrows=0, skiprows=self._skip_for_pandas())
+        cached = self._cached_schema(sheet)
+        if cached is not None:
+            return list(cached.columns)
+        df = pd.read_excel(
+            self.path, sheet_name=sheet, nrows=0, skiprows=self._skip_for_pandas(), **self._engine(partial=True)
+        )
         return list(df.columns)
 
     @classmethod
     def can_handle(cls, file_path: str) -> bool:
         ext = os.path.splitext(str(file_path))[1].lower()
-        return ext in (".xls", ".xlsx")
+        return ext in cls.extensions
+
+    @classmethod
+    def sniff(cls, file_path: str, head: bytes) -> bool:
+        """Recognise legacy OLE2 workbooks and OOXML (zip) workbooks by content."""
+        if head.startswith(OLE2_MAGIC):
+            return True
+        if not head.startswith(ZIP_MAGIC):
+            return False
+        try:
+            with zipfile.ZipFile(file_path) as zf:
+                return "xl/workbook.xml" in zf.namelist()
+        except (OSError, zipfile.BadZipFile):
+            return False
 
     def _ensure_sheet(self) -> None:
         # Lazily load ExcelFile to pick a default sheet
         if self.sheet_name is None:
-            xls = pd.ExcelFile(self.path)
+            xls = self._excel_file()
             self.sheet_name = xls.sheet_names[0]
 
     def _skip_for_pandas(self):
         return self._skip_rows_list if self._skip_rows_list is not None else self._skip_rows
 
+    def _sheet_cache_key(self, sheet: int | str) -> Optional[str]:
+        # Engines differ in dtypes and date handling, so frames are kept per engine
+        return self._cache_key(sheet, self._skip_for_pandas(), self._engine().get("engine"))
+
+    def _cached_schema(self, sheet: int | str) -> Optional[pd.DataFrame]:
+        key = self._sheet_cache_key(sheet)
+        return self.parse_cache.schema(key) if key else None
+
     def append_df(self, df: pd.DataFrame) -> None:
-        # Ensure loaded DataFrame for the active sheet
-        base = self._df if self._df is not None else self.load()
-        self._df = pd.concat([base, df], ignore_index=True)
+        # Ensure loaded DataFrame for the active sheet; appends are buffered until read
+        if self._frame is None and not self._pending:
+            self.load()
+        self._append_buffer().add_frame(df)
 
     def append_list(self, data: List[Dict[str, Any]]) -> None:
-        new_df = pd.DataFrame(data)
-        self.append_df(new_df)
+        if self._frame is None and not self._pending:
+            self.load()
+        self._append_buffer().add_records(data)
 
     @property
     def encoding(self) -> str:
@@ -64,11 +170,24 @@ class ExcelFileInterface(BaseInterface):
         # Eager read entire sheet
         self._ensure_sheet()
         sheet: int | str = self.sheet_name or 0
-        df = pd.read_excel(self.path, sheet_name=sheet, skiprows=self._skip_for_pandas())
+        key = self._sheet_cache_key(sheet)
+        df = self.parse_cache.get(key) if key else None
+        if df is None:
+            df = pd.read_excel(self.path, sheet_name=sheet, skiprows=self._skip_for_pandas(), **self._engine())
+            if key:
+                self.parse_cache.put(key, df)
         self._df = df
         return self._df
 
     def iter_load(self, chunksize: int = 1_000) -> Iterator[pd.DataFrame]:
+        if self._df is None:
+            # Stream from the sidecar when cached instead of materializing the sheet
+            self._ensure_sheet()
+            key = self._sheet_cache_key(self.sheet_name or 0)
+            batches = self.parse_cache.iter_batches(key, chunksize) if key else None
+            if batches is not None:
+                yield from batches
+                return
         # Ensure we have a DataFrame
         df = self._df if self._df is not None else self.load()
         for start in range(0, len(df), chunksize):
@@ -79,6 +198,20 @@ class ExcelFileInterface(BaseInterface):
         Iterate over columns in chunks.
         If value_count is specified, yield only that many values per column.
         """
+        if self._df is None:
+            # Read one column at a time from the sidecar when cached
+            self._ensure_sheet()
+            key = self._sheet_cache_key(self.sheet_name or 0)
+            cached = self.parse_cache.schema(key) if key else None
+            if cached is not None:
+                for col in cached.columns:
+                    part = self.parse_cache.get(key, columns=[col])
+                    col_data = (part if part is not None else self.load())[col]
+                    if value_count is not None:
+                        col_data = col_data.head(value_count)
+                    for start in range(0, len(col_data), chunksize):
+                        yield pd.DataFrame({col: col_data.iloc[start : start + chunksize]})
+                return
         df = self._df if self._df is not None else self.load()
         for col in df.columns:
             col_data = df[col]
@@ -87,9 +220,28 @@ class ExcelFileInterface(BaseInterface):
             for start in range(0, len(col_data), chunksize):
                 yield pd.DataFrame({col: col_data.iloc[start : start + chunksize]})
 
-    def stream_rows(self) -> Iterator[Dict[str, Any]]:
-        for chunk in self.iter_load(chunksize=1):
-            yield chunk.iloc[0].to_dict()
+    def read_rows(self, start: int, count: int) -> pd.DataFrame:
+        # Sheets are read whole anyway; slice the loaded (or sidecar-cached) frame
+        df = self._df if self._df is not None else self.load()
+        return df.iloc[max(0, start):max(0, start) + max(0, count)].reset_index(drop=True)
+
+    def read_head(self, count: int) -> pd.DataFrame:
+        # A sample should not parse the whole sheet unless it is already at hand
+        count = max(0, int(count))
+        if self._df is not None:
+            return self._df.head(count).reset_index(drop=True)
+        self._ensure_sheet()
+        sheet: int | str = self.sheet_name or 0
+        key = self._sheet_cache_key(sheet)
+        cached = self.parse_cache.get(key) if key else None
+        if cached is not None:
+            return cached.head(count).reset_index(drop=True)
+        return pd.read_excel(
+            self.path, sheet_name=sheet, nrows=count, skiprows=self._skip_for_pandas(), **self._engine(partial=True)
+        )
+
+    def count_rows(self) -> Optional[int]:
+        return len(self._df if self._df is not None else self.load())
 
     def save(self) -> None:
         self.save_as(self.path.as_posix())
@@ -105,13 +257,18 @@ class ExcelFileInterface(BaseInterface):
         # Peek at first row if not already loaded
         if self._df is None:
             sheet: int | str = self.sheet_name or 0
-            df = pd.read_excel(self.path, sheet_name=sheet, skiprows=self._skip_for_pandas(), nrows=1)
+            cached = self._cached_schema(sheet)
+            if cached is not None:
+                return {str(col): str(dtype) for col, dtype in cached.dtypes.items()}
+            df = pd.read_excel(
+                self.path, sheet_name=sheet, skiprows=self._skip_for_pandas(), nrows=1, **self._engine(partial=True)
+            )
         else:
             df = self._df
         return {str(col): str(dtype) for col, dtype in df.dtypes.items()}
 
     def load_metadata(self) -> Dict[str, Any]:
-        xls = pd.ExcelFile(self.path)
+        xls = self._excel_file()
         return {
             "sheet_names": xls.sheet_names,
             "engine": xls.engine,
@@ -128,15 +285,90 @@ class ExcelFileInterface(BaseInterface):
         """
         Return a list of sheet names in the Excel file.
         """
-        xls = pd.ExcelFile(self.path)
+        xls = self._excel_file()
         return xls.sheet_names
 
     def set_header_rows_to_skip(self, header_rows: int) -> None:
-        self._skip_rows = max(0, int(header_rows))
-        self._skip_rows_list = None
+        self._set_skips(max(0, int(header_rows)), None)
 
     def set_rows_to_skip(self, rows: List[int]) -> None:
-        self._skip_rows_list = sorted(set(int(r) for r in rows if int(r) >= 0))
+        self._set_skips(self._skip_rows, sorted(set(int(r) for r in rows if int(r) >= 0)))
+
+    def _set_skips(self, skip_rows: int, skip_rows_list: Optional[List[int]]) -> None:
+        if (skip_rows, skip_rows_list) == (self._skip_rows, self._skip_rows_list):
+            return
+        self._skip_rows, self._skip_rows_list = skip_rows, skip_rows_list
+        # A loaded sheet was read with the old skips; read it again when next needed
+        self._df = None
+
+
+
+class ExcelStreamWriter:
+    """Constant-memory Excel output sink.
+
+    Rows are streamed into a write-only openpyxl workbook as chunks arrive,
+    instead of accumulating a DataFrame. Once a sheet reaches ``max_rows``
+    (Excel's limit by default) writing continues on a new sheet named
+    ``<sheet>_2``, ``<sheet>_3`` … with the header repeated. The workbook is
+    written out by ``save_as`` and can only be saved once.
+    """
+
+    file_type = "excel"
+
+    def __init__(self, sheet_name: Optional[str] = None, max_rows: int = EXCEL_MAX_ROWS):
+        if openpyxl is None:  # pragma: no cover - optional dependency
+            raise RuntimeError("Writing Excel files requires the 'openpyxl' package")
+        # Excel limits sheet titles to 31 characters; leave room for a "_N" suffix
+        self.sheet_name = (sheet_name or "Sheet1")[:27]
+        self.max_rows = max(2, int(max_rows))
+        self.rows_written = 0
+        self.sheet_names: List[str] = []
+        # Set by callers that fall back to accumulating a frame; written on save
+        self._df: Optional[pd.DataFrame] = None
+        self._workbook = openpyxl.Workbook(write_only=True)
+        self._sheet = None
+        self._sheet_rows = 0
+        self._header: Optional[List[str]] = None
+        self._saved = False
+
+    def _new_sheet(self) -> None:
+        n = len(self.sheet_names) + 1
+        title = self.sheet_name if n == 1 else f"{self.sheet_name}_{n}"
+        self._sheet = self._workbook.create_sheet(title)
+        self.sheet_names.append(title)
+        self._sheet.append(self._header)
+        self._sheet_rows = 1
+
+    def append_df(self, df: pd.DataFrame) -> None:
+        if self._saved:
+            raise RuntimeError("Workbook has already been saved")
+        if self._header is None:
+            self._header = [str(c) for c in df.columns]
+            self._new_sheet()
+        elif [str(c) for c in df.columns] != self._header:
+            df = df.set_axis([str(c) for c in df.columns], axis=1).reindex(columns=self._header)
+        # Missing values become empty cells
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if self._sheet_rows >= self.max_rows:
+                self._new_sheet()
+            self._sheet.append(row)
+            self._sheet_rows += 1
+            self.rows_written += 1
+
+    def append_list(self, data: List[Dict[str, Any]]) -> None:
+        self.append_df(pd.DataFrame(data))
+
+    def save_as(self, file_path: str) -> None:
+        if self._df is not None:
+            df, self._df = self._df, None
+            self.append_df(df)
+        if self._header is None:
+            # Nothing written: still produce a valid workbook with one empty sheet
+            self._workbook.create_sheet(self.sheet_name)
+            self.sheet_names.append(self.sheet_name)
+        self._workbook.save(file_path)
+        self._saved = True
 
 
 FileInterfaceFactory.register(ExcelFileInterface)
\ No newline at end of file
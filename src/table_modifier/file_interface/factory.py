@@ -1,38 +1,197 @@
+import importlib
 import threading
-from typing import Type, List, Dict, Any
+from pathlib import PurePath
+from types import MappingProxyType
+from typing import (
+    Iterable, Type, List, Dict, Any, FrozenSet, Mapping, Optional, Tuple, TYPE_CHECKING
+)
 
 from src.table_modifier.file_interface.protocol import FileInterfaceProtocol
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.table_modifier.file_interface.cache import ParseCache
+
+# Bytes read from a file when sniffing its content
+SNIFF_BYTES = 8
+
+_Index = Tuple[Optional[list], Mapping[str, Tuple[type, ...]], Tuple[type, ...]]
+
+
+def _read_head(file_path: str, size: int = SNIFF_BYTES) -> bytes:
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(size)
+    except OSError:
+        return b""
+
 
 class FileInterfaceFactory:
     """
     Holds a registry of handlers; new formats can register themselves
-    by subclassing FileInterfaceProtocol and appending to ._handlers.
+    by subclassing FileInterfaceProtocol and calling register().
+
+    Handlers declaring ``extensions`` are indexed by suffix, so a lookup costs
+    one dict access plus the matching handler's ``can_handle``; handlers
+    without extensions are probed in registration order afterwards. The index
+    is an immutable snapshot replaced on registration, so lookups take no lock.
+    With ``sniff=True``, files whose suffix is unknown or claimed by several
+    handlers are resolved from their first bytes via the handlers' ``sniff``.
+
+    When a parse cache is configured, interfaces created for handlers that
+    declare ``supports_parse_cache = True`` are wired to it transparently.
+
+    Built-in handlers are registered lazily by file suffix ("module:Class"), so
+    their implementation (and pandas) is only imported once a matching file is
+    opened. A lazy handler may also declare the magic bytes it sniffs for; when
+    sniffing a path no suffix matches, only handlers whose signatures match the
+    file's first bytes are imported, so unrelated files never load pandas.
     """
 
     _handlers: list[Type[FileInterfaceProtocol]] = []
     _handler_lock: threading.Lock = threading.Lock()
+    _parse_cache: Optional["ParseCache"] = None
+    # suffix -> ["module:Class", ...]
+    _lazy_handlers: Dict[str, List[str]] = {}
+    # "module:Class" -> magic byte prefixes its sniff() can recognise
+    _lazy_signatures: Dict[str, Tuple[bytes, ...]] = {}
+    _loaded_lazy: FrozenSet[str] = frozenset()
+    # (handler list the index was built from, suffix -> handlers, probe-only handlers)
+    _index: _Index = (None, MappingProxyType({}), ())
 
     @classmethod
     def register(cls, handler: type) -> None:
-        cls._handlers.append(handler)  # type: ignore[list-item]
+        with cls._handler_lock:
+            if handler not in cls._handlers:
+                # Copy-on-write: lookups iterate the previous list undisturbed
+                cls._handlers = [*cls._handlers, handler]  # type: ignore[list-item]
 
     @classmethod
-    def can_handle(cls, file_path: str) -> bool:
+    def register_lazy(
+        cls, target: str, suffixes: Iterable[str], signatures: Iterable[bytes] = ()
+    ) -> None:
+        """Register "module:Class" for the given suffixes without importing it.
+
+        ``signatures`` are the leading bytes of files the handler's ``sniff``
+        may accept under any name; they decide whether sniffing imports it.
+        """
         with cls._handler_lock:
-            if not cls._handlers:
-                raise RuntimeError("No file handlers registered")
-            return any(handler.can_handle(file_path) for handler in cls._handlers)
+            lazy = {k: list(v) for k, v in cls._lazy_handlers.items()}
+            for suffix in suffixes:
+                targets = lazy.setdefault(suffix.lower(), [])
+                if target not in targets:
+                    targets.append(target)
+            cls._lazy_handlers = lazy
+            signatures = tuple(signatures)
+            if signatures:
+                cls._lazy_signatures = {**cls._lazy_signatures, target: signatures}
 
     @classmethod
-    def create(cls, file_path: str) -> FileInterfaceProtocol:
+    def _load_lazy(cls, file_path: str, head: Optional[bytes] = None) -> bool:
+        """Import lazy handlers registered for file_path's suffix.
+
+        With ``head``, import those whose signatures match it instead.
+        Returns True if any handler was newly loaded.
+        """
+        if head is None:
+            suffix = PurePath(str(file_path)).suffix.lower()
+            wanted = list(cls._lazy_handlers.get(suffix, ()))
+        else:
+            wanted = [
+                target for target, signatures in cls._lazy_signatures.items()
+                if head.startswith(signatures)
+            ]
+        pending = [t for t in dict.fromkeys(wanted) if t not in cls._loaded_lazy]
+        if not pending:
+            return False
+        # Import outside the lock: handler modules register themselves on import
+        for target in pending:
+            module_name, _, attr = target.partition(":")
+            cls.register(getattr(importlib.import_module(module_name), attr))
         with cls._handler_lock:
-            if not cls._handlers:
-                raise RuntimeError("No file handlers registered")
-            for handler in cls._handlers:
+            cls._loaded_lazy = cls._loaded_lazy | frozenset(pending)
+        return True
+
+    @classmethod
+    def _snapshot(cls) -> _Index:
+        index = cls._index
+        handlers = cls._handlers
+        if index[0] is handlers:
+            return index
+        by_suffix: Dict[str, List[type]] = {}
+        probe: List[type] = []
+        for handler in handlers:
+            extensions = getattr(handler, "extensions", ())
+            for ext in extensions:
+                by_suffix.setdefault(ext.lower(), []).append(handler)
+            if not extensions:
+                probe.append(handler)
+        index = (
+            handlers,
+            MappingProxyType({k: tuple(v) for k, v in by_suffix.items()}),
+            tuple(probe),
+        )
+        cls._index = index
+        return index
+
+    @classmethod
+    def _find_handler(cls, file_path: str, sniff: bool = False) -> Optional[type]:
+        """Return the handler for file_path, or None if no handler accepts it."""
+        cls._load_lazy(file_path)
+        if not cls._handlers and not cls._lazy_handlers:
+            raise RuntimeError("No file handlers registered")
+        while True:
+            handlers, by_suffix, probe = cls._snapshot()
+            suffix = PurePath(str(file_path)).suffix.lower()
+            matched = [h for h in by_suffix.get(suffix, ()) if h.can_handle(file_path)]
+            if len(matched) > 1 and sniff:
+                head = _read_head(file_path)
+                matched = [h for h in matched if cls._sniffs(h, file_path, head)] or matched
+            if matched:
+                return matched[0]
+            for handler in probe:
                 if handler.can_handle(file_path):
-                    return handler(file_path)
-        raise ValueError(f"No handler for {file_path!r}")
+                    return handler
+            if not sniff:
+                return None
+            head = _read_head(file_path)
+            if not head:
+                return None
+            for handler in handlers:
+                if cls._sniffs(handler, file_path, head):
+                    return handler
+            # Lazy handlers registered for other suffixes may still recognise the content
+            if not cls._load_lazy(file_path, head):
+                return None
+
+    @staticmethod
+    def _sniffs(handler: type, file_path: str, head: bytes) -> bool:
+        sniffer = getattr(handler, "sniff", None)
+        if sniffer is None:
+            return False
+        try:
+            return bool(sniffer(file_path, head))
+        except Exception:
+            return False
+
+    @classmethod
+    def set_parse_cache(cls, cache: Optional["ParseCache"]) -> None:
+        """Configure (or disable with None) the parse cache used by created interfaces."""
+        cls._parse_cache = cache
+
+    @classmethod
+    def can_handle(cls, file_path: str, sniff: bool = False) -> bool:
+        """Return True if a handler accepts file_path (by name; by content if sniff)."""
+        return cls._find_handler(file_path, sniff=sniff) is not None
+
+    @classmethod
+    def create(cls, file_path: str, sniff: bool = True) -> FileInterfaceProtocol:
+        handler = cls._find_handler(file_path, sniff=sniff)
+        if handler is None:
+            raise ValueError(f"No handler for {file_path!r}")
+        iface = handler(file_path)
+        if cls._parse_cache is not None and getattr(handler, "supports_parse_cache", False):
+            iface.parse_cache = cls._parse_cache  # type: ignore[attr-defined]
+        return iface
 
 
 def _looks_like_interface(obj: object) -> bool:
@@ -0,0 +1,16 @@
+"""Suffixes and magic bytes of the built-in handlers.
+
+Kept free of heavy imports so the package can register handlers lazily
+without loading them.
+"""
+
+from typing import Tuple
+
+CSV_EXTENSIONS: Tuple[str, ...] = (".csv", ".gz", ".bz2", ".xz", ".zst", ".zip")
+EXCEL_EXTENSIONS: Tuple[str, ...] = (".xls", ".xlsx")
+
+ZIP_MAGIC = b"PK\x03\x04"
+OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+# Leading bytes the handlers' sniff() recognises under any file name
+CSV_SIGNATURES: Tuple[bytes, ...] = (ZIP_MAGIC,)
+EXCEL_SIGNATURES: Tuple[bytes, ...] = (OLE2_MAGIC, ZIP_MAGIC)
@@ -0,0 +1,101 @@
+"""Page-wise access to the rows of a file interface, for data viewers.
+
+Rows are read ``page_size`` at a time with the interface's ``read_rows`` (which
+seeks for indexed CSVs) and kept in a small LRU cache, so browsing even a very
+large file holds at most ``max_pages`` pages in memory. An optional transform
+(e.g. the column mapping) is applied per page.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_MAX_PAGES = 40
+
+
+class RowPager:
+    """LRU cache of row pages read from iface."""
+
+    def __init__(
+        self,
+        iface: Any,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ) -> None:
+        self.iface = iface
+        self.page_size = max(1, int(page_size))
+        self.max_pages = max(1, int(max_pages))
+        self.transform = transform
+        self._pages: "OrderedDict[int, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._columns: Optional[List[str]] = None
+        self._total: Optional[int] = None
+        self._total_checked = False
+        # Rows known to exist, and whether the end of the data has been seen
+        self.rows_seen = 0
+        self.exhausted = False
+
+    def total_rows(self) -> Optional[int]:
+        """Row count if the interface can tell without reading everything, else None."""
+        if not self._total_checked:
+            count_rows = getattr(self.iface, "count_rows", None)
+            try:
+                self._total = count_rows() if count_rows is not None else None
+            except Exception as e:
+                logger.debug("Could not count rows of %s: %s", getattr(self.iface, "path", self.iface), e)
+                self._total = None
+            self._total_checked = True
+        return self._total
+
+    def columns(self) -> List[str]:
+        if self._columns is None:
+            self._columns = [str(c) for c in self.page(0).columns]
+        return self._columns
+
+    def page(self, number: int) -> pd.DataFrame:
+        """Return page number (rows number*page_size onwards); short or empty past the end."""
+        with self._lock:
+            cached = self._pages.get(number)
+            if cached is not None:
+                self._pages.move_to_end(number)
+                return cached
+        start = number * self.page_size
+        df = self.iface.read_rows(start, self.page_size)
+        if self.transform is not None:
+            df = self.transform(df)
+        df = df.reset_index(drop=True)
+        with self._lock:
+            self._pages[number] = df
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+            self.rows_seen = max(self.rows_seen, start + len(df))
+            if len(df) < self.page_size:
+                self.exhausted = True
+        return df
+
+    def row(self, row: int) -> Optional[pd.Series]:
+        df = self.page(row // self.page_size)
+        offset = row % self.page_size
+        return df.iloc[offset] if offset < len(df) else None
+
+    def cell(self, row: int, column: int) -> Any:
+        df = self.page(row // self.page_size)
+        offset = row % self.page_size
+        if offset >= len(df) or column >= df.shape[1]:
+            return None
+        return df.iat[offset, column]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self._columns = None
+            self._total_checked = False
+            self.rows_seen = 0
+            self.exhausted = False
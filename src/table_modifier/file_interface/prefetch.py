@@ -0,0 +1,298 @@
+"""Background metadata prefetching for tracked files.
+
+When a file is tracked, a small worker pool reads what the map screen needs —
+sheet names, headers, schema, a row-count estimate and column classifications —
+so opening the file for mapping is served from memory instead of re-reading the
+workbook on the GUI thread. Work is taken in priority order: files the user is
+about to open can jump the queue with ``prioritize``.
+
+Results are keyed by path and invalidated when the file's size or mtime changes.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.table_modifier.file_interface.compression import split_compression
+from src.table_modifier.file_interface.factory import FileInterfaceFactory
+from src.table_modifier.file_interface.utils import Fingerprint, fingerprint
+from src.table_modifier.signals import EMIT, ON
+
+logger = logging.getLogger(__name__)
+
+# Rows sampled per sheet for schema and classification (the map screen uses 100)
+DEFAULT_SAMPLE_ROWS = 100
+DEFAULT_MAX_WORKERS = 2
+# Bytes read from the start of a plain-text file to estimate its line count
+ESTIMATE_SAMPLE_BYTES = 64 * 1024
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+
+@dataclass
+class SheetMetadata:
+    headers: List[str] = field(default_factory=list)
+    schema: Dict[str, str] = field(default_factory=dict)
+    estimated_rows: Optional[int] = None
+    # column name -> ClassificationResult
+    classifications: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FileMetadata:
+    """Everything prefetched for one file; ``sheets`` is [None] for single-table formats."""
+
+    path: Path
+    sheets: List[Optional[str]] = field(default_factory=list)
+    by_sheet: Dict[Optional[str], SheetMetadata] = field(default_factory=dict)
+
+    def sheet(self, name: Optional[str] = None) -> Optional[SheetMetadata]:
+        if name is None and None not in self.by_sheet and self.sheets:
+            name = self.sheets[0]
+        return self.by_sheet.get(name)
+
+
+def estimate_rows(iface: Any) -> Optional[int]:
+    """Cheap row-count estimate: exact for loaded frames, sampled for plain-text files."""
+    df = getattr(iface, "_df", None)
+    if df is not None:
+        return len(df)
+    path = Path(str(getattr(iface, "path", "")))
+    if getattr(iface, "file_type", None) != "csv" or split_compression(path)[1]:
+        return None
+    try:
+        size = path.stat().st_size
+        with open(path, "rb") as f:
+            head = f.read(ESTIMATE_SAMPLE_BYTES)
+    except OSError:
+        return None
+    lines = head.count(b"\n")
+    if not head:
+        return 0
+    if len(head) >= size:
+        lines += 0 if head.endswith(b"\n") else 1
+        return max(0, lines - 1)  # minus the header row
+    if lines == 0:
+        return None
+    return max(0, round(size / (len(head) / lines)) - 1)
+
+
+def _sheet_metadata(iface: Any, sample_rows: int) -> SheetMetadata:
+    from src.table_modifier.classifier import ColumnTypeClassifier, DetectorRegistry
+
+    meta = SheetMetadata(headers=list(iface.get_headers() or []))
+    # Only the sample is parsed, so workbooks are not read in full here
+    sample = iface.read_head(sample_rows)
+    if not sample.empty:
+        meta.schema = {str(col): str(dtype) for col, dtype in sample.dtypes.items()}
+        classifier = ColumnTypeClassifier(DetectorRegistry)
+        for col in sample.columns:
+            meta.classifications[str(col)] = classifier.classify(sample[col].tolist(), str(col))
+    meta.estimated_rows = estimate_rows(iface)
+    return meta
+
+
+def collect_sheet_metadata(
+    path: str | Path, sheet: Optional[str] = None, sample_rows: int = DEFAULT_SAMPLE_ROWS
+) -> SheetMetadata:
+    """Read headers, schema, row estimate and classifications of one sheet (or table) of path."""
+    iface = FileInterfaceFactory.create(path)
+    if sheet is not None:
+        iface.sheet_name = sheet
+    return _sheet_metadata(iface, sample_rows)
+
+
+def collect_metadata(path: str | Path, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> FileMetadata:
+    """Read sheet names plus the metadata of the sheet a file opens on.
+
+    Other sheets of a workbook are left to collect_sheet_metadata once chosen.
+    """
+    iface = FileInterfaceFactory.create(path)
+    meta = FileMetadata(path=Path(path))
+    get_sheets = getattr(iface, "get_sheets", None)
+    if get_sheets is None:
+        meta.sheets = [None]
+        meta.by_sheet[None] = _sheet_metadata(iface, sample_rows)
+        return meta
+    meta.sheets = list(get_sheets())
+    if meta.sheets:
+        iface.sheet_name = meta.sheets[0]
+        meta.by_sheet[meta.sheets[0]] = _sheet_metadata(iface, sample_rows)
+    return meta
+
+
+class MetadataPrefetcher:
+    """Bounded worker pool warming FileMetadata for tracked files.
+
+    ``start()`` subscribes to the tracked-files signals; ``get(path)`` returns
+    warmed metadata (or None) without blocking. Emits ``prefetch.file.ready``
+    with ``path`` from the worker thread once a file has been read.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+        collect: Callable[..., FileMetadata] = collect_metadata,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.sample_rows = sample_rows
+        self.collect = collect
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        self._queued: Dict[str, int] = {}  # path -> best queued priority
+        self._running: Set[str] = set()
+        # In-flight reads whose result is no longer wanted
+        self._dropped: Set[str] = set()
+        self._results: Dict[str, Tuple[Optional[Fingerprint], FileMetadata]] = {}
+        self._workers: List[threading.Thread] = []
+        self._idle = 0
+        self._closed = False
+
+    @staticmethod
+    def _key(path: Any) -> str:
+        return str(Path(str(getattr(path, "path", path))))
+
+    def start(self) -> Callable[[], None]:
+        """Follow state.tracked_files; returns a function that unsubscribes."""
+        unsubs = [
+            ON("state.file.tracked_files.added", self._on_added),
+            ON("state.file.tracked_files.deleted", self._on_deleted),
+            ON("state.file.tracked_files.cleared", self._on_cleared),
+        ]
+
+        def stop() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return stop
+
+    def _on_added(self, sender: Any, file: Any = None, **kwargs: Any) -> None:
+        if file is not None:
+            self.submit(file)
+
+    def _on_deleted(self, sender: Any, file: Any = None, **kwargs: Any) -> None:
+        if file is not None:
+            self.discard(file)
+
+    def _on_cleared(self, sender: Any, **kwargs: Any) -> None:
+        self.clear()
+
+    def submit(self, path: Any, priority: int = PRIORITY_NORMAL) -> None:
+        """Queue path for prefetching; re-submitting only ever raises its priority."""
+        key = self._key(path)
+        with self._cond:
+            if key in self._running:
+                self._dropped.discard(key)
+                return
+            if self._closed or self._fresh(key):
+                return
+            if self._queued.get(key, priority + 1) <= priority:
+                return
+            self._queued[key] = priority
+            # Stale entries for the same key are skipped when popped
+            heapq.heappush(self._queue, (priority, next(self._seq), key))
+            if self._idle == 0 and len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work, name=f"Prefetch-{len(self._workers)}", daemon=True
+                )
+                self._workers.append(worker)
+                worker.start()
+            # Waiters share the condition, so make sure a worker is among those woken
+            self._cond.notify_all()
+
+    def prioritize(self, path: Any) -> None:
+        """Move path to the front of the queue (e.g. the user is about to open it)."""
+        self.submit(path, PRIORITY_HIGH)
+
+    def _fresh(self, key: str) -> bool:
+        entry = self._results.get(key)
+        return entry is not None and entry[0] == fingerprint(key)
+
+    def get(self, path: Any) -> Optional[FileMetadata]:
+        key = self._key(path)
+        with self._cond:
+            entry = self._results.get(key)
+        if entry is None or entry[0] != fingerprint(key):
+            return None
+        return entry[1]
+
+    def wait(self, path: Any, timeout: Optional[float] = None) -> Optional[FileMetadata]:
+        """Return metadata for path, waiting up to timeout for a queued or in-flight read."""
+        key = self._key(path)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while key in self._queued or key in self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        return self.get(key)
+
+    def discard(self, path: Any) -> None:
+        key = self._key(path)
+        with self._cond:
+            self._queued.pop(key, None)
+            self._results.pop(key, None)
+            if key in self._running:
+                self._dropped.add(key)
+
+    def clear(self) -> None:
+        with self._cond:
+            self._queue.clear()
+            self._queued.clear()
+            self._results.clear()
+            self._dropped.update(self._running)
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._queued.clear()
+            self._cond.notify_all()
+
+    def _next(self) -> Optional[str]:
+        with self._cond:
+            while True:
+                while self._queue:
+                    priority, _, key = heapq.heappop(self._queue)
+                    if self._queued.get(key) == priority:
+                        del self._queued[key]
+                        self._running.add(key)
+                        return key
+                if self._closed:
+                    return None
+                self._idle += 1
+                try:
+                    self._cond.wait()
+                finally:
+                    self._idle -= 1
+
+    def _work(self) -> None:
+        while True:
+            key = self._next()
+            if key is None:
+                return
+            try:
+                before = fingerprint(key)
+                meta = self.collect(key, sample_rows=self.sample_rows)
+            except Exception as e:
+                logger.warning("Could not prefetch %s: %s", key, e)
+                meta = None
+            with self._cond:
+                self._running.discard(key)
+                if key in self._dropped:
+                    self._dropped.discard(key)
+                    meta = None
+                elif meta is not None and not self._closed:
+                    self._results[key] = (before, meta)
+                self._cond.notify_all()
+            if meta is not None:
+                logger.debug("Prefetched metadata for %s", key)
+                EMIT("prefetch.file.ready", path=key)
@@ -1,14 +1,20 @@
+from __future__ import annotations
+
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Protocol,
     ClassVar,
     Iterator,
     Dict,
     Optional,
+    Sequence,
     runtime_checkable,
     Any,
 )
-import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover - typing only; keeps pandas off the import path
+    import pandas as pd
 
 
 @runtime_checkable
@@ -91,10 +97,13 @@ class FileInterfaceProtocol(Protocol):
         """
         ...
 
-    def stream_rows(self) -> Iterator[Dict[str, Any]]:
+    def stream_rows(
+        self, columns: Optional[Sequence[str]] = None, chunksize: int = 10_000
+    ) -> Iterator[Dict[str, Any]]:
         """
         Stream single rows as a dict mapping column→value.
-        Useful for record‑by‑record processing.
+        Useful for record‑by‑record processing; rows are read in chunksize-row
+        chunks and columns, if given, limits each record to those columns.
         """
         ...
 
@@ -0,0 +1,317 @@
+"""Byte-offset index of CSV records for random access.
+
+The index stores the byte offset of every ``step``-th record, so reading rows
+4,000,000..4,000,100 seeks to the nearest indexed record and parses at most
+``step`` rows before the wanted ones instead of everything ahead of them.
+
+It is built in one pass over a memory-mapped file with numpy: newlines inside
+quoted fields are recognised by the parity of the quote characters before them,
+and blank lines are not counted as records (pandas skips them too), though
+their line numbers are kept: pandas' ``skiprows`` counts them. Indexes are
+cached in memory by path and fingerprint and, when a directory is configured,
+kept as ``.npz`` sidecars across runs, evicted least recently used first once
+the directory outgrows its size bound.
+
+Only uncompressed files in single-byte-compatible encodings with doubled-quote
+escaping can be indexed; everything else is read sequentially as before.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.table_modifier.config.setup import user_cache_path
+from src.table_modifier.file_interface.compression import split_compression
+from src.table_modifier.file_interface.utils import Fingerprint, fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Records between indexed offsets: the most rows parsed before a wanted one
+DEFAULT_STEP = 1024
+# Bytes scanned per numpy pass (bounds the temporary arrays)
+BLOCK_BYTES = 16 * 1024 * 1024
+# Indexes kept in memory
+MAX_CACHED_INDEXES = 32
+# Upper bound for the sidecar directory; least recently used sidecars go first
+DEFAULT_MAX_SIDECAR_BYTES = 256 * 1024 * 1024
+
+# Encodings in which newline and quote bytes can't occur inside other characters
+INDEXABLE_ENCODINGS = frozenset({"utf-8", "utf-8-sig", "cp1252", "latin-1", "ascii"})
+
+_BOM_UTF8 = b"\xef\xbb\xbf"
+
+
+@dataclass
+class RowIndex:
+    """Offsets of records 0, step, 2*step, … (record 0 is the header row, if any).
+
+    Records are non-blank lines. Lines, as pandas numbers them for ``skiprows``,
+    also include blank lines (but not newlines inside quoted fields), so the
+    line numbers of blank lines are kept to translate between the two.
+    """
+
+    step: int
+    offsets: np.ndarray
+    records: int
+    size: int
+    blank_lines: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+
+    @property
+    def lines(self) -> int:
+        return self.records + len(self.blank_lines)
+
+    def line_of(self, record: int) -> int:
+        """Line number of record."""
+        # blank_lines[i] - i records come before blank line i
+        before = np.searchsorted(self.blank_lines - np.arange(len(self.blank_lines)), record, side="right")
+        return int(record + before)
+
+    def record_of(self, line: int) -> Optional[int]:
+        """Record number at line, or None if the line is blank."""
+        i = int(np.searchsorted(self.blank_lines, line))
+        if i < len(self.blank_lines) and self.blank_lines[i] == line:
+            return None
+        return int(line) - i
+
+    def seek(self, record: int) -> Tuple[int, int]:
+        """Return (byte offset, records to skip from there) to reach record."""
+        record = max(0, int(record))
+        k = min(record // self.step, len(self.offsets) - 1)
+        if k < 0:
+            return self.size, 0
+        return int(self.offsets[k]), record - k * self.step
+
+    def byte_ranges(self, parts: int) -> List[Tuple[int, int]]:
+        """Split the file into up to parts byte ranges that start on indexed records.
+
+        The first range starts at record 0 (the header, if any), so workers
+        other than the first see headerless data.
+        """
+        parts = max(1, min(int(parts), len(self.offsets)))
+        if not len(self.offsets):
+            return []
+        cuts = [int(self.offsets[round(i * len(self.offsets) / parts)]) for i in range(parts)]
+        return list(zip(cuts, cuts[1:] + [self.size]))
+
+
+def _record_starts(
+    data: np.ndarray, start: int, newline: int, quote: Optional[int], step: int
+) -> Tuple[List[np.ndarray], int, List[np.ndarray]]:
+    """Scan data (a whole-file byte view) for non-blank record starts.
+
+    Returns (every step-th record's offset, in chunks; total record count;
+    line numbers of blank lines, in chunks).
+    """
+    size = len(data)
+    picked: List[np.ndarray] = []
+    blanks: List[np.ndarray] = []
+    records = 0
+    lines = 0
+    record_start = start  # start of the record currently being read
+    quotes_before = 0
+    for block in range(start, size, BLOCK_BYTES):
+        view = data[block:block + BLOCK_BYTES]
+        newlines = np.flatnonzero(view == newline)
+        if quote is not None:
+            quote_pos = np.flatnonzero(view == quote)
+            # A newline ends a record only outside quotes (an even count of quotes before it)
+            outside = (np.searchsorted(quote_pos, newlines) + quotes_before) % 2 == 0
+            newlines = newlines[outside]
+            quotes_before += len(quote_pos)
+        if not len(newlines):
+            continue
+        ends = newlines + block
+        starts = np.empty_like(ends)
+        starts[0] = record_start
+        starts[1:] = ends[:-1] + 1
+        record_start = int(ends[-1]) + 1
+        lengths = ends - starts
+        # Blank lines ("" or a lone "\r" before "\n") aren't records
+        blank = lengths == 0
+        cr = np.flatnonzero(lengths == 1)
+        if len(cr):
+            blank[cr] = data[starts[cr]] == 0x0D
+        blank_at = np.flatnonzero(blank)
+        if len(blank_at):
+            blanks.append(blank_at + lines)
+        lines += len(starts)
+        starts = starts[~blank]
+        # Record numbers of these starts are records..records+len-1
+        first = (-records) % step
+        picked.append(starts[first::step])
+        records += len(starts)
+    tail = size - record_start
+    if tail > 0 and not (tail == 1 and data[record_start] == 0x0D):
+        if records % step == 0:
+            picked.append(np.array([record_start], dtype=np.int64))
+        records += 1
+    return picked, records, blanks
+
+
+def build_row_index(
+    path: str | Path, quotechar: Optional[str] = '"', lineterminator: str = "\n", step: int = DEFAULT_STEP
+) -> RowIndex:
+    """Index the records of the (uncompressed) CSV file at path in one pass."""
+    step = max(1, int(step))
+    newline = ord("\r") if lineterminator == "\r" else ord("\n")
+    quote = ord(quotechar) if quotechar else None
+    size = os.path.getsize(path)
+    if size == 0:
+        return RowIndex(step, np.empty(0, dtype=np.int64), 0, 0)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = np.frombuffer(mm, dtype=np.uint8)
+        try:
+            start = len(_BOM_UTF8) if mm[:3] == _BOM_UTF8 else 0
+            picked, records, blanks = _record_starts(data, start, newline, quote, step)
+        finally:
+            # The view must be released before the map can close
+            del data
+    offsets = np.concatenate(picked).astype(np.int64) if picked else np.empty(0, dtype=np.int64)
+    blank_lines = np.concatenate(blanks).astype(np.int64) if blanks else np.empty(0, dtype=np.int64)
+    return RowIndex(step, offsets, records, size, blank_lines)
+
+
+def indexable(path: str | Path, encoding: str, escapechar: Optional[str] = None) -> bool:
+    """Return True if records of the file can be located from raw bytes."""
+    return (
+        split_compression(path)[1] is None
+        and encoding.lower() in INDEXABLE_ENCODINGS
+        and escapechar is None
+    )
+
+
+class RowIndexCache:
+    """Row indexes by path and fingerprint, optionally persisted as sidecars in directory."""
+
+    suffix = ".rowidx.npz"
+
+    def __init__(
+        self,
+        directory: Optional[str | Path] = None,
+        max_entries: int = MAX_CACHED_INDEXES,
+        max_bytes: int = DEFAULT_MAX_SIDECAR_BYTES,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[tuple, RowIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _sidecar(self, key: tuple) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{self.suffix}"
+
+    def get(
+        self,
+        path: str | Path,
+        quotechar: Optional[str] = '"',
+        lineterminator: str = "\n",
+        step: int = DEFAULT_STEP,
+    ) -> Optional[RowIndex]:
+        """Return the index for path, building it on a miss; None if the file is unreadable."""
+        fp: Optional[Fingerprint] = fingerprint(path)
+        if fp is None:
+            return None
+        key = (str(Path(path).resolve()), fp, quotechar, lineterminator, int(step))
+        with self._lock:
+            index = self._entries.get(key)
+            if index is not None:
+                self._entries.move_to_end(key)
+                return index
+        sidecar = self._sidecar(key)
+        index = self._read(sidecar) if sidecar is not None else None
+        if index is None:
+            try:
+                index = build_row_index(path, quotechar, lineterminator, step)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not index %s: %s", path, e)
+                return None
+            logger.debug("Indexed %d records of %s", index.records, path)
+            if sidecar is not None and self._write(sidecar, index):
+                self.evict()
+        with self._lock:
+            self._entries[key] = index
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return index
+
+    @staticmethod
+    def _read(sidecar: Path) -> Optional[RowIndex]:
+        if not sidecar.is_file():
+            return None
+        try:
+            with np.load(sidecar) as npz:
+                step, records, size = (int(v) for v in npz["meta"])
+                index = RowIndex(step, npz["offsets"], records, size, npz["blank_lines"])
+        except Exception as e:
+            logger.debug("Ignoring unreadable row index %s: %s", sidecar.name, e)
+            return None
+        # Recency for eviction is the sidecar's mtime, as in ParseCache
+        try:
+            os.utime(sidecar)
+        except OSError:
+            pass
+        return index
+
+    @staticmethod
+    def _write(sidecar: Path, index: RowIndex) -> bool:
+        tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                np.savez(
+                    f,
+                    offsets=index.offsets,
+                    blank_lines=index.blank_lines,
+                    meta=np.array([index.step, index.records, index.size]),
+                )
+            os.replace(tmp, sidecar)
+        except OSError as e:
+            logger.debug("Not keeping row index %s: %s", sidecar.name, e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+        return True
+
+    def evict(self) -> None:
+        """Remove least recently used sidecars until the directory fits max_bytes."""
+        if self.directory is None:
+            return
+        with self._lock:
+            entries = []
+            for p in self.directory.glob(f"*{self.suffix}"):
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def default_row_index_cache() -> RowIndexCache:
+    """Return a RowIndexCache keeping sidecars in the user's cache directory."""
+    return RowIndexCache(user_cache_path() / "row_index")
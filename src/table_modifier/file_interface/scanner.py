@@ -0,0 +1,119 @@
+"""Incremental directory scanning for supported table files.
+
+The scanner walks a directory with ``os.scandir`` and reports accepted files in
+batches, so a caller can display results while a large (or remote) directory is
+still being read. Complete listings are cached per directory and reused while
+the directory's mtime is unchanged.
+"""
+
+import logging
+import os
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+from src.table_modifier.file_interface.factory import FileInterfaceFactory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 256
+
+K = TypeVar("K", bound=Hashable)
+
+
+def directory_mtime(directory: str) -> Optional[int]:
+    """Return the directory's mtime in ns, or None if it can't be stat'ed."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def diff_listing(old: Sequence[K], new: Sequence[K]) -> Tuple[List[K], List[K]]:
+    """Return (removed, added) between two listings, each in listing order.
+
+    Both listings must use the same representation (e.g. both Path objects).
+    """
+    old_set, new_set = set(old), set(new)
+    return [p for p in old if p not in new_set], [p for p in new if p not in old_set]
+
+
+class DirectoryScanner:
+    """Scan directories for files accepted by ``accept`` (by default, any file a
+    registered handler can open), caching listings by directory mtime."""
+
+    def __init__(
+        self,
+        accept: Optional[Callable[[str], bool]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.accept = accept or FileInterfaceFactory.can_handle
+        self.batch_size = max(1, int(batch_size))
+        self._cache: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, directory: str) -> Optional[Tuple[str, ...]]:
+        """Return the cached listing if the directory hasn't changed since it was read."""
+        with self._lock:
+            entry = self._cache.get(directory)
+        if entry is None or entry[0] != directory_mtime(directory):
+            return None
+        return entry[1]
+
+    def invalidate(self, directory: Optional[str] = None) -> None:
+        with self._lock:
+            if directory is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(directory, None)
+
+    def scan(
+        self,
+        directory: str,
+        on_batch: Optional[Callable[[List[str]], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Optional[List[str]]:
+        """List accepted files in directory, reporting them in batches.
+
+        Returns the full listing, or None if canceled or the directory is unreadable.
+        """
+        cached = self.cached(directory)
+        if cached is not None:
+            if on_batch and cached:
+                on_batch(list(cached))
+            return list(cached)
+
+        # Taken before reading, so changes made during the scan invalidate the entry
+        mtime = directory_mtime(directory)
+        listing: List[str] = []
+        batch: List[str] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if cancel is not None and cancel.is_set():
+                        return None
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    path = entry.path
+                    try:
+                        if not self.accept(path):
+                            continue
+                    except Exception as e:
+                        logger.debug("Skipping %s: %s", path, e)
+                        continue
+                    listing.append(path)
+                    batch.append(path)
+                    if on_batch and len(batch) >= self.batch_size:
+                        on_batch(batch)
+                        batch = []
+        except OSError as e:
+            logger.warning("Could not scan %s: %s", directory, e)
+            return None
+        if on_batch and batch:
+            on_batch(batch)
+        if mtime is not None:
+            with self._lock:
+                self._cache[directory] = (mtime, tuple(listing))
+        return listing
@@ -1,10 +1,24 @@
+import os
 from pathlib import Path
+from typing import Optional, Tuple
 
 from src.table_modifier.file_interface.factory import FileInterfaceFactory
 from src.table_modifier.file_interface.protocol import FileInterfaceProtocol
 
 FilePath = str | Path | FileInterfaceProtocol | object
 
+# (mtime in ns, size) identifying one version of a file
+Fingerprint = Tuple[int, int]
+
+
+def fingerprint(path: str | Path) -> Optional[Fingerprint]:
+    """Return the file's fingerprint, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 def _looks_like_interface(obj: object) -> bool:
     return hasattr(obj, "path") and hasattr(obj, "append_list") and hasattr(obj, "save")
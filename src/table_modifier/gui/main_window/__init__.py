@@ -8,6 +8,13 @@ from typing import Any, Optional
 from PyQt6.QtWidgets import QMainWindow, QTabWidget, QWidget
 
 from src.table_modifier.config.state import state
+from src.table_modifier.config.store import default_state_store
+from src.table_modifier.file_interface.cache import default_parse_cache
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.excel import ExcelFileInterface
+from src.table_modifier.file_interface.factory import FileInterfaceFactory
+from src.table_modifier.file_interface.prefetch import MetadataPrefetcher
+from src.table_modifier.file_interface.row_index import default_row_index_cache
 from src.table_modifier.gui.main_window.config_screen import ConfigScreen
 from src.table_modifier.gui.main_window.input_screen import InputScreen
 from src.table_modifier.gui.main_window.map_screen import MapScreen
@@ -29,6 +36,16 @@ class MainWindow(QMainWindow):
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
+        # The GUI re-reads the same workbooks often; serve repeats from a sidecar cache
+        FileInterfaceFactory.set_parse_cache(default_parse_cache())
+        # Row-offset indexes let large CSVs be paged without parsing what comes before
+        CSVFileInterface.row_indexes = default_row_index_cache()
+        # Mappings, skip rows and metrics survive restarts; loaded on first use
+        state.attach_store(default_state_store())
+        # Warm headers, sheets and classifications as soon as files are tracked
+        state.container.prefetcher = MetadataPrefetcher()
+        state.container.prefetcher.start()
+        ON("control.excel.engine.*", self._on_excel_engine_changed)
         ON("status.update", self.update_status_bar)
         ON("processing.current.updated", self._open_status_tab)
         self.setWindowTitle("Table Modifier")
@@ -59,6 +76,10 @@ class MainWindow(QMainWindow):
 
         self.init_menu_bar()
 
+    def _on_excel_engine_changed(self, sender: Any, **kwargs: Any) -> None:
+        """Apply the configured Excel reader engine to every workbook opened from the GUI."""
+        ExcelFileInterface.set_default_engine(kwargs.get("new_value", kwargs.get("value")))
+
     def map_screen_enabled(self, sender: str, count: int, **kwargs: Any) -> None:
         """Enable the Map Columns tab when there are tracked files."""
         self._tabs.setTabEnabled(2, count > 0)
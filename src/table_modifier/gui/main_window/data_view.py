@@ -0,0 +1,147 @@
+"""Paged table viewer for previewing source files and outputs.
+
+The model exposes rows to the view incrementally through ``canFetchMore`` /
+``fetchMore`` and reads cell values from a RowPager, which keeps only a bounded
+number of pages in memory. Scrolling therefore costs one page read per page
+visited, however large the file. FrameTableModel shows small in-memory frames,
+such as the map screen's live preview.
+"""
+
+from typing import Any, Optional
+
+import pandas as pd
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtWidgets import QDialog, QLabel, QTableView, QVBoxLayout, QWidget
+
+from src.table_modifier.file_interface.pager import RowPager
+
+
+def _display(value: Any) -> str:
+    """Cell text: missing values show as empty."""
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+class PagedTableModel(QAbstractTableModel):
+    """Read-only table model over a RowPager."""
+
+    def __init__(self, pager: RowPager, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self.pager = pager
+        self._columns = pager.columns()
+        # Rows exposed to the view so far; grows with fetchMore
+        self._rows = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._columns)
+
+    def _available(self) -> int:
+        total = self.pager.total_rows()
+        if total is not None:
+            return total
+        if self.pager.rows_seen <= self._rows and not self.pager.exhausted:
+            # Unknown length: read ahead to learn whether more rows exist
+            self.pager.page(self._rows // self.pager.page_size)
+        return self.pager.rows_seen
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:  # noqa: N802 - Qt API
+        if parent.isValid():
+            return False
+        total = self.pager.total_rows()
+        if total is not None:
+            return self._rows < total
+        return self._rows < self.pager.rows_seen or not self.pager.exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:  # noqa: N802 - Qt API
+        if parent.isValid():
+            return
+        if self.pager.total_rows() is not None:
+            # Rows are only read when shown, so known lengths are exposed in doubling steps
+            step = max(self.pager.page_size, self._rows)
+        else:
+            step = self.pager.page_size
+        new = min(self._available(), self._rows + step)
+        if new <= self._rows:
+            return
+        self.beginInsertRows(QModelIndex(), self._rows, new - 1)
+        self._rows = new
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        return _display(self.pager.cell(index.row(), index.column()))
+
+    def headerData(  # noqa: N802 - Qt API
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section] if 0 <= section < len(self._columns) else None
+        return str(section + 1)
+
+
+class FrameTableModel(QAbstractTableModel):
+    """Read-only table model over a small in-memory DataFrame (e.g. a preview)."""
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self._df = df if df is not None else pd.DataFrame()
+
+    def set_frame(self, df: pd.DataFrame) -> None:
+        self.beginResetModel()
+        self._df = df
+        self.endResetModel()
+
+    def frame(self) -> pd.DataFrame:
+        return self._df
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else self._df.shape[1]
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        return _display(self._df.iat[index.row(), index.column()])
+
+    def headerData(  # noqa: N802 - Qt API
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section]) if 0 <= section < self._df.shape[1] else None
+        return str(section + 1)
+
+
+class DataViewer(QDialog):
+    """Dialog browsing a file interface (optionally transformed) page by page."""
+
+    def __init__(self, pager: RowPager, title: str = "", parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle(title or "Data")
+        self.resize(900, 600)
+        layout = QVBoxLayout(self)
+        total = pager.total_rows()
+        self.summary = QLabel(f"{total:,} rows" if total is not None else "", self)
+        layout.addWidget(self.summary)
+        self.model = PagedTableModel(pager, self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        # Uniform row heights keep the view from measuring every fetched row
+        self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 6)
+        self.table.verticalHeader().setSectionResizeMode(self.table.verticalHeader().ResizeMode.Fixed)
+        layout.addWidget(self.table)
@@ -49,7 +49,7 @@ class FileSelectorWidget(QWidget):
         self.file_filter = QLineEdit(self)
         self.file_filter.setPlaceholderText(
             String.get("FILE_FILTER_PLACEHOLDER", "Filter files..."))
-        self.file_filter.textChanged.connect(self.file_model.apply_filter)
+        self.file_filter.textChanged.connect(self.file_model.schedule_filter)
         filter_layout.addWidget(self.file_filter)
 
         kundkod_regex_btn = QPushButton(
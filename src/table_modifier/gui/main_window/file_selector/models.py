@@ -4,45 +4,146 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Pattern
 
-from PyQt6.QtCore import QAbstractListModel, Qt, QModelIndex
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QFileSystemWatcher,
+    QModelIndex,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
 
 from src.table_modifier.config.state import state
-from src.table_modifier.file_interface.factory import FileInterfaceFactory
+from src.table_modifier.file_interface.scanner import (
+    DirectoryScanner,
+    diff_listing,
+    directory_mtime,
+)
+from src.table_modifier.gui.main_window.file_selector.name_index import NameIndex
 from src.table_modifier.signals import EMIT
 
+# Directory changes are batched for this long before rescanning
+RESCAN_DELAY_MS = 250
+# Fallback polling for filesystems without change notifications (e.g. network shares)
+POLL_INTERVAL_MS = 5000
+# Keystrokes in the filter box are collected for this long before filtering
+FILTER_DEBOUNCE_MS = 150
+# Listings at least this large are filtered on a worker thread
+BACKGROUND_FILTER_MIN_FILES = 20000
+
 
 class FileModel(QAbstractListModel):
     """Model representing either available files in a directory or tracked files.
 
     - When state_name is None: lists files in the currently selected directory
-      that can be handled by any registered file handler.
+      that can be handled by any registered file handler. The directory is
+      scanned on a worker thread and rows are inserted in batches as they
+      arrive; afterwards the directory is watched and only changes are applied.
     - When state_name == "tracked_files": lists files added to state.tracked_files.
     """
 
+    # Scanner listings are shared, so revisiting a directory is instant
+    scanner = DirectoryScanner()
+
+    # Worker -> GUI thread hand-off (queued, since they're emitted off-thread)
+    _scan_requested = pyqtSignal(str)
+    _scan_started = pyqtSignal(int, str)
+    _scan_batch = pyqtSignal(int, list)
+    _scan_finished = pyqtSignal(int, list)
+    _filter_ready = pyqtSignal(int, int, str, list)
+
     def __init__(self, parent: Optional[Any] = None, state_name: Optional[str] = None):
         super().__init__(parent)
         self._filter_applied = None
+        self._filter: Optional[Pattern[str]] = None
         self.filtered_files = []
         self.logger = logging.getLogger(self.__class__.__name__)
         self.state_name = state_name
         self.files: List[Path] = []
+        self.directory: Optional[str] = None
+        self._generation = 0
+        self._cancel: Optional[threading.Event] = None
+        self._directory_mtime: Optional[int] = None
+        self._watcher: Optional[QFileSystemWatcher] = None
+        self._rescan_timer: Optional[QTimer] = None
+        self._poll_timer: Optional[QTimer] = None
+        self._index: NameIndex[Path] = NameIndex()
+        self._filter_generation = 0
+        self._pending_filter = ""
+        self._filter_timer: Optional[QTimer] = None
+        self._filter_ready.connect(self._on_filter_ready)
+        self._scan_requested.connect(self._on_scan_requested)
+        self._scan_started.connect(self._on_scan_started)
+        self._scan_batch.connect(self._on_scan_batch)
+        self._scan_finished.connect(self._on_scan_finished)
 
     def apply_filter(self, pattern: str) -> None:
         """Filter files using a regex pattern on file names."""
-        if not pattern:
-            self.filtered_files = self.files.copy()
-        else:
-            try:
-                regex = re.compile(pattern)
-                self.filtered_files = [f for f in self.files if regex.search(f.name)]
-                EMIT("file_selector.filter.regex.applied")
-            except re.error as e:
-                self.filtered_files = self.files.copy()
-                EMIT("file_selector.filter.regex.error", error=str(e))
-        self.layoutChanged.emit()
+        self._filter_generation += 1  # supersedes pending background results
+        try:
+            regex = re.compile(pattern) if pattern else None
+            result = self._index.search(pattern)
+        except re.error as e:
+            self._set_filtered(None, self.files.copy())
+            EMIT("file_selector.filter.regex.error", error=str(e))
+            return
+        self._set_filtered(regex, result)
+        if pattern:
+            EMIT("file_selector.filter.regex.applied")
+
+    def schedule_filter(self, pattern: str) -> None:
+        """Debounced apply_filter for keystrokes; large listings are filtered off-thread."""
+        self._pending_filter = pattern
+        if self._filter_timer is None:
+            self._filter_timer = QTimer(self)
+            self._filter_timer.setSingleShot(True)
+            self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+            self._filter_timer.timeout.connect(self._run_scheduled_filter)
+        self._filter_timer.start()
+
+    def _run_scheduled_filter(self) -> None:
+        pattern = self._pending_filter
+        if len(self.files) < BACKGROUND_FILTER_MIN_FILES:
+            self.apply_filter(pattern)
+            return
+        try:
+            re.compile(pattern)
+        except re.error:
+            self.apply_filter(pattern)  # reports the error
+            return
+        self._filter_generation += 1
+        generation = self._filter_generation
+        index = self._index
+
+        def work() -> None:
+            version = index.version
+            self._filter_ready.emit(generation, version, pattern, index.search(pattern))
+
+        threading.Thread(target=work, name="FileFilter", daemon=True).start()
+
+    def _on_filter_ready(self, generation: int, version: int, pattern: str, result: List[Path]) -> None:
+        if generation != self._filter_generation:
+            return
+        if version != self._index.version:
+            # Rows arrived while searching; redo it against the current listing
+            self.apply_filter(pattern)
+            return
+        self._set_filtered(re.compile(pattern) if pattern else None, result)
+        if pattern:
+            EMIT("file_selector.filter.regex.applied")
+
+    def _set_filtered(self, regex: Optional[Pattern[str]], files: List[Path]) -> None:
+        self.beginResetModel()
+        self._filter = regex
+        self.filtered_files = files
+        self.endResetModel()
+
+    def _matches(self, path: Path) -> bool:
+        return self._filter is None or bool(self._filter.search(path.name))
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
         if not hasattr(self, "filtered_files"):
@@ -62,29 +163,138 @@ class FileModel(QAbstractListModel):
         self.beginResetModel()
         self.files = [f.path for f in state.tracked_files.all()]
         self.filtered_files = self.files.copy()
+        self._filter = None
+        self._index.clear()
+        self._index.add(self.files)
         self.endResetModel()
         self.logger.info("File model updated with %d files", len(self.files))
 
     def update_files_from_folder_path(self, sender: str, **kwargs) -> None:
+        """Start scanning the given directory in the background.
+
+        Safe to call from any thread (delayed emits arrive on the scheduler
+        thread); the scan itself is started, and the model touched, only on the
+        GUI thread.
+        """
         directory = kwargs.get("directory")
         if not directory:
             return
         self.logger.debug("Updating files from folder: %s", directory)
-        root = Path(directory)
+        self._scan_requested.emit(str(directory))
+
+    def _on_scan_requested(self, directory: str) -> None:
+        self._start_scan(directory, incremental=False)
+
+    def _start_scan(self, directory: str, incremental: bool) -> None:
+        """Scan directory on a worker thread.
+
+        A full scan clears the model and streams rows in; an incremental one
+        (after a change notification) only applies the difference at the end.
+        """
+        if self._cancel is not None:
+            self._cancel.set()
+        self._generation += 1
+        generation = self._generation
+        cancel = self._cancel = threading.Event()
+
+        def work() -> None:
+            def on_batch(batch: List[str]) -> None:
+                self._scan_batch.emit(generation, batch)
+
+            if not incremental:
+                self._scan_started.emit(generation, directory)
+            listing = self.scanner.scan(
+                directory, on_batch=None if incremental else on_batch, cancel=cancel
+            )
+            if listing is not None and not cancel.is_set():
+                self._scan_finished.emit(generation, listing)
+
+        threading.Thread(target=work, name="DirectoryScan", daemon=True).start()
+
+    def _on_scan_started(self, generation: int, directory: str) -> None:
+        if generation != self._generation:
+            return
         self.beginResetModel()
-        try:
-            self.files = [
-                file
-                for file in root.glob("*")
-                if file.is_file() and FileInterfaceFactory.can_handle(file.as_posix())
-            ]
-            self.filtered_files = self.files.copy()
-        finally:
-            self.endResetModel()
-        self.logger.info("Loaded %d files from %s", len(self.files), directory)
+        self.files = []
+        self.filtered_files = []
+        self._index.clear()
+        self.endResetModel()
+        self._watch(directory)
+
+    def _on_scan_batch(self, generation: int, batch: List[str]) -> None:
+        if generation != self._generation:
+            return
+        paths = [Path(p) for p in batch]
+        self.files.extend(paths)
+        self._index.add(paths)
+        self._insert_rows([p for p in paths if self._matches(p)])
+
+    def _on_scan_finished(self, generation: int, listing: List[str]) -> None:
+        if generation != self._generation:
+            return
+        # Full scans already streamed every row in; this only reconciles rescans
+        # Compared as Paths: the scanner reports native path strings
+        removed, added = diff_listing(self.files, [Path(p) for p in listing])
+        if removed:
+            gone = set(removed)
+            self.files = [f for f in self.files if f not in gone]
+            self._index.remove(gone)
+            for row in range(len(self.filtered_files) - 1, -1, -1):
+                if self.filtered_files[row] in gone:
+                    self.beginRemoveRows(QModelIndex(), row, row)
+                    del self.filtered_files[row]
+                    self.endRemoveRows()
+        if added:
+            self.files.extend(added)
+            self._index.add(added)
+            self._insert_rows([p for p in added if self._matches(p)])
+        self.logger.info("Loaded %d files from %s", len(self.files), self.directory)
+        # Build the filter's trigram index ahead of the first query
+        threading.Thread(target=self._index.warm, name="FileIndexWarm", daemon=True).start()
+
+    def _insert_rows(self, paths: List[Path]) -> None:
+        if not paths:
+            return
+        first = len(self.filtered_files)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self.filtered_files.extend(paths)
+        self.endInsertRows()
+
+    def _watch(self, directory: str) -> None:
+        """Follow changes to directory via notifications, with polling as a fallback."""
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.directoryChanged.connect(self._schedule_rescan)
+            self._rescan_timer = QTimer(self)
+            self._rescan_timer.setSingleShot(True)
+            self._rescan_timer.setInterval(RESCAN_DELAY_MS)
+            self._rescan_timer.timeout.connect(self._rescan)
+            self._poll_timer = QTimer(self)
+            self._poll_timer.setInterval(POLL_INTERVAL_MS)
+            self._poll_timer.timeout.connect(self._poll)
+        watched = self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._watcher.addPath(directory)
+        self.directory = directory
+        self._directory_mtime = directory_mtime(directory)
+        self._poll_timer.start()
+
+    def _schedule_rescan(self, *_: Any) -> None:
+        self._rescan_timer.start()
+
+    def _poll(self) -> None:
+        if self.directory and directory_mtime(self.directory) != self._directory_mtime:
+            self._rescan()
+
+    def _rescan(self) -> None:
+        if not self.directory:
+            return
+        self._directory_mtime = directory_mtime(self.directory)
+        self._start_scan(self.directory, incremental=True)
 
     def rowCount(self,
                  parent: Optional[QModelIndex] = None) -> int:  # type: ignore[override]
         if not hasattr(self, "filtered_files"):
             self.filtered_files = self.files
-        return len(self.filtered_files)
\ No newline at end of file
+        return len(self.filtered_files)
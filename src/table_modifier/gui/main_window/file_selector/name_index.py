@@ -0,0 +1,172 @@
+"""Searchable index of file names for the file selector filter.
+
+Names are kept lowercased alongside a trigram index (every 3-character
+substring -> the entries containing it). A query is narrowed to the entries
+containing all of its required literal fragments before the regex is run, so
+typing into the filter only tests a small candidate set even for very large
+listings. When the user extends a plain-text query, the previous result is
+narrowed instead of searching again.
+"""
+
+import re
+import threading
+from typing import Callable, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+try:
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+T = TypeVar("T")
+
+NGRAM = 3
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def required_literals(pattern: str) -> Tuple[List[str], bool]:
+    """Return (literal fragments every match must contain, whether pattern is plain text).
+
+    Only top-level literal runs are considered; anything under a group,
+    alternation or repeat ends the current run. Unparseable patterns yield no
+    fragments, which simply disables narrowing.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return [], False
+    runs: List[str] = []
+    current: List[str] = []
+    plain = True
+    for op, arg in parsed:
+        if op is _sre_parse.LITERAL:
+            current.append(chr(arg))
+            continue
+        plain = False
+        if current:
+            runs.append("".join(current))
+            current = []
+    if current:
+        runs.append("".join(current))
+    return runs, plain and bool(runs) and not parsed.state.flags & re.IGNORECASE
+
+
+class NameIndex(Generic[T]):
+    """Trigram index over item names, preserving insertion order in results.
+
+    Adding items only records their names; trigram postings are built on the
+    first search that needs them (or ahead of time with ``warm``), so streaming
+    a large directory into the index stays cheap. Safe to query from a worker
+    thread while the GUI thread adds or removes items.
+    """
+
+    def __init__(self, key: Callable[[T], str] = lambda item: getattr(item, "name")) -> None:
+        self.key = key
+        self._lock = threading.Lock()
+        self._items: List[Optional[T]] = []
+        self._names: List[str] = []
+        self._lower: List[str] = []
+        self._ids: Dict[T, int] = {}
+        # trigram -> ascending entry ids; removed entries are skipped on lookup
+        self._postings: Dict[str, List[int]] = {}
+        self._indexed = 0
+        # (plain-text query, matching ids) of the last search, for narrowing
+        self._last: Optional[Tuple[str, List[int]]] = None
+        # Bumped on every change, so callers can tell if a result went stale
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items, self._names, self._lower = [], [], []
+            self._ids.clear()
+            self._postings = {}
+            self._indexed = 0
+            self._last = None
+            self.version += 1
+
+    def add(self, items: Iterable[T]) -> None:
+        with self._lock:
+            for item in items:
+                if item in self._ids:
+                    continue
+                name = self.key(item)
+                self._ids[item] = len(self._items)
+                self._items.append(item)
+                self._names.append(name)
+                self._lower.append(name.lower())
+            self._last = None
+            self.version += 1
+
+    def remove(self, items: Iterable[T]) -> None:
+        with self._lock:
+            for item in items:
+                i = self._ids.pop(item, None)
+                if i is not None:
+                    self._items[i] = None
+            self._last = None
+            self.version += 1
+
+    def warm(self, step: int = 5000) -> None:
+        """Build pending trigram postings, releasing the lock between steps."""
+        while True:
+            with self._lock:
+                if self._indexed >= len(self._lower):
+                    return
+                self._build_postings(step)
+
+    def _build_postings(self, limit: Optional[int] = None) -> None:
+        postings = self._postings
+        lower = self._lower
+        end = len(lower) if limit is None else min(len(lower), self._indexed + limit)
+        for i in range(self._indexed, end):
+            for gram in trigrams(lower[i]):
+                ids = postings.get(gram)
+                if ids is None:
+                    postings[gram] = [i]
+                else:
+                    ids.append(i)
+        self._indexed = end
+
+    def search(self, pattern: str) -> List[T]:
+        """Return items whose name matches the regex pattern, in insertion order.
+
+        Raises re.error for invalid patterns.
+        """
+        regex = re.compile(pattern) if pattern else None
+        with self._lock:
+            if regex is None:
+                return [item for item in self._items if item is not None]
+            literals, plain = required_literals(pattern)
+            text = literals[0] if plain else None
+            candidates = self._candidates([lit.lower() for lit in literals], text)
+            names = self._names
+            if text is not None:
+                matched = [i for i in candidates if text in names[i]]
+                self._last = (text, matched)
+            else:
+                matched = [i for i in candidates if regex.search(names[i])]
+                self._last = None
+            items = self._items
+            return [items[i] for i in matched]  # type: ignore[misc]
+
+    def _candidates(self, literals: List[str], text: Optional[str]) -> Iterable[int]:
+        """Ids that may match: those containing every (lowercased) literal."""
+        if text is not None and self._last is not None and self._last[0] in text:
+            # Extending a plain-text query can only shrink its result
+            return self._last[1]
+        items, lower = self._items, self._lower
+        grams = {gram for lit in literals for gram in trigrams(lit)}
+        if not grams:
+            # Nothing to look up; the caller's match does all the work
+            return [i for i, item in enumerate(items) if item is not None]
+        self._build_postings()
+        rarest = min((self._postings.get(gram, []) for gram in grams), key=len)
+        return [
+            i for i in rarest
+            if items[i] is not None and all(lit in lower[i] for lit in literals)
+        ]
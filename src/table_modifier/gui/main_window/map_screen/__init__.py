@@ -1,7 +1,10 @@
 import logging
-from typing import List, Optional, Dict, Any, Union
+import os
+import threading
+from typing import ClassVar, List, Optional, Dict, Any, Union
 
-from PyQt6.QtCore import Qt, QModelIndex, QObject
+import pandas as pd
+from PyQt6.QtCore import Qt, QModelIndex, QObject, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -12,31 +15,60 @@ from PyQt6.QtWidgets import (
     QDialog,
     QPushButton,
     QScrollArea, QLayout,
+    QTableView,
 )
 
-from src.table_modifier.classifier import ColumnTypeClassifier, DetectorRegistry
+from src.table_modifier.classifier.result import ClassificationResult
 from src.table_modifier.config.state import state
 from src.table_modifier.constants import NO_MARGIN
 from src.table_modifier.file_interface.base import BaseInterface
 from src.table_modifier.file_interface.excel import ExcelFileInterface
 from src.table_modifier.file_interface.factory import FileInterfaceFactory
-from src.table_modifier.gui.main_window.map_screen.draggable_label import DraggableLabel
+from src.table_modifier.file_interface.prefetch import FileMetadata, SheetMetadata, collect_sheet_metadata
+from src.table_modifier.file_interface.utils import fingerprint
+from src.table_modifier.file_interface.pager import RowPager
+from src.table_modifier.gui.main_window.data_view import DataViewer, FrameTableModel
 from src.table_modifier.gui.main_window.map_screen.drop_slot import DropSlot
+from src.table_modifier.gui.main_window.map_screen.header_list import HeaderListModel, HeaderListView
 from src.table_modifier.localization import String
+from src.table_modifier.processing.engine import apply_skip_rows
+from src.table_modifier.processing.preview import MappingPreview, SampleCache, read_sample
 from src.table_modifier.signals import ON, EMIT
 from src.table_modifier.gui.main_window.map_screen.utils import is_valid_skip_rows, parse_skip_rows
 
+# Skip-rows edits are collected for this long before the preview sample is re-read
+PREVIEW_DEBOUNCE_MS = 300
+
 
 class MapScreen(QWidget):
+    # Preview samples by source, skip rows and file fingerprint; shared so revisiting a source is instant
+    preview_samples: ClassVar[SampleCache] = SampleCache()
+
+    # Worker -> GUI thread hand-off of preview samples (generation, sample or None)
+    _preview_ready = pyqtSignal(int, object)
+    # Worker -> GUI thread hand-off of sheet metadata read after the screen was built (source id, SheetMetadata)
+    _metadata_ready = pyqtSignal(str, object)
+
     def __init__(self, parent: QObject = None) -> None:
         super().__init__(parent)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.skip_rows_input: Optional[QLineEdit] = None
         self.drop_slots: List[DropSlot] = []
-        self.left_labels: List[DraggableLabel] = []
+        self.header_model = HeaderListModel(parent=self)
+        self.header_list: Optional[HeaderListView] = None
         self.filter_input: Optional[QLineEdit] = None
         self.current_source_id: Optional[str] = None
         self._unsubs: List[callable] = []
+        self._file_interface: Optional[BaseInterface] = None
+        self._preview: Optional[MappingPreview] = None
+        self._preview_generation = 0
+        self._preview_ready.connect(self._on_preview_ready)
+        self._metadata_ready.connect(self._on_metadata_ready)
+        # Restarted on every skip-rows edit; fires on the GUI thread
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._on_preview_reload)
 
         # Canvas and drag-drop container
         self.map_widget = QScrollArea(self)
@@ -51,6 +83,7 @@ class MapScreen(QWidget):
         self._init_layout()
         self._init_controls()
         self.layout().addWidget(self.map_widget)
+        self._init_preview()
         # Footer buttons at the bottom of the tab
         self._init_footer()
 
@@ -82,6 +115,10 @@ class MapScreen(QWidget):
 
     def _init_footer(self) -> None:
         footer = QHBoxLayout()
+        # Browse the raw source page by page, however large
+        view_btn = QPushButton(String.get("MAP_VIEW_SOURCE", "View source"), self)
+        view_btn.clicked.connect(self._on_view_source)
+        footer.addWidget(view_btn)
         footer.addStretch(1)
         # Clear all button moved to footer
         clear_btn = QPushButton(String["MAP_CLEAR_ALL"], self)
@@ -93,6 +130,15 @@ class MapScreen(QWidget):
         footer.addWidget(process_btn)
         self.layout().addLayout(footer)
 
+    def _init_preview(self) -> None:
+        # Live preview of the mapped output over a sample of the source
+        self.preview_model = FrameTableModel(parent=self)
+        self.preview_view = QTableView(self)
+        self.preview_view.setModel(self.preview_model)
+        self.preview_view.setMaximumHeight(8 * 22)
+        self.preview_view.verticalHeader().setDefaultSectionSize(self.preview_view.fontMetrics().height() + 6)
+        self.layout().addWidget(self.preview_view)
+
     def _drop_slots_available(self) -> bool:
         """Check if there are any available drop slots."""
         return any(slot.is_empty() for slot in self.drop_slots)
@@ -109,8 +155,17 @@ class MapScreen(QWidget):
         else:
             self._show_mapping(file_interface)
 
+    def _prefetched(self, path: Any) -> Optional[FileMetadata]:
+        """Metadata warmed by the background prefetcher, if already read; never waits."""
+        prefetcher = getattr(state.container, "prefetcher", None)
+        if prefetcher is None or path is None:
+            return None
+        prefetcher.prioritize(path)
+        return prefetcher.get(path)
+
     def _show_sheet_dialog(self, file_interface: ExcelFileInterface) -> None:
-        sheets = file_interface.get_sheets()
+        meta = self._prefetched(file_interface.path)
+        sheets = meta.sheets if meta is not None else file_interface.get_sheets()
         if not sheets:
             self.logger.warning("No sheets found in Excel file.")
             return
@@ -144,41 +199,82 @@ class MapScreen(QWidget):
 
     def _show_mapping(self, file_interface: BaseInterface) -> None:
         self.logger.info(f"Mapping {file_interface}")
-        headers = file_interface.get_headers()
+        meta = self._prefetched(getattr(file_interface, "path", None))
+        sheet_meta = meta.sheet(getattr(file_interface, "sheet_name", None)) if meta else None
+        headers = sheet_meta.headers if sheet_meta and sheet_meta.headers else file_interface.get_headers()
         if not headers:
             self.logger.warning("No headers found.")
             return
 
         self.current_source_id = self._source_id_for(file_interface)
+        self._file_interface = file_interface
+        self._preview = None
 
-        self._classify_columns(file_interface)
+        classifications = self._classify_columns(file_interface, sheet_meta)
         self._clear_drag_drop()
-        self._build_drag_drop(headers)
+        self._build_drag_drop(headers, classifications)
 
         # Wire events
         self._unsubs.append(ON("header.map.drop", self._on_header_drop))
         self._unsubs.append(ON("header.map.double_click", self._on_header_double_click))
         self._unsubs.append(ON("drop_slot.reorder", self._on_drop_slot_reorder))
+        self._unsubs.append(ON("header.map.changed", self._on_mapping_changed))
 
         # Restore previously saved mapping and skip rows if available
-        saved_struct = state.controls.get("map.mapping.by_source", {}).get(self.current_source_id)
-        saved_legacy = state.controls.get("map.order.by_source", {}).get(self.current_source_id)
+        saved_struct = state.get_mapping("map.mapping.by_source").get(self.current_source_id)
+        saved_legacy = state.get_mapping("map.order.by_source").get(self.current_source_id)
         saved = saved_struct if saved_struct is not None else saved_legacy
         if saved is not None:
             self._apply_saved_order(saved)
-        saved_skip = state.controls.get("map.skip_rows.by_source", {}).get(self.current_source_id)
+        saved_skip = state.get_mapping("map.skip_rows.by_source").get(self.current_source_id)
         if saved_skip is not None:
             self.skip_rows_input.setText(saved_skip)
+        if self._preview is None:
+            # Restoring the skip rows above scheduled a reload; this one replaces it
+            self._preview_timer.stop()
+            self._load_preview_sample(self._valid_skip_rows())
 
         # Emit initial mapping-changed for visual sync
         self._emit_mapping_changed()
 
-    def _classify_columns(self, file_interface: BaseInterface) -> None:
-        classifier = ColumnTypeClassifier(DetectorRegistry)
-        for col in file_interface.iter_columns(100):
-            col_name = col.columns[0]
-            result = classifier.classify(col[col_name].tolist(), col_name)
-            self.logger.debug(f"Classified column '{col_name:<60s}': {str(result.candidates)} -- Example: {result.example_values}")
+    def _classify_columns(
+        self, file_interface: BaseInterface, sheet_meta: Optional[SheetMetadata] = None
+    ) -> Dict[str, ClassificationResult]:
+        """Prefetched classifications, or none until _load_sheet_metadata delivers them."""
+        if sheet_meta is not None and sheet_meta.classifications:
+            for col_name, result in sheet_meta.classifications.items():
+                self.logger.debug(f"Classified column '{col_name:<60s}': {str(result.candidates)} -- Example: {result.example_values}")
+            return dict(sheet_meta.classifications)
+        self._load_sheet_metadata(file_interface)
+        return {}
+
+    def _load_sheet_metadata(self, file_interface: BaseInterface) -> None:
+        """Get the current sheet's metadata on a worker thread, from the prefetcher if it has it."""
+        source_id = self.current_source_id
+        path = getattr(file_interface, "path", None)
+        sheet = getattr(file_interface, "sheet_name", None)
+        prefetcher = getattr(state.container, "prefetcher", None)
+        if path is None or source_id is None:
+            return
+
+        def work() -> None:
+            try:
+                # An in-flight prefetch is waited for here rather than on the GUI thread
+                meta = prefetcher.wait(path) if prefetcher is not None else None
+                sheet_meta = meta.sheet(sheet) if meta is not None else None
+                if sheet_meta is None or not sheet_meta.classifications:
+                    sheet_meta = collect_sheet_metadata(path, sheet)
+            except Exception as e:
+                self.logger.warning(f"Could not classify columns of {path}: {e}")
+                return
+            self._metadata_ready.emit(source_id, sheet_meta)
+
+        threading.Thread(target=work, name="MapMetadata", daemon=True).start()
+
+    def _on_metadata_ready(self, source_id: str, sheet_meta: SheetMetadata) -> None:
+        if source_id != self.current_source_id:
+            return  # the user has moved on to another source
+        self.header_model.set_classifications(sheet_meta.classifications)
 
     def _clear_drag_drop(self) -> None:
         # Unsubscribe previous handlers
@@ -201,11 +297,16 @@ class MapScreen(QWidget):
                         child = layout.takeAt(0)
                         if child.widget():
                             child.widget().deleteLater()
+        if self.header_list is not None:
+            self.header_list.disconnect_events()
+            self.header_list = None
         self.drop_slots.clear()
-        self.left_labels.clear()
+        self.header_model.set_headers([])
         self.filter_input = None
 
-    def _build_drag_drop(self, headers: List[str]) -> None:
+    def _build_drag_drop(
+        self, headers: List[str], classifications: Optional[Dict[str, ClassificationResult]] = None
+    ) -> None:
         # --- LEFT COLUMN ---
         left_container = QWidget()
         left_layout = QVBoxLayout(left_container)
@@ -217,18 +318,11 @@ class MapScreen(QWidget):
         self.filter_input.textChanged.connect(self._filter_headers)
         left_layout.addWidget(self.filter_input)
 
-        for header in headers:
-            label = DraggableLabel(header)
-            # Keep QSS objectName set by DraggableLabel; attach header via property instead
-            label.setProperty("header_label", header)
-            self.left_labels.append(label)
-            left_layout.addWidget(label)
-
-        left_layout.addStretch()
-
-        left_scroll = QScrollArea()
-        left_scroll.setWidgetResizable(True)
-        left_scroll.setWidget(left_container)
+        # One model row per header; the view only lays out and paints visible rows
+        self.header_model.set_headers(headers)
+        self.header_model.set_classifications(classifications or {})
+        self.header_list = HeaderListView(self.header_model)
+        left_layout.addWidget(self.header_list)
 
         # --- RIGHT COLUMN ---
         right_container = QWidget()
@@ -250,7 +344,7 @@ class MapScreen(QWidget):
         right_scroll.setWidget(right_container)
 
         # Add scrollable containers to the main layout
-        self.drag_drop_layout.addWidget(left_scroll)
+        self.drag_drop_layout.addWidget(left_container)
         self.drag_drop_layout.addWidget(right_scroll)
 
     def _on_add_fixed_value(self) -> None:
@@ -258,12 +352,12 @@ class MapScreen(QWidget):
         slot.set_text("<Fixed Value>")
 
     def _filter_headers(self, text: str) -> None:
-        needle = (text or "").strip().lower()
-        for lbl in self.left_labels:
-            lbl.setVisible(needle in lbl.text().lower())
+        self.header_model.set_filter(text)
 
     def _add_drop_slot(self, layout: QLayout) -> DropSlot:
         slot = DropSlot(index=len(self.drop_slots))
+        # Separator edits only change the preview; the mapping is persisted on the next drop
+        slot.sep_input.textChanged.connect(lambda _text: self._refresh_preview())
         self.drop_slots.append(slot)
         layout.addWidget(slot)
         return slot
@@ -290,12 +384,8 @@ class MapScreen(QWidget):
         self._persist_mapping()
         self._emit_mapping_changed()
 
-    def _find_label_by_text(self, text: str) -> Optional[DraggableLabel]:
-        return next(
-            (w for w in self.drag_drop_container.findChildren(DraggableLabel) if
-             w.text() == text),
-            None,
-        )
+    def _find_header_index(self, text: str) -> QModelIndex:
+        return self.header_model.index_of(text)
 
     # New structured mapping helpers
     def _current_mapping(self) -> List[Dict[str, Any]]:
@@ -329,12 +419,12 @@ class MapScreen(QWidget):
         if not self.current_source_id:
             return
         # Save structured mapping
-        all_struct = state.controls.get("map.mapping.by_source", {})
+        all_struct = state.get_mapping("map.mapping.by_source")
         all_struct = dict(all_struct)
         all_struct[self.current_source_id] = self._current_mapping()
         state.update_control("map.mapping.by_source", all_struct)
         # Maintain legacy flattened string for old consumers
-        all_legacy = state.controls.get("map.order.by_source", {})
+        all_legacy = state.get_mapping("map.order.by_source")
         all_legacy = dict(all_legacy)
         all_legacy[self.current_source_id] = ",".join(self._flatten_used_sources())
         state.update_control("map.order.by_source", all_legacy)
@@ -387,10 +477,94 @@ class MapScreen(QWidget):
         # persist raw text for source
         if self.current_source_id is None:
             return
-        all_skips = state.controls.get("map.skip_rows.by_source", {})
+        all_skips = state.get_mapping("map.skip_rows.by_source")
         all_skips = dict(all_skips)
         all_skips[self.current_source_id] = text
         state.update_control("map.skip_rows.by_source", all_skips)
+        if ok:
+            self._preview_timer.start()
+
+    # Live preview
+    def _valid_skip_rows(self) -> Optional[List[int]]:
+        raw = self.skip_rows_input.text().strip() if self.skip_rows_input else ""
+        try:
+            return parse_skip_rows(raw)
+        except ValueError:
+            return None
+
+    def _on_preview_reload(self) -> None:
+        # Runs on the GUI thread once edits settle; the read itself gets a worker
+        self._load_preview_sample(self._valid_skip_rows())
+
+    def _load_preview_sample(self, skip_rows: Optional[List[int]]) -> None:
+        """Read the preview sample for the current source and skip_rows on a worker thread.
+
+        Must be called on the GUI thread, which owns the source and generation
+        state. Samples are cached, so only the first read for a source and skip
+        rows touches the file. The read uses its own interface, leaving the one
+        the headers came from untouched.
+        """
+        source_id = self.current_source_id
+        path = getattr(self._file_interface, "path", None)
+        if path is None or skip_rows is None:
+            return
+        sheet = getattr(self._file_interface, "sheet_name", None)
+        self._preview_generation += 1
+        generation = self._preview_generation
+
+        def read() -> pd.DataFrame:
+            iface = FileInterfaceFactory.create(str(path))
+            if sheet is not None and hasattr(iface, "sheet_name"):
+                iface.sheet_name = sheet
+            return read_sample(iface, skip_rows)
+
+        def work() -> None:
+            key = (source_id, tuple(skip_rows), fingerprint(path))
+            try:
+                sample = self.preview_samples.get(key, read)
+            except Exception as e:
+                self.logger.warning(f"Could not read a preview sample: {e}")
+                sample = None
+            self._preview_ready.emit(generation, sample)
+
+        threading.Thread(target=work, name="MapPreview", daemon=True).start()
+
+    def _on_preview_ready(self, generation: int, sample: Optional[pd.DataFrame]) -> None:
+        if generation != self._preview_generation:
+            return  # superseded by a later source or skip rows
+        self._preview = MappingPreview(sample) if sample is not None else None
+        self._refresh_preview()
+
+    def _refresh_preview(self) -> None:
+        if self._preview is None:
+            self.preview_model.set_frame(pd.DataFrame())
+            return
+        self.preview_model.set_frame(self._preview.render(self._current_mapping()))
+
+    def _on_mapping_changed(self, sender, source: Optional[str] = None, **kwargs) -> None:
+        if source is None or source == self.current_source_id:
+            self._refresh_preview()
+
+    def _on_view_source(self) -> None:
+        """Open the current source, with its skip rows applied, in the paged viewer."""
+        path = getattr(self._file_interface, "path", None)
+        if path is None:
+            self.logger.info("No source to view.")
+            return
+        sheet = getattr(self._file_interface, "sheet_name", None)
+        try:
+            # A fresh interface, so paging doesn't disturb the one the headers came from
+            iface = FileInterfaceFactory.create(str(path))
+            if sheet is not None and hasattr(iface, "sheet_name"):
+                iface.sheet_name = sheet
+            apply_skip_rows(iface, self._valid_skip_rows() or [])
+            title = f"{os.path.basename(str(path))} - {sheet}" if sheet else os.path.basename(str(path))
+            viewer = DataViewer(RowPager(iface), title, self)
+        except Exception as e:
+            self.logger.warning(f"Could not open {path} for viewing: {e}")
+            return
+        viewer.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        viewer.show()
 
     def _on_ready_to_process(self) -> None:
         """Validate mapping and skip rows, persist current processing context, and navigate to Status tab."""
@@ -0,0 +1,264 @@
+"""Model/view palette of source headers for the map screen.
+
+Headers live in a list model and are painted by a delegate, so a file with
+thousands of columns costs one row of Python data per header and only the
+visible rows are ever laid out or drawn. Filtering goes through the same
+trigram NameIndex as the file selector; classification badges and the
+"mapped" highlight are model roles rendered by the delegate.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QMimeData, QModelIndex, QRectF, QSize, Qt
+from PyQt6.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPalette, QPen
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+from src.table_modifier.classifier.result import ClassificationResult
+from src.table_modifier.gui.main_window.file_selector.name_index import NameIndex
+from src.table_modifier.signals import EMIT, ON
+
+HEADER_MIME_TYPE = "application/x-header-text"
+
+MappedRole = Qt.ItemDataRole.UserRole + 1
+BadgeRole = Qt.ItemDataRole.UserRole + 2
+
+ROW_HEIGHT = 34
+MAPPED_COLOR = QColor("#66bb6a")
+
+
+class HeaderListModel(QAbstractListModel):
+    """Headers of the current source, filtered by a case-insensitive substring."""
+
+    def __init__(self, headers: Iterable[str] = (), parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self._headers: List[str] = []
+        # Rows shown, as positions in _headers
+        self._rows: List[int] = []
+        self._positions: Dict[str, int] = {}
+        self._index: NameIndex[int] = NameIndex(key=lambda i: self._headers[i].lower())
+        self._filter = ""
+        self._mapped: set = set()
+        self._classifications: Dict[str, ClassificationResult] = {}
+        self.set_headers(headers)
+
+    def set_headers(self, headers: Iterable[str]) -> None:
+        self.beginResetModel()
+        self._headers = [str(h) for h in headers]
+        self._reindex()
+        self._filter = ""
+        self._rows = list(range(len(self._headers)))
+        self.endResetModel()
+
+    def _reindex(self) -> None:
+        self._positions = {}
+        for i, h in enumerate(self._headers):
+            self._positions.setdefault(h, i)
+        self._index.clear()
+        self._index.add(range(len(self._headers)))
+
+    def headers(self) -> List[str]:
+        return list(self._headers)
+
+    def set_filter(self, text: str) -> None:
+        needle = (text or "").strip().lower()
+        if needle == self._filter:
+            return
+        rows = self._index.search(re.escape(needle)) if needle else range(len(self._headers))
+        self.beginResetModel()
+        self._filter = needle
+        self._rows = sorted(rows)
+        self.endResetModel()
+
+    def set_mapped(self, headers: Iterable[str]) -> None:
+        mapped = {h for h in headers if h}
+        if mapped == self._mapped:
+            return
+        self._mapped = mapped
+        self._changed_all([MappedRole])
+
+    def set_classifications(self, classifications: Dict[str, ClassificationResult]) -> None:
+        self._classifications = dict(classifications or {})
+        self._changed_all([BadgeRole, Qt.ItemDataRole.ToolTipRole])
+
+    def _changed_all(self, roles: List[int]) -> None:
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), roles)
+
+    def index_of(self, header: str) -> QModelIndex:
+        """Index of header's row, or an invalid index if it's unknown or filtered out."""
+        pos = self._positions.get(header)
+        if pos is None:
+            return QModelIndex()
+        # _rows is sorted, so the row can be found by bisection
+        row = bisect_left(self._rows, pos)
+        if row < len(self._rows) and self._rows[row] == pos:
+            return self.index(row)
+        return QModelIndex()
+
+    def header_at(self, index: QModelIndex) -> Optional[str]:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        return self._headers[self._rows[index.row()]]
+
+    # Qt model API
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        header = self.header_at(index)
+        if header is None:
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return header
+        if role == MappedRole:
+            return header in self._mapped
+        if role == BadgeRole:
+            result = self._classifications.get(header)
+            return result.best_match()[0] if result is not None else None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            result = self._classifications.get(header)
+            if result is None or not result.candidates:
+                return header
+            scores = ", ".join(f"{k}: {v:.2f}" for k, v in list(result.candidates.items())[:3])
+            examples = ", ".join(str(v) for v in result.example_values[:3])
+            return f"{header}\n{scores}" + (f"\ne.g. {examples}" if examples else "")
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:  # noqa: N802 - Qt API
+        # Headers can be renamed in place before being dragged, like the old labels
+        if role != Qt.ItemDataRole.EditRole or self.header_at(index) is None:
+            return False
+        text = str(value).strip()
+        if not text:
+            return False
+        self._headers[self._rows[index.row()]] = text
+        self._reindex()
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsDragEnabled
+            | Qt.ItemFlag.ItemIsEditable
+        )
+
+    def mimeTypes(self) -> List[str]:  # noqa: N802 - Qt API
+        return [HEADER_MIME_TYPE]
+
+    def mimeData(self, indexes: List[QModelIndex]) -> Optional[QMimeData]:  # noqa: N802 - Qt API
+        # Drop slots take one header per drop
+        header = next((h for h in map(self.header_at, indexes) if h is not None), None)
+        if header is None:
+            return None
+        mime = QMimeData()
+        mime.setData(HEADER_MIME_TYPE, header.encode())
+        return mime
+
+    def supportedDragActions(self) -> Qt.DropAction:  # noqa: N802 - Qt API
+        return Qt.DropAction.CopyAction | Qt.DropAction.MoveAction
+
+
+class HeaderDelegate(QStyledItemDelegate):
+    """Paints a header row with a mapped accent and a classification badge."""
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:  # noqa: N802 - Qt API
+        return QSize(200, ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        badge = index.data(BadgeRole)
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        rect = opt.rect.adjusted(2, 2, -2, -2)
+        badge_width = 0
+        if badge:
+            badge_width = opt.fontMetrics.horizontalAdvance(badge) + 12
+            opt.rect = opt.rect.adjusted(0, 0, -badge_width - 6, 0)
+        opt.text = opt.fontMetrics.elidedText(opt.text, Qt.TextElideMode.ElideRight, opt.rect.width() - 14)
+        opt.rect.adjust(10, 0, 0, 0)
+        widget = opt.widget
+        style = widget.style() if widget is not None else None
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if opt.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, opt.palette.highlight())
+        painter.setPen(QPen(opt.palette.mid().color(), 1))
+        painter.drawRoundedRect(QRectF(rect), 4, 4)
+        if index.data(MappedRole):
+            painter.fillRect(rect.x(), rect.y(), 4, rect.height(), MAPPED_COLOR)
+        if badge:
+            badge_rect = QRectF(rect.right() - badge_width - 4, rect.center().y() - 9, badge_width, 18)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(opt.palette.alternateBase())
+            painter.drawRoundedRect(badge_rect, 9, 9)
+            painter.setPen(opt.palette.text().color())
+            painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge)
+        painter.restore()
+
+        # Draw the text alone; the frame, selection and badge are painted above
+        opt.backgroundBrush = QBrush()
+        if opt.state & QStyle.StateFlag.State_Selected:
+            opt.palette.setColor(QPalette.ColorRole.Text, opt.palette.highlightedText().color())
+        opt.state &= ~QStyle.StateFlag.State_Selected
+        opt.state &= ~QStyle.StateFlag.State_HasFocus
+        if style is not None:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+
+class HeaderListView(QListView):
+    """Draggable, filterable list of headers.
+
+    Double-clicking a header emits ``header.map.double_click`` and the mapped
+    highlight follows ``header.map.changed``, as with the per-header labels it
+    replaces.
+    """
+
+    def __init__(self, model: HeaderListModel, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("headerList")
+        self.setModel(model)
+        self.setItemDelegate(HeaderDelegate(self))
+        # Every row has the same height, so only the visible rows are measured
+        self.setUniformItemSizes(True)
+        self.setDragEnabled(True)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
+        self.setDefaultDropAction(Qt.DropAction.CopyAction)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(
+            QAbstractItemView.EditTrigger.SelectedClicked | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        self._unsubs = [ON("header.map.changed", self._on_mapping_changed)]
+
+    def header_model(self) -> HeaderListModel:
+        return self.model()  # type: ignore[return-value]
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:  # noqa: N802 - Qt API
+        header = self.header_model().header_at(self.indexAt(event.pos()))
+        if header is not None:
+            EMIT("header.map.double_click", text=header)
+        event.accept()
+
+    def _on_mapping_changed(self, sender=None, **kwargs) -> None:
+        if "order" in kwargs:
+            self.header_model().set_mapped(kwargs.get("order") or [])
+
+    def disconnect_events(self) -> None:
+        for unsub in self._unsubs:
+            try:
+                unsub()
+            except Exception:
+                pass
+        self._unsubs.clear()
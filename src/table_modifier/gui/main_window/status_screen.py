@@ -1,6 +1,6 @@
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 import os
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -16,11 +16,15 @@ from PyQt6.QtWidgets import (
 
 from src.table_modifier.config.state import state
 from src.table_modifier.file_interface.factory import FileInterfaceFactory
+from src.table_modifier.file_interface.pager import RowPager
+from src.table_modifier.file_interface.utils import fingerprint
+from src.table_modifier.gui.main_window.data_view import DataViewer
 from src.table_modifier.gui.main_window.map_screen.utils import parse_skip_rows
 from src.table_modifier.localization import String
+from src.table_modifier.processing.preview import slot_key
 from src.table_modifier.processing.transform import apply_mapping
 from src.table_modifier.signals import ON, EMIT
-from src.table_modifier.processing.engine import ensure_engine_listener
+from src.table_modifier.processing.engine import apply_skip_rows, build_output_path, ensure_engine_listener
 
 
 class StatusScreen(QWidget):
@@ -33,6 +37,7 @@ class StatusScreen(QWidget):
         super().__init__(parent)
         self._timer: Optional[QTimer] = None
         self._output_file: Optional[str] = None
+        self._preview_pager: Optional[Tuple[Tuple[Any, ...], RowPager]] = None
         self._init_ui()
         # Ensure engine is listening for start/cancel events
         ensure_engine_listener()
@@ -112,6 +117,11 @@ class StatusScreen(QWidget):
         self.open_button.setEnabled(False)
         self.open_button.clicked.connect(self._on_open_output)
         buttons.addWidget(self.open_button)
+        # Browse the output in-app (disabled until completion)
+        self.view_button = QPushButton(String.get("STATUS_VIEW_OUTPUT", "View output"), self)
+        self.view_button.setEnabled(False)
+        self.view_button.clicked.connect(self._on_view_output)
+        buttons.addWidget(self.view_button)
         layout.addLayout(buttons)
 
         # Log output
@@ -145,9 +155,7 @@ class StatusScreen(QWidget):
             state.update_control("processing.output_path", text)
         else:
             # Clear override
-            all_ctrl = dict(state.controls)
-            all_ctrl.pop("processing.output_path", None)
-            state.controls = all_ctrl
+            state.remove_control("processing.output_path")
 
     def _on_strict_changed(self, _state: int) -> None:
         state.update_control("processing.strict", self.strict_chk.isChecked())
@@ -175,16 +183,15 @@ class StatusScreen(QWidget):
         # Suggest a default output path if empty
         if not self.output_path.text() and source:
             base = source.split("::")[0]
-            from pathlib import Path
-
-            p = Path(base)
-            self.output_path.setPlaceholderText(str(p.with_name(f"{p.stem}_processed{p.suffix}")))
+            compression = state.controls.get("processing.output_compression")
+            self.output_path.setPlaceholderText(str(build_output_path(base, compression)))
 
     def _on_start(self) -> None:
         self._set_running(True)
         self.log.appendPlainText(String.get("STATUS_PROCESSING_STARTED", "Processing started"))
         # clear previous output button state
         self.open_button.setEnabled(False)
+        self.view_button.setEnabled(False)
         self._output_file = None
         EMIT("processing.start")
 
@@ -210,6 +217,7 @@ class StatusScreen(QWidget):
         if path:
             self._output_file = path
             self.open_button.setEnabled(True)
+            self.view_button.setEnabled(True)
         self.progress.setValue(100)
         self.progress_label.setText("100%")
         self.log.appendPlainText(String.get("STATUS_PROCESSING_COMPLETE", "Processing complete"))
@@ -243,28 +251,38 @@ class StatusScreen(QWidget):
             self.log.appendPlainText("Nothing to preview: missing source or mapping")
             return
         path, sheet = (source_id.rsplit("::", 1) + [None])[:2] if "::" in source_id else (source_id, None)
+        key = (source_id, tuple(skips), tuple(slot_key(e) for e in mapping), fingerprint(path))
         try:
+            if self._preview_pager is not None and self._preview_pager[0] == key:
+                # Same source, skips and mapping: the pages read last time are still valid
+                self._show_viewer(self._preview_pager[1], f"Preview: {os.path.basename(path)}")
+                return
             iface = FileInterfaceFactory.create(path)
             if hasattr(iface, "sheet_name") and sheet:
                 iface.sheet_name = sheet
-            # Apply skip rows
-            try:
-                iface.set_rows_to_skip(skips)
-            except Exception:
-                # fall back to header skip if contiguous
-                srt = sorted(set(int(r) for r in skips if int(r) >= 0))
-                if srt == list(range(len(srt))):
-                    iface.set_header_rows_to_skip(len(srt))
-            # Load a small chunk
-            chunk = next(iface.iter_load(chunksize=500))
-            out = apply_mapping(chunk, mapping)
-            self.log.appendPlainText("Preview (first 5 rows):")
-            self.log.appendPlainText(out.head(5).to_string(index=False))
-        except StopIteration:
-            self.log.appendPlainText("No data to preview.")
+            apply_skip_rows(iface, skips)
+            # Pages are mapped as they're read, so the whole source can be browsed
+            pager = RowPager(iface, transform=lambda df: apply_mapping(df, mapping))
+            self._preview_pager = (key, pager)
+            self._show_viewer(pager, f"Preview: {os.path.basename(path)}")
         except Exception as e:
             self.log.appendPlainText(f"Preview failed: {e}")
 
+    def _on_view_output(self) -> None:
+        path = self._output_file
+        if not path:
+            self.log.appendPlainText("No output file to view.")
+            return
+        try:
+            self._show_viewer(RowPager(FileInterfaceFactory.create(path)), os.path.basename(path))
+        except Exception as e:
+            self.log.appendPlainText(f"Failed to view output: {e}")
+
+    def _show_viewer(self, pager: RowPager, title: str) -> None:
+        viewer = DataViewer(pager, title, self)
+        viewer.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        viewer.show()
+
     def _on_open_output(self) -> None:
         if not self._output_file:
             # fallback to output path field
@@ -0,0 +1,157 @@
+"""asyncio entry point for the processing engine.
+
+``process(job)`` runs a job's pipeline in an executor and yields its events as
+an async iterator on the calling loop, so GUI handlers never run on the worker
+thread. Events are handed over in batches: the worker only schedules one wake-up
+per batch, and superseded progress updates within a batch are dropped.
+
+    async for event in process(ProcessingJob(current)):
+        print(event.name, event.kwargs)
+
+Several jobs can be awaited concurrently; each has its own cancel event. A
+finished run's metrics arrive as a ``METRICS_EVENT``; ``run_job`` records them
+in state on the loop, like every other side effect of a job.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.table_modifier.processing import engine
+from src.table_modifier.signals import EMIT
+
+# Event carrying a finished run's metrics (the keywords of engine._record_metrics)
+METRICS_EVENT = "processing.metrics"
+
+
+@dataclass
+class ProcessingJob:
+    """A processing request (see ``processing.current``) plus its cancel flag."""
+
+    current: Dict[str, Any]
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    # Run in a separate worker process (see processing.worker)
+    isolated: bool = False
+    memory_limit_mb: Optional[int] = None
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    @property
+    def canceled(self) -> bool:
+        return self.cancel_event.is_set()
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """A single engine event, e.g. ``JobEvent("progress.update", {"value": 42})``."""
+
+    name: str
+    kwargs: Dict[str, Any]
+
+
+def coalesce(events: List[JobEvent]) -> List[JobEvent]:
+    """Drop progress updates superseded by a later one in the same batch."""
+    last_progress = None
+    for i, ev in enumerate(events):
+        if ev.name == "progress.update":
+            last_progress = i
+    return [
+        ev for i, ev in enumerate(events)
+        if ev.name != "progress.update" or i == last_progress
+    ]
+
+
+class _EventChannel:
+    """Hand events from a worker thread to an asyncio loop in batches."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._pending: List[JobEvent] = []
+        self._scheduled = False
+        self._ready = asyncio.Event()
+
+    def emit(self, name: str, **kwargs: Any) -> None:
+        """Worker-side: queue an event, waking the loop once per batch."""
+        with self._lock:
+            self._pending.append(JobEvent(name, kwargs))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    def drain(self) -> List[JobEvent]:
+        """Loop-side: take everything queued so far."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._scheduled = False
+            self._ready.clear()
+        return coalesce(batch)
+
+    async def wait(self) -> None:
+        await self._ready.wait()
+
+
+async def process(job: ProcessingJob, executor: Optional[Executor] = None) -> AsyncIterator[JobEvent]:
+    """Run job in executor (default: the loop's) and yield its events.
+
+    Closing the iterator early cancels the job. Exceptions escaping the engine
+    are re-raised once all earlier events have been yielded.
+    """
+    loop = asyncio.get_running_loop()
+    channel = _EventChannel(loop)
+    # Metrics are yielded like events rather than written to state from the worker
+    record = partial(channel.emit, METRICS_EVENT)
+    if job.isolated:
+        from src.table_modifier.processing.worker import run_in_process
+
+        run = partial(
+            run_in_process,
+            job.current,
+            emit=channel.emit,
+            cancel_event=job.cancel_event,
+            memory_limit_mb=job.memory_limit_mb,
+            record=record,
+        )
+    else:
+        run = partial(
+            engine._run_processing,
+            job.current,
+            emit=channel.emit,
+            cancel_event=job.cancel_event,
+            record=record,
+        )
+    future = loop.run_in_executor(executor, run)
+    try:
+        while not future.done():
+            waiter = asyncio.ensure_future(channel.wait())
+            try:
+                await asyncio.wait({future, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+            for event in channel.drain():
+                yield event
+        # The worker has finished: everything it emitted is already queued
+        for event in channel.drain():
+            yield event
+        future.result()
+    finally:
+        if not future.done():
+            job.cancel()
+
+
+async def run_job(job: ProcessingJob, executor: Optional[Executor] = None) -> None:
+    """Run job and re-emit its events on the global bus from the loop's thread."""
+    try:
+        async for event in process(job, executor):
+            if event.name == METRICS_EVENT:
+                engine._record_metrics(**event.kwargs)
+            else:
+                EMIT(event.name, **event.kwargs)
+    except Exception as e:
+        EMIT("status.update", msg=f"Processing error: {e}")
+        EMIT("processing.error", msg=str(e))
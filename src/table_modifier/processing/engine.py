@@ -1,20 +1,43 @@
+import asyncio
 import threading
 import time
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set
 
 import pandas as pd
 
 from src.table_modifier.config.state import state
-from src.table_modifier.file_interface.excel import ExcelFileInterface
+from src.table_modifier.file_interface.compression import (
+    SUFFIX_BY_COMPRESSION,
+    split_compression,
+    strip_compression,
+)
+from src.table_modifier.file_interface.csv import CSVFileInterface, CSVStreamWriter
+from src.table_modifier.file_interface.excel import ExcelFileInterface, ExcelStreamWriter
 from src.table_modifier.file_interface.factory import FileInterfaceFactory
-from src.table_modifier.processing.transform import apply_mapping
+from src.table_modifier.processing.pipeline import (
+    DedupeConcatStage,
+    DedupeDropStage,
+    Pipeline,
+    ProgressMonitor,
+    ProjectionStage,
+    SinkStage,
+    SourceStage,
+    Stage,
+    TransformStage,
+)
 from src.table_modifier.signals import ON, EMIT
 
 
 _listener_installed = False
 _listener_lock = threading.Lock()
 _cancel_event = threading.Event()
+# Cancel events of jobs currently running, so a global cancel reaches all of them
+_active_cancel_events: Set[threading.Event] = set()
+_active_lock = threading.Lock()
+# Jobs running as asyncio tasks; the loop only keeps weak references to tasks
+_tasks: Set["asyncio.Task[None]"] = set()
 
 
 def _parse_source_id(source_id: str) -> Tuple[str, Optional[str]]:
@@ -31,21 +54,42 @@ def _parse_source_id(source_id: str) -> Tuple[str, Optional[str]]:
     return source_id, None
 
 
-def _build_output_path(input_path: str) -> Path:
+def build_output_path(input_path: str, compression: Optional[str] = None) -> Path:
+    """Derive '<name>_processed<ext>' next to the input.
+
+    Compressed inputs keep their format suffix (a.csv.gz -> a_processed.csv.gz).
+    For CSV outputs, compression overrides the input's compression: "none" writes
+    plain CSV and a method name (e.g. "zstd") selects that codec; None or "input"
+    keeps the input's compression.
+    """
     p = Path(input_path)
-    return p.with_name(f"{p.stem}_processed{p.suffix}")
+    fmt, method = split_compression(p)
+    base = strip_compression(p)
+    if method is not None and not fmt:
+        # Bare .zip archive holding a single CSV
+        fmt = ".csv"
+    else:
+        fmt = base.suffix
+    if fmt.lower() == ".csv" and compression not in (None, "", "input"):
+        method = None if compression == "none" else compression
+    suffix = fmt + (SUFFIX_BY_COMPRESSION.get(method, "") if method else "")
+    stem = base.stem if base.suffix else base.name
+    return p.with_name(f"{stem}_processed{suffix}")
 
 
 def _create_output_interface_like(input_iface) -> Any:
     """Create an output interface of the same type as input_iface for writing results."""
     if isinstance(input_iface, ExcelFileInterface):
-        # Excel requires instantiation with a path; we'll swap to the final path at save time.
-        return ExcelFileInterface(input_iface.path.as_posix(), sheet_name=input_iface.sheet_name)
-    # CSV and others should be handled by their classes via factory
+        # Stream rows into a write-only workbook rather than loading the input sheet
+        return ExcelStreamWriter(sheet_name=input_iface.sheet_name)
+    if isinstance(input_iface, CSVFileInterface):
+        # Chunks go straight into the (possibly compressed) output, in the source's dialect
+        return CSVStreamWriter(input_iface.dialect)
+    # Other formats are handled by their classes via the factory
     return FileInterfaceFactory.create(input_iface.path.as_posix())
 
 
-def _apply_skip_rows(iface, skip_rows: List[int]) -> None:
+def apply_skip_rows(iface, skip_rows: List[int]) -> None:
     """Apply fine-grained skip rows to the file interface if supported."""
     try:
         # Prefer list-based skip; implementations should handle gracefully
@@ -60,6 +104,9 @@ def _apply_skip_rows(iface, skip_rows: List[int]) -> None:
 
 def request_cancel() -> None:
     _cancel_event.set()
+    with _active_lock:
+        for event in _active_cancel_events:
+            event.set()
 
 
 def clear_cancel() -> None:
@@ -98,21 +145,109 @@ def _compute_output_columns(mapping: List[Dict[str, Any]]) -> List[str]:
     return cols
 
 
-def _run_processing(current: Dict[str, Any]) -> None:
-    clear_cancel()
+def _build_pipeline(
+    input_iface: Any,
+    output_iface: Any,
+    mapping: List[Dict[str, Any]],
+    chunksize: int,
+    total_rows: int,
+    delimiter: Optional[str] = None,
+    dedupe_key: Optional[str] = None,
+    dedupe_strategy: str = "drop",
+    dedupe_concat_sep: str = "; ",
+    emit: Callable[..., None] = EMIT,
+    cancel_event: Optional[threading.Event] = None,
+) -> Pipeline:
+    """Assemble source -> projection -> [dedupe] -> transform -> sink for a job."""
+    required_sources = list(_collect_all_sources(mapping))
+    # Ensure key is available for building the aggregated frame
+    if dedupe_key and dedupe_key not in required_sources:
+        required_sources.append(dedupe_key)
+
+    stages: List[Stage] = [ProjectionStage(required_sources)]
+    if dedupe_key:
+        # Dedupe works on source columns, so it runs before the mapping
+        if dedupe_strategy == "concat":
+            stages.append(DedupeConcatStage(dedupe_key, required_sources, dedupe_concat_sep))
+        else:
+            stages.append(DedupeDropStage(dedupe_key))
+    stages.append(TransformStage(mapping))
+
+    return Pipeline(
+        SourceStage(input_iface, chunksize),
+        stages,
+        SinkStage(output_iface, delimiter=delimiter),
+        monitor=ProgressMonitor(
+            total_rows,
+            chunksize,
+            cancel_event=cancel_event if cancel_event is not None else _cancel_event,
+            emit=emit,
+        ),
+    )
+
+
+def _record_metrics(
+    source: Optional[str],
+    rows: int,
+    elapsed: float,
+    throughput: float,
+    stage_seconds: Dict[str, float],
+) -> None:
+    """Persist a finished run's metrics to state for the UI and future runs."""
+    try:
+        state.update_control("processing.last_elapsed", elapsed)
+        state.update_control("processing.last_throughput", throughput)
+        state.update_control("processing.last_stage_seconds", stage_seconds)
+        state.record_run(source, rows, elapsed, throughput)
+    except Exception:
+        pass
+
+
+def _run_processing(
+    current: Dict[str, Any],
+    emit: Callable[..., None] = EMIT,
+    cancel_event: Optional[threading.Event] = None,
+    record: Callable[..., None] = _record_metrics,
+) -> None:
+    """Run one processing job synchronously.
+
+    Events are reported through emit (the global bus by default) and run
+    metrics through record. Without an explicit cancel_event the module-level
+    one is used and reset first.
+    """
+    if cancel_event is None:
+        clear_cancel()
+        cancel_event = _cancel_event
+    with _active_lock:
+        _active_cancel_events.add(cancel_event)
+    try:
+        _run_job(current, emit, cancel_event, record)
+    finally:
+        with _active_lock:
+            _active_cancel_events.discard(cancel_event)
+
+
+def _run_job(
+    current: Dict[str, Any],
+    emit: Callable[..., None],
+    cancel_event: threading.Event,
+    record: Callable[..., None] = _record_metrics,
+) -> None:
     source_id: str = current.get("source")
     mapping: List[Dict[str, Any]] = current.get("mapping") or []
     skip_rows: List[int] = current.get("skip_rows") or []
-    strict: bool = bool(state.controls.get("processing.strict"))
-    strict_per_slot: bool = bool(state.controls.get("processing.strict_per_slot"))
-    output_path_override: Optional[str] = state.controls.get("processing.output_path")
+    strict: bool = state.get_bool("processing.strict")
+    strict_per_slot: bool = state.get_bool("processing.strict_per_slot")
+    output_path_override: Optional[str] = state.get_str("processing.output_path")
+    output_compression: Optional[str] = state.get_str("processing.output_compression")
 
     # Read user-configured chunk size and delimiter
-    try:
-        configured_chunk = int(state.controls.get("processing.chunk_size") or 20000)
-    except Exception:
-        configured_chunk = 20000
-    csv_delim = state.controls.get("processing.csv_delimiter") or ","
+    configured_chunk = state.get_int("processing.chunk_size", 20000)
+    # "auto" leaves the delimiter to the CSV interface's dialect detection
+    csv_delim = state.get_str("processing.csv_delimiter", "auto")
+    if csv_delim == "auto":
+        csv_delim = None
+    csv_encoding = state.get_str("processing.csv_encoding", "auto")
 
     # Optional deduplication controls
     dedupe_cfg: Dict[str, Any] = current.get("dedupe") or {}
@@ -124,28 +259,31 @@ def _run_processing(current: Dict[str, Any]) -> None:
         dedupe_strategy = "drop"
 
     if not source_id or not mapping:
-        EMIT("status.update", msg="Nothing to process: missing source or mapping.")
+        emit("status.update", msg="Nothing to process: missing source or mapping.")
         return
 
     path, sheet = _parse_source_id(source_id)
     try:
         input_iface = FileInterfaceFactory.create(path)
         # Apply configured delimiter if interface supports it
-        if hasattr(input_iface, "_delimiter"):
-            try:
-                setattr(input_iface, "_delimiter", csv_delim)
-            except Exception:
-                pass
+        if hasattr(input_iface, "set_delimiter"):
+            input_iface.set_delimiter(csv_delim)
+        if hasattr(input_iface, "set_encoding"):
+            input_iface.set_encoding(csv_encoding)
+            # Detect (or check the configured encoding) now, so a wrong one fails before parsing
+            input_iface.dialect
+        if hasattr(input_iface, "engine_preference"):
+            input_iface.engine_preference = state.get_str("excel.engine")
         # Set target sheet when available (robust across implementations)
         if sheet and hasattr(input_iface, "sheet_name"):
             try:
                 setattr(input_iface, "sheet_name", sheet)
             except Exception:
                 pass
-        _apply_skip_rows(input_iface, skip_rows)
+        apply_skip_rows(input_iface, skip_rows)
     except Exception as e:
-        EMIT("status.update", msg=f"Failed to open source: {e}")
-        EMIT("processing.error", msg=str(e))
+        emit("status.update", msg=f"Failed to open source: {e}")
+        emit("processing.error", msg=str(e))
         return
 
     # Validate sources vs headers early
@@ -153,7 +291,7 @@ def _run_processing(current: Dict[str, Any]) -> None:
         headers = input_iface.get_headers()
     except Exception as e:  # header probing can fail on odd files
         headers = None
-        EMIT("status.update", msg=f"Could not read headers for validation: {e}")
+        emit("status.update", msg=f"Could not read headers for validation: {e}")
     if headers is not None:
         all_sources = _collect_all_sources(mapping)
         missing_all = sorted(all_sources - set(headers))
@@ -166,252 +304,66 @@ def _run_processing(current: Dict[str, Any]) -> None:
                 missing_per_slot.append((idx, missing))
 
         if strict_per_slot and missing_per_slot:
-            EMIT("status.update", msg=f"Strict per-slot mode: mapping slot(s) missing columns: {missing_per_slot}")
-            EMIT("processing.error", msg="Missing required columns (per-slot strict)")
+            emit("status.update", msg=f"Strict per-slot mode: mapping slot(s) missing columns: {missing_per_slot}")
+            emit("processing.error", msg="Missing required columns (per-slot strict)")
             return
         if strict and missing_all:
-            EMIT("status.update", msg=f"Strict mode: missing columns: {missing_all}")
-            EMIT("processing.error", msg="Missing required columns")
+            emit("status.update", msg=f"Strict mode: missing columns: {missing_all}")
+            emit("processing.error", msg="Missing required columns")
             return
         if missing_all:
-            EMIT("status.update", msg=f"Warning: missing columns will be empty: {missing_all}")
+            emit("status.update", msg=f"Warning: missing columns will be empty: {missing_all}")
         # Validate dedupe key
         if dedupe_enabled:
             if not dedupe_key:
-                EMIT("status.update", msg="Deduplication enabled but no key selected; continuing without dedupe.")
+                emit("status.update", msg="Deduplication enabled but no key selected; continuing without dedupe.")
                 dedupe_enabled = False
             elif dedupe_key not in headers:
-                EMIT("status.update", msg=f"Deduplication key '{dedupe_key}' not found in headers; continuing without dedupe.")
+                emit("status.update", msg=f"Deduplication key '{dedupe_key}' not found in headers; continuing without dedupe.")
                 dedupe_enabled = False
 
     # Prepare output interface and processing
-    out_path = Path(output_path_override) if output_path_override else _build_output_path(path)
+    out_path = (
+        Path(output_path_override)
+        if output_path_override
+        else build_output_path(path, output_compression)
+    )
     output_iface = _create_output_interface_like(input_iface)
-    total_processed = 0
+    # The configured delimiter and encoding apply to the output, not only to reading
+    if hasattr(output_iface, "set_encoding"):
+        output_iface.set_encoding(csv_encoding)
+    if hasattr(output_iface, "set_delimiter"):
+        output_iface.set_delimiter(csv_delim)
     total_rows = _estimate_total_rows(input_iface)
 
-    EMIT("status.update", msg=f"Processing: {Path(path).name} -> {out_path.name}")
+    emit("status.update", msg=f"Processing: {Path(path).name} -> {out_path.name}")
 
-    any_data = False
     start_time = time.time()
     try:
-        # If dedupe is enabled, aggregate across chunks then map once; else stream-map per chunk
-        if dedupe_enabled:
-            required_sources = list(_collect_all_sources(mapping))
-            # Ensure key is available for building the aggregated frame
-            if dedupe_key and dedupe_key not in required_sources:
-                required_sources.append(dedupe_key)
-
-            if dedupe_strategy == "drop":
-                seen_keys: Set[Any] = set()
-                buffered_parts: List[pd.DataFrame] = []
-                for chunk in input_iface.iter_load(chunksize=configured_chunk):
-                    if _cancel_event.is_set():
-                        EMIT("status.update", msg="Processing canceled by user.")
-                        break
-                    if dedupe_key not in chunk.columns:
-                        # Fallback to simple mapping for this chunk
-                        out_chunk = apply_mapping(chunk, mapping)
-                        if not out_chunk.columns.empty:
-                            any_data = True
-                            try:
-                                if hasattr(output_iface, "_delimiter"):
-                                    try:
-                                        setattr(output_iface, "_delimiter", csv_delim)
-                                    except Exception:
-                                        pass
-                                output_iface.append_df(out_chunk)
-                            except Exception:
-                                if getattr(output_iface, "_df", None) is None:
-                                    output_iface._df = out_chunk.copy()  # type: ignore[attr-defined]
-                                else:
-                                    output_iface._df = pd.concat([output_iface._df, out_chunk], ignore_index=True)  # type: ignore[attr-defined]
-                    else:
-                        c = chunk
-                        c = c[c[dedupe_key].notna()]
-                        if seen_keys:
-                            c = c[~c[dedupe_key].isin(seen_keys)]
-                        if not c.empty:
-                            # keep first per key in this chunk
-                            c = c.drop_duplicates(subset=[dedupe_key], keep="first")
-                            # select only columns that exist to avoid KeyError
-                            existing_cols = [col for col in required_sources if col in c.columns]
-                            part = c[existing_cols].copy()
-                            seen_keys.update(part[dedupe_key].tolist())
-                            buffered_parts.append(part)
-                    total_processed += len(chunk)
-                    # progress update
-                    if total_rows > 0:
-                        pctf = min(99.0, max(1.0, (total_processed * 95) / max(1, total_rows)) + 5.0)
-                    else:
-                        pctf = min(99.0, 5.0 + (total_processed // max(1, configured_chunk)))
-                    EMIT("progress.update", value=int(pctf))
-                # Finalize
-                if buffered_parts:
-                    any_data = True
-                    agg_df = pd.concat(buffered_parts, ignore_index=True)
-                    out_df = apply_mapping(agg_df, mapping)
-                    try:
-                        if hasattr(output_iface, "_delimiter"):
-                            try:
-                                setattr(output_iface, "_delimiter", csv_delim)
-                            except Exception:
-                                pass
-                        output_iface.append_df(out_df)
-                    except Exception:
-                        if getattr(output_iface, "_df", None) is None:
-                            output_iface._df = out_df.copy()  # type: ignore[attr-defined]
-                        else:
-                            output_iface._df = pd.concat([output_iface._df, out_df], ignore_index=True)  # type: ignore[attr-defined]
-            else:  # concat strategy
-                # aggregator: key -> col -> list[str]
-                agg: Dict[Any, Dict[str, List[str]]] = {}
-                def _merge_lists(base: List[str], incoming: List[str]) -> List[str]:
-                    if not base:
-                        base = []
-                    seen = set(base)
-                    for v in incoming:
-                        if v not in seen:
-                            seen.add(v)
-                            base.append(v)
-                    return base
-
-                def _unique_str_list(series: pd.Series) -> List[str]:
-                    out: List[str] = []
-                    seen: Set[str] = set()
-                    # Preserve order; treat NaN/empty as skip
-                    for v in series:
-                        if pd.isna(v):
-                            continue
-                        s = str(v)
-                        if not s:
-                            continue
-                        if s not in seen:
-                            seen.add(s)
-                            out.append(s)
-                    return out
-
-                for chunk in input_iface.iter_load(chunksize=configured_chunk):
-                    if _cancel_event.is_set():
-                        EMIT("status.update", msg="Processing canceled by user.")
-                        break
-                    if dedupe_key not in chunk.columns:
-                        # Fallback to simple mapping for this chunk
-                        out_chunk = apply_mapping(chunk, mapping)
-                        if not out_chunk.columns.empty:
-                            any_data = True
-                            try:
-                                if hasattr(output_iface, "_delimiter"):
-                                    try:
-                                        setattr(output_iface, "_delimiter", csv_delim)
-                                    except Exception:
-                                        pass
-                                output_iface.append_df(out_chunk)
-                            except Exception:
-                                if getattr(output_iface, "_df", None) is None:
-                                    output_iface._df = out_chunk.copy()  # type: ignore[attr-defined]
-                                else:
-                                    output_iface._df = pd.concat([output_iface._df, out_chunk], ignore_index=True)  # type: ignore[attr-defined]
-                    else:
-                        c = chunk
-                        c = c[c[dedupe_key].notna()]
-                        if not c.empty:
-                            # group within chunk to reduce operations
-                            present_cols = [col for col in required_sources if col != dedupe_key and col in c.columns]
-                            agg_map = {col: _unique_str_list for col in present_cols}
-                            if agg_map:
-                                grouped = c.groupby(dedupe_key, sort=False, dropna=False).agg(agg_map)
-                                # ensure keys are index; combine
-                                for key_val, row in grouped.iterrows():
-                                    row_dict = row.to_dict()
-                                    if key_val not in agg:
-                                        agg[key_val] = {col: [] for col in required_sources if col != dedupe_key}
-                                    for col, lst in row_dict.items():
-                                        # lst may be scalar if col missing; normalize
-                                        if isinstance(lst, list):
-                                            agg[key_val][col] = _merge_lists(agg[key_val].get(col, []), lst)
-                                        else:
-                                            s = str(lst)
-                                            if s:
-                                                agg[key_val][col] = _merge_lists(agg[key_val].get(col, []), [s])
-                    total_processed += len(chunk)
-                    # progress update
-                    if total_rows > 0:
-                        pctf = min(99.0, max(1.0, (total_processed * 95) / max(1, total_rows)) + 5.0)
-                    else:
-                        pctf = min(99.0, 5.0 + (total_processed // max(1, configured_chunk)))
-                    EMIT("progress.update", value=int(pctf))
-                # Finalize concat aggregation
-                if agg:
-                    any_data = True
-                    rows: List[Dict[str, Any]] = []
-                    for key_val, cols_map in agg.items():
-                        rec: Dict[str, Any] = {dedupe_key: key_val}
-                        for col in required_sources:
-                            if col == dedupe_key:
-                                continue
-                            joined = dedupe_concat_sep.join(cols_map.get(col, []))
-                            rec[col] = joined
-                        rows.append(rec)
-                    agg_df = pd.DataFrame(rows)
-                    # Ensure columns present even if empty
-                    for col in required_sources:
-                        if col not in agg_df.columns:
-                            agg_df[col] = ""
-                    out_df = apply_mapping(agg_df, mapping)
-                    try:
-                        if hasattr(output_iface, "_delimiter"):
-                            try:
-                                setattr(output_iface, "_delimiter", csv_delim)
-                            except Exception:
-                                pass
-                        output_iface.append_df(out_df)
-                    except Exception:
-                        if getattr(output_iface, "_df", None) is None:
-                            output_iface._df = out_df.copy()  # type: ignore[attr-defined]
-                        else:
-                            output_iface._df = pd.concat([output_iface._df, out_df], ignore_index=True)  # type: ignore[attr-defined]
-        else:
-            # Try chunked processing if available
-            for chunk in input_iface.iter_load(chunksize=configured_chunk):
-                if _cancel_event.is_set():
-                    EMIT("status.update", msg="Processing canceled by user.")
-                    break
-                out_chunk = apply_mapping(chunk, mapping)
-                # Validate columns quickly
-                if out_chunk.columns.empty:
-                    continue
-                any_data = True
-                try:
-                    # Pass delimiter preference to CSV output if supported
-                    if hasattr(output_iface, "_delimiter"):
-                        try:
-                            setattr(output_iface, "_delimiter", csv_delim)
-                        except Exception:
-                            pass
-                    output_iface.append_df(out_chunk)
-                except Exception:
-                    # Fallback: accumulate locally
-                    if getattr(output_iface, "_df", None) is None:
-                        output_iface._df = out_chunk.copy()  # type: ignore[attr-defined]
-                    else:
-                        output_iface._df = pd.concat([output_iface._df, out_chunk], ignore_index=True)  # type: ignore[attr-defined]
-                total_processed += len(chunk)
-                # Emit coarse progress using available total_rows
-                if total_rows > 0:
-                    pctf = min(99.0, max(1.0, (total_processed * 95) / max(1, total_rows)) + 5.0)
-                else:
-                    pctf = min(99.0, 5.0 + (total_processed // max(1, configured_chunk)))
-                EMIT("progress.update", value=int(pctf))
+        if hasattr(output_iface, "open"):
+            # Stream into the target as chunks arrive instead of writing it all on save
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            output_iface.open(out_path.as_posix())
+        pipeline = _build_pipeline(
+            input_iface,
+            output_iface,
+            mapping,
+            chunksize=configured_chunk,
+            total_rows=total_rows,
+            delimiter=csv_delim,
+            dedupe_key=dedupe_key if dedupe_enabled else None,
+            dedupe_strategy=dedupe_strategy,
+            dedupe_concat_sep=dedupe_concat_sep,
+            emit=emit,
+            cancel_event=cancel_event,
+        )
+        result = pipeline.run()
+        total_processed = result.rows_read
 
         # If canceled, still try to save partial output if any
-        if not any_data:
+        if not result.any_data:
             # Write empty file with headers derived from mapping
-            empty = pd.DataFrame(columns=_compute_output_columns(mapping))
-            try:
-                output_iface.append_df(empty)
-            except Exception:
-                output_iface._df = empty  # type: ignore[attr-defined]
+            pipeline.sink.write(pd.DataFrame(columns=_compute_output_columns(mapping)))
 
         # Save to output
         try:
@@ -420,36 +372,71 @@ def _run_processing(current: Dict[str, Any]) -> None:
             # For CSV outputs, many interfaces have save_as(file_path) signature
             output_iface.save_as(out_path.as_posix())
         except Exception as e:
-            EMIT("status.update", msg=f"Failed to save output: {e}")
-            EMIT("processing.error", msg=str(e))
+            _discard_output(output_iface)
+            emit("status.update", msg=f"Failed to save output: {e}")
+            emit("processing.error", msg=str(e))
             return
 
         elapsed = time.time() - start_time
         throughput = (total_processed / elapsed) if elapsed > 0 else 0
-        # Persist metrics to state for UI or future runs
-        try:
-            state.update_control("processing.last_elapsed", elapsed)
-            state.update_control("processing.last_throughput", throughput)
-        except Exception:
-            pass
-
-        if _cancel_event.is_set():
-            EMIT("progress.update", value=100)
-            EMIT("processing.canceled", path=out_path.as_posix())
+        record(
+            source=path,
+            rows=total_processed,
+            elapsed=elapsed,
+            throughput=throughput,
+            stage_seconds={m.name: m.seconds for m in result.metrics},
+        )
+
+        if cancel_event.is_set():
+            emit("progress.update", value=100)
+            emit("processing.canceled", path=out_path.as_posix())
             return
 
-        EMIT("progress.update", value=100)
-        EMIT("status.update", msg=f"Done. Rows: {total_processed}. Wrote: {out_path}")
-        EMIT("processing.complete", path=out_path.as_posix(), elapsed=elapsed, throughput=throughput)
+        emit("progress.update", value=100)
+        emit("status.update", msg=f"Done. Rows: {total_processed}. Wrote: {out_path}")
+        emit("processing.complete", path=out_path.as_posix(), elapsed=elapsed, throughput=throughput)
     except Exception as e:
-        EMIT("status.update", msg=f"Processing error: {e}")
-        EMIT("processing.error", msg=str(e))
+        _discard_output(output_iface)
+        emit("status.update", msg=f"Processing error: {e}")
+        emit("processing.error", msg=str(e))
+
+
+def _discard_output(output_iface: Any) -> None:
+    """Remove what a streaming output has written so far, if it supports that."""
+    discard = getattr(output_iface, "discard", None)
+    if discard is not None:
+        try:
+            discard()
+        except Exception:
+            pass
 
 
 def _on_processing_start(sender: Any, **kwargs: Any) -> None:
     current = state.controls.get("processing.current") or {}
+    isolated = state.get_bool("processing.isolate")
+    memory_limit_mb = state.get_int("processing.memory_limit_mb") or None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        # Inside the GUI's (qasync) loop: run as a task so handlers run on the loop
+        from src.table_modifier.processing.aio import ProcessingJob, run_job
+
+        task = loop.create_task(
+            run_job(ProcessingJob(current, isolated=isolated, memory_limit_mb=memory_limit_mb))
+        )
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+        return
+    if isolated:
+        from src.table_modifier.processing.worker import run_in_process
+
+        target: Callable[..., None] = partial(run_in_process, memory_limit_mb=memory_limit_mb)
+    else:
+        target = _run_processing
     # Run in background thread to avoid blocking UI
-    t = threading.Thread(target=_run_processing, args=(current,), daemon=True)
+    t = threading.Thread(target=target, args=(current,), daemon=True)
     t.start()
 
 
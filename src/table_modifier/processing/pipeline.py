@@ -0,0 +1,363 @@
+"""Composable chunk pipeline used by the processing engine.
+
+A pipeline pulls DataFrame chunks from a source, threads them through a list of
+stages and hands the result to a sink:
+
+    source -> projection -> dedupe -> transform -> sink
+
+Every stage is a generator transformer (``process(chunks) -> chunks``), so stages
+can be swapped, reordered or benchmarked on their own. Progress reporting,
+cancellation and per-stage timings are handled once, by the pipeline itself.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import pandas as pd
+
+from src.table_modifier.processing.transform import apply_mapping
+from src.table_modifier.signals import EMIT, Throttle
+
+Chunks = Iterator[pd.DataFrame]
+
+
+@dataclass
+class StageMetrics:
+    """Counters collected for a single stage while the pipeline runs."""
+
+    name: str
+    chunks: int = 0
+    rows: int = 0
+    # Time spent inside this stage, excluding time spent in upstream stages
+    seconds: float = 0.0
+
+
+@dataclass
+class PipelineResult:
+    rows_read: int = 0
+    any_data: bool = False
+    canceled: bool = False
+    metrics: List[StageMetrics] = field(default_factory=list)
+
+
+class Stage:
+    """Base class for pipeline stages: transform a stream of chunks into another."""
+
+    name = "stage"
+
+    def process(self, chunks: Chunks) -> Chunks:
+        raise NotImplementedError
+
+
+class SourceStage(Stage):
+    """Read chunks from a file interface."""
+
+    name = "source"
+
+    def __init__(self, iface: Any, chunksize: int) -> None:
+        self.iface = iface
+        self.chunksize = chunksize
+
+    def process(self, chunks: Optional[Chunks] = None) -> Chunks:
+        yield from self.iface.iter_load(chunksize=self.chunksize)
+
+
+class ProjectionStage(Stage):
+    """Keep only the columns later stages need (missing ones are ignored)."""
+
+    name = "projection"
+
+    def __init__(self, columns: List[str]) -> None:
+        self.columns = list(dict.fromkeys(columns))
+
+    def process(self, chunks: Chunks) -> Chunks:
+        for chunk in chunks:
+            yield chunk[[c for c in self.columns if c in chunk.columns]]
+
+
+class TransformStage(Stage):
+    """Apply the structured column mapping to every chunk."""
+
+    name = "transform"
+
+    def __init__(self, mapping: List[Dict[str, Any]]) -> None:
+        self.mapping = mapping
+
+    def process(self, chunks: Chunks) -> Chunks:
+        for chunk in chunks:
+            out = apply_mapping(chunk, self.mapping)
+            if not out.columns.empty:
+                yield out
+
+
+class DedupeDropStage(Stage):
+    """Keep the first row per key across all chunks.
+
+    Rows with a missing key are dropped; chunks lacking the key column pass through
+    unchanged. Deduplicated rows are emitted once the input is exhausted.
+    """
+
+    name = "dedupe"
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def process(self, chunks: Chunks) -> Chunks:
+        key = self.key
+        seen_keys: Set[Any] = set()
+        buffered_parts: List[pd.DataFrame] = []
+        for chunk in chunks:
+            if key not in chunk.columns:
+                yield chunk
+                continue
+            c = chunk[chunk[key].notna()]
+            if seen_keys:
+                c = c[~c[key].isin(seen_keys)]
+            if not c.empty:
+                # keep first per key in this chunk
+                part = c.drop_duplicates(subset=[key], keep="first").copy()
+                seen_keys.update(part[key].tolist())
+                buffered_parts.append(part)
+        if buffered_parts:
+            yield pd.concat(buffered_parts, ignore_index=True)
+
+
+def _merge_lists(base: List[str], incoming: List[str]) -> List[str]:
+    if not base:
+        base = []
+    seen = set(base)
+    for v in incoming:
+        if v not in seen:
+            seen.add(v)
+            base.append(v)
+    return base
+
+
+def _unique_str_list(series: pd.Series) -> List[str]:
+    out: List[str] = []
+    seen: Set[str] = set()
+    # Preserve order; treat NaN/empty as skip
+    for v in series:
+        if pd.isna(v):
+            continue
+        s = str(v)
+        if not s:
+            continue
+        if s not in seen:
+            seen.add(s)
+            out.append(s)
+    return out
+
+
+class DedupeConcatStage(Stage):
+    """Collapse rows per key, joining the unique values of every other column.
+
+    Chunks lacking the key column pass through unchanged; the aggregated frame is
+    emitted once the input is exhausted.
+    """
+
+    name = "dedupe"
+
+    def __init__(self, key: str, columns: List[str], sep: str = "; ") -> None:
+        self.key = key
+        self.columns = list(columns)
+        self.sep = sep
+
+    def process(self, chunks: Chunks) -> Chunks:
+        key = self.key
+        value_cols = [col for col in self.columns if col != key]
+        # aggregator: key -> col -> list[str]
+        agg: Dict[Any, Dict[str, List[str]]] = {}
+        for chunk in chunks:
+            if key not in chunk.columns:
+                yield chunk
+                continue
+            c = chunk[chunk[key].notna()]
+            if c.empty:
+                continue
+            # group within chunk to reduce operations
+            agg_map = {col: _unique_str_list for col in value_cols if col in c.columns}
+            if not agg_map:
+                continue
+            grouped = c.groupby(key, sort=False, dropna=False).agg(agg_map)
+            for key_val, row in grouped.iterrows():
+                if key_val not in agg:
+                    agg[key_val] = {col: [] for col in value_cols}
+                for col, lst in row.to_dict().items():
+                    # lst may be scalar if col missing; normalize
+                    if isinstance(lst, list):
+                        agg[key_val][col] = _merge_lists(agg[key_val].get(col, []), lst)
+                    else:
+                        s = str(lst)
+                        if s:
+                            agg[key_val][col] = _merge_lists(agg[key_val].get(col, []), [s])
+        if agg:
+            rows: List[Dict[str, Any]] = []
+            for key_val, cols_map in agg.items():
+                rec: Dict[str, Any] = {key: key_val}
+                for col in value_cols:
+                    rec[col] = self.sep.join(cols_map.get(col, []))
+                rows.append(rec)
+            agg_df = pd.DataFrame(rows)
+            # Ensure columns present even if empty
+            for col in self.columns:
+                if col not in agg_df.columns:
+                    agg_df[col] = ""
+            yield agg_df
+
+
+class SinkStage:
+    """Terminal stage writing chunks to an output file interface."""
+
+    name = "sink"
+
+    def __init__(self, output: Any, delimiter: Optional[str] = None) -> None:
+        self.output = output
+        self.any_data = False
+        if delimiter is not None:
+            # Pass delimiter preference to CSV output if supported
+            if hasattr(output, "set_delimiter"):
+                output.set_delimiter(delimiter)
+            elif hasattr(output, "_delimiter"):
+                try:
+                    setattr(output, "_delimiter", delimiter)
+                except Exception:
+                    pass
+
+    def write(self, df: pd.DataFrame) -> None:
+        try:
+            self.output.append_df(df)
+        except Exception:
+            # Fallback: accumulate on the interface's frame directly
+            existing = getattr(self.output, "_df", None)
+            if existing is None:
+                self.output._df = df.copy()
+            else:
+                self.output._df = pd.concat([existing, df], ignore_index=True)
+
+    def consume(self, chunks: Chunks) -> Chunks:
+        for chunk in chunks:
+            self.write(chunk)
+            self.any_data = True
+            yield chunk
+
+
+class ProgressMonitor:
+    """Progress and cancellation for rows pulled from the source.
+
+    Progress is reported in the 5..99 range while running; the caller reports 100
+    once the output has been saved. Updates are throttled, so small chunk sizes
+    don't flood the GUI with one update per chunk.
+    """
+
+    def __init__(
+        self,
+        total_rows: int,
+        chunksize: int,
+        cancel_event: Optional[threading.Event] = None,
+        emit: Callable[..., None] = EMIT,
+        min_interval_ms: int = 100,
+    ) -> None:
+        self.total_rows = total_rows
+        self.chunksize = chunksize
+        self.cancel_event = cancel_event or threading.Event()
+        self.emit = emit
+        self.rows = 0
+        self.canceled = False
+        # Dispatch on 5-point steps, or smaller changes at most every min_interval_ms
+        self._progress = Throttle(
+            "progress.update",
+            min_interval_ms=min_interval_ms,
+            min_delta=5,
+            emit=None if emit is EMIT else emit,
+        )
+
+    def percent(self) -> int:
+        if self.total_rows > 0:
+            pctf = min(99.0, max(1.0, (self.rows * 95) / max(1, self.total_rows)) + 5.0)
+        else:
+            pctf = min(99.0, 5.0 + (self.rows // max(1, self.chunksize)))
+        return int(pctf)
+
+    def track(self, chunks: Chunks) -> Chunks:
+        for chunk in chunks:
+            if self.cancel_event.is_set():
+                self.canceled = True
+                self.emit("status.update", msg="Processing canceled by user.")
+                break
+            yield chunk
+            # Downstream has handled this chunk by the time we resume
+            self.rows += len(chunk)
+            self._progress(value=self.percent())
+        self._progress.flush()
+
+
+class _Timed:
+    """Wrap a stage's output iterator to collect counters and inclusive time."""
+
+    def __init__(self, metrics: StageMetrics, chunks: Chunks) -> None:
+        self.metrics = metrics
+        self.inclusive = 0.0
+        self._chunks = chunks
+
+    def __iter__(self) -> Chunks:
+        it = iter(self._chunks)
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(it)
+            except StopIteration:
+                self.inclusive += time.perf_counter() - start
+                return
+            self.inclusive += time.perf_counter() - start
+            self.metrics.chunks += 1
+            self.metrics.rows += len(chunk)
+            yield chunk
+
+
+class Pipeline:
+    """Source + stages + sink, driven chunk by chunk."""
+
+    def __init__(
+        self,
+        source: Stage,
+        stages: List[Stage],
+        sink: SinkStage,
+        monitor: Optional[ProgressMonitor] = None,
+    ) -> None:
+        self.source = source
+        self.stages = list(stages)
+        self.sink = sink
+        self.monitor = monitor
+
+    def run(self) -> PipelineResult:
+        timed: List[_Timed] = []
+
+        def wrap(name: str, chunks: Chunks) -> Chunks:
+            t = _Timed(StageMetrics(name), chunks)
+            timed.append(t)
+            return iter(t)
+
+        stream: Chunks = wrap(self.source.name, self.source.process())
+        if self.monitor is not None:
+            stream = wrap("progress", self.monitor.track(stream))
+        for stage in self.stages:
+            stream = wrap(stage.name, stage.process(stream))
+        stream = wrap(self.sink.name, self.sink.consume(stream))
+        for _ in stream:
+            pass
+
+        # Convert inclusive (nested generator) time into per-stage time
+        upstream = 0.0
+        for t in timed:
+            t.metrics.seconds = max(0.0, t.inclusive - upstream)
+            upstream = t.inclusive
+
+        return PipelineResult(
+            rows_read=self.monitor.rows if self.monitor is not None else timed[0].metrics.rows,
+            any_data=self.sink.any_data,
+            canceled=self.monitor.canceled if self.monitor is not None else False,
+            metrics=[t.metrics for t in timed],
+        )
@@ -0,0 +1,102 @@
+"""Incremental mapping preview over a small cached sample of a source.
+
+The map screen shows what the output will look like while headers are being
+dragged. Rather than re-reading the file and re-running ``apply_mapping`` on
+every change, a sample of the source is read once (per source and skip rows)
+and each output column is memoized by its slot's sources and separator. A
+change to one slot therefore recomputes only that column; reordering slots or
+adding a column recomputes nothing that was already shown.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.table_modifier.processing.engine import apply_skip_rows
+from src.table_modifier.processing.transform import combine_sources, mapping_column_name
+
+# Rows read from a source for previewing
+PREVIEW_ROWS = 50
+# Samples kept in memory (one per source and skip rows)
+MAX_CACHED_SAMPLES = 16
+
+SlotKey = Tuple[Tuple[str, ...], str]
+
+
+def slot_key(entry: Dict[str, Any]) -> SlotKey:
+    """Memoization key of a mapping entry: what its output column depends on."""
+    return tuple(entry.get("sources") or []), entry.get("separator") or " "
+
+
+class SampleCache:
+    """LRU cache of source samples by key (e.g. source id and skip rows)."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_SAMPLES) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the sample for key, calling loader on a miss."""
+        with self._lock:
+            sample = self._entries.get(key)
+            if sample is not None:
+                self._entries.move_to_end(key)
+                return sample
+        sample = loader().reset_index(drop=True)
+        with self._lock:
+            self._entries[key] = sample
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return sample
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class MappingPreview:
+    """apply_mapping over a fixed sample, memoized per mapping slot."""
+
+    def __init__(self, sample: pd.DataFrame) -> None:
+        self.sample = sample
+        self._columns: Dict[SlotKey, pd.Series] = {}
+        # Number of output columns computed so far (cache misses)
+        self.computed = 0
+
+    def column(self, entry: Dict[str, Any]) -> pd.Series:
+        key = slot_key(entry)
+        series = self._columns.get(key)
+        if series is None:
+            sources, sep = key
+            series = combine_sources(self.sample, list(sources), sep)
+            self._columns[key] = series
+            self.computed += 1
+        return series
+
+    def render(self, mapping: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+        """Return the same frame apply_mapping(sample, mapping) would, reusing unchanged columns."""
+        outputs: Dict[str, pd.Series] = {}
+        live: List[SlotKey] = []
+        for i, entry in enumerate(mapping):
+            sources = list(entry.get("sources", []))
+            outputs[mapping_column_name(i, sources)] = self.column(entry)
+            live.append(slot_key(entry))
+        # Forget columns no slot produces any more, so the memo stays small
+        for key in set(self._columns) - set(live):
+            del self._columns[key]
+        if not outputs:
+            return pd.DataFrame(index=self.sample.index)
+        return pd.DataFrame(outputs, index=self.sample.index)
+
+
+def read_sample(iface: Any, skip_rows: Optional[Sequence[int]] = None, rows: int = PREVIEW_ROWS) -> pd.DataFrame:
+    """Read the first rows of iface with skip_rows applied, as the engine would."""
+    apply_skip_rows(iface, list(skip_rows or []))
+    return iface.read_rows(0, rows)
@@ -39,6 +39,11 @@ def combine_sources(df: pd.DataFrame, sources: List[str], sep: str) -> pd.Series
     return out
 
 
+def mapping_column_name(index: int, sources: List[str]) -> str:
+    """Output column name of mapping entry index: its source, or "Combined_{index+1}"."""
+    return sources[0] if len(sources) == 1 else f"Combined_{index+1}"
+
+
 def apply_mapping(df: pd.DataFrame, mapping: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     Given a DataFrame and a structured mapping:
@@ -56,7 +61,7 @@ def apply_mapping(df: pd.DataFrame, mapping: List[Dict[str, Any]]) -> pd.DataFra
     for i, entry in enumerate(mapping):
         sources = list(entry.get("sources", []))
         sep = entry.get("separator") or " "
-        col_name = sources[0] if len(sources) == 1 else f"Combined_{i+1}"
+        col_name = mapping_column_name(i, sources)
         outputs[col_name] = combine_sources(df, sources, sep)
     if not outputs:
         return pd.DataFrame(index=df.index)
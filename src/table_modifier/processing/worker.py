@@ -0,0 +1,135 @@
+"""Run processing jobs in a separate worker process.
+
+The engine runs unchanged in a spawned child process; its events and run
+metrics are sent back over a pipe and re-emitted by the calling thread. A job
+that exhausts memory, crashes the interpreter or is canceled only takes down
+the worker, and pandas work never competes with the GUI for the GIL.
+
+On platforms with ``resource`` (POSIX) the worker's address space can be capped
+per job; allocations beyond the cap fail with MemoryError inside the worker.
+"""
+
+import logging
+import multiprocessing
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from src.table_modifier.config.state import state
+from src.table_modifier.signals import EMIT
+
+try:
+    import resource  # type: ignore
+except Exception:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# How often the parent checks for cancellation while waiting for messages
+POLL_INTERVAL_S = 0.1
+
+
+def _worker_controls() -> Dict[str, Any]:
+    """The engine's settings, copied into the worker (which has its own State)."""
+    return {k: v for k, v in state.controls.items() if k.startswith(("processing.", "excel."))}
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]) -> None:
+    if not memory_limit_mb or resource is None:
+        return
+    limit = int(memory_limit_mb) * 1024 * 1024
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError) as e:
+        logger.warning("Could not limit worker memory to %d MB: %s", memory_limit_mb, e)
+
+
+def _worker_main(conn: Any, current: Dict[str, Any], controls: Dict[str, Any], memory_limit_mb: Optional[int]) -> None:
+    """Child process entry point: run the job and stream everything back."""
+    from src.table_modifier.processing import engine
+
+    _apply_memory_limit(memory_limit_mb)
+    state.controls = controls
+
+    def emit(name: str, **kwargs: Any) -> None:
+        conn.send(("event", name, kwargs))
+
+    def record(**kwargs: Any) -> None:
+        conn.send(("metrics", None, kwargs))
+
+    try:
+        engine._run_processing(current, emit=emit, cancel_event=threading.Event(), record=record)
+    except MemoryError:
+        emit("status.update", msg="Processing ran out of memory.")
+        emit("processing.error", msg="Out of memory")
+    finally:
+        conn.send(("done", None, {}))
+        conn.close()
+
+
+def run_in_process(
+    current: Dict[str, Any],
+    emit: Callable[..., None] = EMIT,
+    cancel_event: Optional[threading.Event] = None,
+    memory_limit_mb: Optional[int] = None,
+    record: Optional[Callable[..., None]] = None,
+) -> None:
+    """Run one job in a worker process, blocking until it ends.
+
+    Drop-in for ``engine._run_processing``: events are re-emitted through emit
+    from the calling thread. Setting cancel_event kills the worker; no partial
+    output is written in that case.
+    """
+    from src.table_modifier.processing import engine
+
+    if cancel_event is None:
+        engine.clear_cancel()
+        cancel_event = engine._cancel_event
+    record = record or engine._record_metrics
+    ctx = multiprocessing.get_context("spawn")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_worker_main,
+        args=(send_conn, current, _worker_controls(), memory_limit_mb),
+        name="ProcessingWorker",
+        daemon=True,
+    )
+    with engine._active_lock:
+        engine._active_cancel_events.add(cancel_event)
+    try:
+        proc.start()
+        send_conn.close()  # the child holds the only writer, so EOF means it exited
+        finished = False
+        while not finished:
+            if cancel_event.is_set():
+                proc.kill()
+                proc.join()
+                emit("status.update", msg="Processing canceled by user.")
+                emit("processing.canceled", path=None)
+                return
+            if not recv_conn.poll(POLL_INTERVAL_S):
+                continue
+            try:
+                kind, name, kwargs = recv_conn.recv()
+            except EOFError:
+                break
+            if kind == "event":
+                emit(name, **kwargs)
+            elif kind == "metrics":
+                record(**kwargs)
+            elif kind == "done":
+                finished = True
+        proc.join()
+        if not finished:
+            code = proc.exitcode
+            emit("status.update", msg=f"Processing worker exited unexpectedly (exit code {code}).")
+            emit("processing.error", msg=f"Worker exited with code {code}")
+    finally:
+        recv_conn.close()
+        if proc.is_alive():
+            proc.kill()
+            proc.join()
+        with engine._active_lock:
+            engine._active_cancel_events.discard(cancel_event)
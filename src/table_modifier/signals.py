@@ -1,12 +1,163 @@
-import inspect
 import logging
+import heapq
+import itertools
+import sys
 import threading
+import time
 from collections import defaultdict
-from typing import Callable, Dict, List, Optional, Any
+from types import FrameType
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from blinker import Signal
 
 
 DEFAULT_DEBOUNCE_MS = 500
+DEFAULT_THROTTLE_MS = 100
+
+
+class _LazySender:
+    """Sender identifier resolved from the caller's frame on first use.
+
+    Most handlers ignore the sender, so the stack walk is deferred until the
+    sender is actually formatted or compared. The frame is released once resolved.
+    """
+
+    __slots__ = ("_frame", "_value")
+
+    def __init__(self, frame: Optional[FrameType]) -> None:
+        self._frame = frame
+        self._value: Optional[str] = None
+
+    def resolve(self) -> str:
+        if self._value is None:
+            self._value = _describe_caller(self._frame)
+            self._frame = None
+        return self._value
+
+    def __str__(self) -> str:
+        return self.resolve()
+
+    def __repr__(self) -> str:
+        return repr(self.resolve())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazySender):
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __hash__(self) -> int:
+        return hash(self.resolve())
+
+    def __getattr__(self, item: str) -> Any:
+        # Behave like the resolved string for str methods (split, startswith, ...)
+        return getattr(self.resolve(), item)
+
+
+def _describe_caller(frame: Optional[FrameType]) -> str:
+    """Return 'module:Class.method' for the first frame outside this module."""
+    skip_funcs = {"emit", "EMIT"}
+    f = frame
+    while f:
+        mod_name = f.f_globals.get("__name__")
+        if mod_name != __name__ and f.f_code.co_name not in skip_funcs:
+            break
+        f = f.f_back
+    if f is None:
+        return "unknown"
+    mod_name = f.f_globals.get("__name__") or "unknown_module"
+    func_name = f.f_code.co_name
+    self_obj = f.f_locals.get("self")
+    if self_obj:
+        return f"{mod_name}:{type(self_obj).__name__}.{func_name}"
+    return f"{mod_name}:{func_name}"
+
+
+class _WildcardTrie:
+    """Prefix trie of 'x.y.*' subscriptions keyed by dotted name segments."""
+
+    __slots__ = ("children", "handlers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_WildcardTrie"] = {}
+        self.handlers: List[Callable] = []
+
+    def add(self, segments: List[str], handlers: List[Callable]) -> None:
+        node = self
+        for seg in segments:
+            node = node.children.setdefault(seg, _WildcardTrie())
+        node.handlers.extend(handlers)
+
+    def match(self, name: str) -> List[Callable]:
+        """Handlers of every 'prefix.*' pattern where name starts with 'prefix.'."""
+        out: List[Callable] = []
+        segments = name.split(".")
+        node = self
+        # The last segment is what '*' stands for, so it is never a prefix
+        for seg in segments[:-1]:
+            node = node.children.get(seg)  # type: ignore[assignment]
+            if node is None:
+                break
+            out.extend(node.handlers)
+        return out
+
+
+class _Scheduler:
+    """One daemon thread serving every delayed callback from a heap.
+
+    Callbacks scheduled under a key replace the pending callback for that key:
+    with restart=True the deadline is pushed back (debounce), otherwise the
+    original deadline is kept and only the callback is swapped (coalesce).
+    """
+
+    def __init__(self, name: str = "EventBusScheduler") -> None:
+        self._name = name
+        self._cond = threading.Condition()
+        # heap of [due, seq, key, callback]; callback None marks a cancelled entry
+        self._heap: List[List[Any]] = []
+        self._by_key: Dict[Any, List[Any]] = {}
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def schedule(
+        self, delay_s: float, callback: Callable[[], None], key: Optional[Any] = None, restart: bool = False
+    ) -> None:
+        with self._cond:
+            now = time.monotonic()
+            pending = self._by_key.get(key) if key is not None else None
+            if pending is not None and not restart:
+                pending[3] = callback
+                return
+            if pending is not None:
+                pending[3] = None
+            entry = [now + delay_s, next(self._seq), key, callback]
+            heapq.heappush(self._heap, entry)
+            if key is not None:
+                self._by_key[key] = entry
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return sum(1 for e in self._heap if e[3] is not None)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout)
+                entry = heapq.heappop(self._heap)
+                key, callback = entry[2], entry[3]
+                if key is not None and self._by_key.get(key) is entry:
+                    del self._by_key[key]
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as e:
+                self._logger.error(f"Error in scheduled callback: {e}", exc_info=True)
 
 
 class EventBus:
@@ -14,6 +165,10 @@ class EventBus:
 
     Handlers receive the following call signature:
         handler(sender, signal: str, **kwargs) -> None
+
+    Handler lookups are cached per signal name and invalidated on subscribe and
+    unsubscribe; 'x.y.*' subscriptions are resolved through a prefix trie. The
+    sender, when not given, is inferred lazily from the call stack.
     """
 
     def __init__(self) -> None:
@@ -22,60 +177,109 @@ class EventBus:
         self._lock = threading.RLock()
         self._last_emit_time: Dict[str, float] = {}
         self._logger = logging.getLogger(self.__class__.__name__)
+        # name -> (exact signal, wildcard handlers); cleared on on/off
+        self._resolved: Dict[str, Tuple[Optional[Signal], Tuple[Callable, ...]]] = {}
+        self._trie: Optional[_WildcardTrie] = None
+        self._scheduler = _Scheduler()
 
     def _get_signal(self, name: str) -> Signal:
         with self._lock:
             if name not in self._signals:
                 self._signals[name] = Signal(name)
+                self._resolved.pop(name, None)
             return self._signals[name]
 
+    def _invalidate(self) -> None:
+        self._resolved = {}
+        self._trie = None
+
+    def _build_trie(self) -> _WildcardTrie:
+        trie = _WildcardTrie()
+        for pattern, handlers in self._wildcard_map.items():
+            if pattern.endswith(".*") and handlers:
+                trie.add(pattern[:-2].split("."), handlers)
+        return trie
+
+    def _resolve(self, name: str) -> Tuple[Optional[Signal], Tuple[Callable, ...]]:
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+        with self._lock:
+            if self._trie is None:
+                self._trie = self._build_trie()
+            wildcard_handlers = self._trie.match(name)
+            # Patterns ending in '*' without a dot only match themselves literally
+            if name.endswith("*") and not name.endswith(".*"):
+                wildcard_handlers.extend(self._wildcard_map.get(name, []))
+            resolved = (self._signals.get(name), tuple(wildcard_handlers))
+            self._resolved[name] = resolved
+        return resolved
+
     def emit(self, name: str, sender: Optional[Any] = None, delay_ms: Optional[int] = None, **kwargs) -> None:
         """
         Emit a namespaced signal, triggering all exact and wildcard matches.
 
+        Delayed emits are coalesced per signal name: emitting again while one is
+        pending replaces its payload but keeps its deadline.
+
         Args:
             name (str): Namespaced signal name, like "auth.user.login".
             sender (Any, optional): Sender object (defaults to inferred).
             delay_ms (Optional[int]): If provided and > 0, schedule emit after this many milliseconds.
             **kwargs: Extra payload delivered to handlers.
         """
-        # Infer sender if not provided, capture now to preserve caller context for delayed emits
-        sender = sender or self._infer_sender()
-
         if delay_ms is not None and delay_ms > 0:
-            self._logger.debug(
-                f"[EventBus] Scheduling delayed emit for '{name}' in {delay_ms}ms with kwargs: {kwargs}"
-            )
-
-            def _delayed_dispatch():
-                try:
-                    self._dispatch(name, sender, kwargs)
-                except Exception as e:
-                    self._logger.error(f"Error during delayed emit for '{name}': {e}", exc_info=True)
-
-            timer = threading.Timer(delay_ms / 1000.0, _delayed_dispatch)
-            timer.daemon = True
-            timer.start()
+            self._schedule(name, sender or self._infer_sender(), delay_ms, kwargs, restart=False)
             return
 
         # Immediate dispatch
-        self._dispatch(name, sender, kwargs)
+        exact_signal, wildcard_handlers = self._resolve(name)
+        if not wildcard_handlers and (exact_signal is None or not exact_signal.receivers):
+            return
+        if not sender:
+            sender = _LazySender(sys._getframe(1))
+        self._dispatch(name, sender, kwargs, (exact_signal, wildcard_handlers))
+
+    def debounce(
+        self, name: str, delay_ms: int = DEFAULT_DEBOUNCE_MS, sender: Optional[Any] = None, **kwargs
+    ) -> None:
+        """
+        Emit name once no further debounce() call for it arrived within delay_ms.
 
-    def _dispatch(self, name: str, sender: Optional[Any], kwargs: Dict[str, Any]) -> None:
+        Each call restarts the wait and replaces the pending payload.
+        """
+        self._schedule(name, sender or self._infer_sender(), delay_ms, kwargs, restart=True)
+
+    def _schedule(
+        self, name: str, sender: Any, delay_ms: int, kwargs: Dict[str, Any], restart: bool
+    ) -> None:
+        self._logger.debug(
+            "[EventBus] Scheduling delayed emit for '%s' in %sms with kwargs: %s", name, delay_ms, kwargs
+        )
+
+        def _delayed_dispatch() -> None:
+            try:
+                self._dispatch(name, sender, kwargs)
+            except Exception as e:
+                self._logger.error(f"Error during delayed emit for '{name}': {e}", exc_info=True)
+
+        self._scheduler.schedule(delay_ms / 1000.0, _delayed_dispatch, key=name, restart=restart)
+
+    def _dispatch(
+        self,
+        name: str,
+        sender: Optional[Any],
+        kwargs: Dict[str, Any],
+        resolved: Optional[Tuple[Optional[Signal], Tuple[Callable, ...]]] = None,
+    ) -> None:
         """Internal: perform the actual dispatch of an already-prepared event."""
-        # To avoid holding lock while dispatching handlers (which could deadlock),
-        # first collect handlers while holding lock, then call outside.
-        with self._lock:
-            exact_signal = self._signals.get(name)
-            wildcard_handlers: List[Callable] = []
-            for pattern, handlers in self._wildcard_map.items():
-                if self._match(name, pattern):
-                    wildcard_handlers.extend(handlers.copy())
+        # Handlers are resolved up front and called without holding the lock
+        exact_signal, wildcard_handlers = resolved or self._resolve(name)
 
         # Dispatch exact handlers
         if exact_signal:
             self._logger.debug(
-                f"[EventBus] Emitting signal '{name}' with sender '{sender}' and kwargs: {kwargs}"
+                "[EventBus] Emitting signal '%s' with sender '%s' and kwargs: %s", name, sender, kwargs
             )
             exact_signal.send(sender, signal=name, **kwargs)
 
@@ -88,7 +292,7 @@ class EventBus:
                     f"Error in wildcard handler for '{name}': {e}", exc_info=True
                 )
 
-        self._logger.debug(f"[EventBus] Handlers for '{name}' emitted successfully.")
+        self._logger.debug("[EventBus] Handlers for '%s' emitted successfully.", name)
 
     def on(self, name: str, handler: Callable) -> Callable[[], None]:
         """
@@ -104,6 +308,7 @@ class EventBus:
         with self._lock:
             if name.endswith("*"):
                 self._wildcard_map[name].append(handler)
+                self._invalidate()
             elif "*" in name:
                 raise ValueError(
                     "Wildcards must end with '*' (e.g., 'x.y.*'). Use 'x.y.*' for wildcard subscriptions."
@@ -128,6 +333,7 @@ class EventBus:
             if "*" in name:
                 if handler in self._wildcard_map.get(name, []):
                     self._wildcard_map[name].remove(handler)
+                    self._invalidate()
             else:
                 signal = self._signals.get(name)
                 if signal:
@@ -147,36 +353,94 @@ class EventBus:
         Returns:
             str: String identifier for the sender (e.g., 'module:Class.method').
         """
-        frame = inspect.currentframe()
-        if frame is None:
-            return "unknown"
-
-        # Walk back until we find the first frame that's not within this module
-        # and not the helper functions 'emit' or global 'EMIT'.
-        skip_funcs = {"emit", "EMIT"}
-        f = frame.f_back
-        while f:
-            func_name = f.f_code.co_name
-            module = inspect.getmodule(f)
-            mod_name = module.__name__ if module else None
-            if mod_name != __name__ and func_name not in skip_funcs:
-                break
-            f = f.f_back
+        return _describe_caller(sys._getframe(1))
 
-        caller_frame = f
-        if caller_frame is None:
-            return "unknown"
 
-        module = inspect.getmodule(caller_frame)
-        mod_name = module.__name__ if module else "unknown_module"
+class Throttle:
+    """Rate-limited emitter for high-frequency signals such as progress updates.
 
-        func_name = caller_frame.f_code.co_name
-        self_obj = caller_frame.f_locals.get("self")
+    A call dispatches only when the tracked value (kwargs[key]) changed by at
+    least min_delta, or changed at all and min_interval_ms passed since the last
+    dispatch. Held-back calls are kept as pending and sent by flush().
 
-        if self_obj:
-            cls_name = type(self_obj).__name__
-            return f"{mod_name}:{cls_name}.{func_name}"
-        return f"{mod_name}:{func_name}"
+    Dispatches use a fixed sender, so no stack walk is done per call.
+
+    Args:
+        name (str): Signal name to emit.
+        min_interval_ms (int): Minimum time between dispatches of small changes.
+        min_delta (float): Change in the tracked value that dispatches immediately.
+        key (str): Name of the tracked keyword argument.
+        emit (Callable, optional): emit(name, **kwargs) to use instead of the global bus.
+        sender (Any, optional): Sender passed to the global bus.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_interval_ms: int = DEFAULT_THROTTLE_MS,
+        min_delta: float = 1.0,
+        key: str = "value",
+        emit: Optional[Callable[..., None]] = None,
+        sender: Optional[Any] = None,
+    ) -> None:
+        self.name = name
+        self.min_interval = min_interval_ms / 1000.0
+        self.min_delta = min_delta
+        self.key = key
+        self._emit = emit
+        self.sender = sender or f"{__name__}:Throttle[{name}]"
+        self._lock = threading.Lock()
+        self._last_value: Any = None
+        self._last_time = 0.0
+        self._sent_any = False
+        self._pending: Optional[Dict[str, Any]] = None
+
+    def _should_send(self, value: Any, now: float) -> bool:
+        if not self._sent_any:
+            return True
+        if value == self._last_value:
+            return False
+        try:
+            if abs(value - self._last_value) >= self.min_delta:
+                return True
+        except TypeError:
+            # Non-numeric values: any change counts as meaningful
+            return True
+        return now - self._last_time >= self.min_interval
+
+    def __call__(self, **kwargs: Any) -> bool:
+        """Emit kwargs if due; returns True if the signal was dispatched."""
+        now = time.monotonic()
+        with self._lock:
+            value = kwargs.get(self.key)
+            if not self._should_send(value, now):
+                self._pending = kwargs
+                return False
+            self._mark_sent(value, now)
+        self._send(kwargs)
+        return True
+
+    def flush(self) -> bool:
+        """Dispatch the last held-back call, if any; returns True if one was sent."""
+        with self._lock:
+            kwargs = self._pending
+            if kwargs is None:
+                return False
+            self._mark_sent(kwargs.get(self.key), time.monotonic())
+        self._send(kwargs)
+        return True
+
+    def _mark_sent(self, value: Any, now: float) -> None:
+        self._last_value = value
+        self._last_time = now
+        self._sent_any = True
+        self._pending = None
+
+    def _send(self, kwargs: Dict[str, Any]) -> None:
+        if self._emit is not None:
+            self._emit(self.name, **kwargs)
+        else:
+            _event_bus.emit(self.name, sender=self.sender, **kwargs)
 
 
 # Global instance and APIs
@@ -201,6 +465,21 @@ def EMIT(name: str, delay_ms: Optional[int] = None, **kwargs) -> None:
     _event_bus.emit(name, delay_ms=delay_ms, **kwargs)
 
 
+def DEBOUNCE(name: str, delay_ms: int = DEFAULT_DEBOUNCE_MS, **kwargs) -> None:
+    """
+    Emit a signal globally once calls for it have been quiet for delay_ms.
+
+    Args:
+        name (str): The name of the signal to emit.
+        delay_ms (int): Quiet period in milliseconds (defaults to DEFAULT_DEBOUNCE_MS).
+        **kwargs (**Any): Payload of the last call is delivered.
+
+    Returns:
+        None
+    """
+    _event_bus.debounce(name, delay_ms=delay_ms, **kwargs)
+
+
 def ON(name: str, handler: Callable) -> Callable[[], None]:
     """
     Subscribe a handler globally to a signal and return an unsubscribe function.
@@ -42,3 +42,43 @@ def test_state_controls_update_and_get():
     s["beta"] = 3
     assert s.controls["beta"] == 3
 
+
+
+def test_controls_snapshot_is_shared_read_only_and_versioned():
+    s = State()
+    s.update_control("alpha", 1)
+    snap = s.controls
+    v = s.version
+    # Readers get the same object until a writer swaps in a new version
+    assert s.controls is snap
+    with pytest.raises(TypeError):
+        snap["alpha"] = 2  # type: ignore[index]
+    s.update_control("alpha", 2)
+    assert snap["alpha"] == 1
+    assert s.controls["alpha"] == 2
+    assert s.version == v + 1
+
+
+def test_add_existing_control_updates_and_remove():
+    s = State()
+    s.add_control("gamma", 1)
+    s.add_control("gamma", 5)
+    assert s.controls["gamma"] == 5
+    s.remove_control("gamma")
+    assert "gamma" not in s.controls
+    s.remove_control("gamma")  # no error when absent
+    s.controls = {"delta": 1}
+    assert dict(s.controls) == {"delta": 1}
+
+
+def test_typed_accessors():
+    s = State()
+    s["flag"] = 1
+    s["size"] = "500"
+    s["bad"] = "x"
+    s["sep"] = ""
+    s["nested"] = {"a": 1}
+    assert s.get_bool("flag") is True and s.get_bool("missing", True) is True
+    assert s.get_int("size") == 500 and s.get_int("bad", 7) == 7
+    assert s.get_str("sep", ",") == "," and s.get_str("missing") is None
+    assert s.get_mapping("nested")["a"] == 1 and dict(s.get_mapping("flag")) == {}
@@ -0,0 +1,61 @@
+import sys
+import time
+from pathlib import Path
+
+from src.table_modifier.config import setup
+from src.table_modifier.config.state import State
+from src.table_modifier.config.store import StateStore, default_state_store
+
+
+def test_persisted_controls_survive_restart(tmp_path: Path):
+    db = tmp_path / "state.sqlite3"
+    s = State()
+    s.attach_store(StateStore(db, debounce_ms=10_000))
+    s.update_control("map.skip_rows.by_source", {"a.csv": "0-2"})
+    s.update_control("map.mapping.by_source", {"a.csv": [{"sources": ["A"], "separator": " "}]})
+    s.update_control("not.persisted", 1)
+    # Debounced: nothing written until flushed
+    assert not db.exists() or StateStore(db).load_controls() == {}
+    s.maybe_store()
+
+    restarted = State()
+    restarted.update_control("map.order.by_source", {"b.csv": "X"})
+    restarted.attach_store(StateStore(db))
+    assert restarted.controls["map.skip_rows.by_source"] == {"a.csv": "0-2"}
+    assert restarted.get_mapping("map.mapping.by_source")["a.csv"][0]["sources"] == ["A"]
+    assert "not.persisted" not in restarted.controls
+    assert restarted.controls["map.order.by_source"] == {"b.csv": "X"}
+
+
+def test_background_writer_batches_and_deletes(tmp_path: Path):
+    db = tmp_path / "state.sqlite3"
+    store = StateStore(db, debounce_ms=30)
+    s = State()
+    s.attach_store(store)
+    for i in range(20):
+        s.update_control("map.skip_rows.by_source", {"a.csv": str(i)})
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and StateStore(db).load_controls() == {}:
+        time.sleep(0.02)
+    assert StateStore(db).load_controls() == {"map.skip_rows.by_source": {"a.csv": "19"}}
+
+    s.remove_control("map.skip_rows.by_source")
+    store.flush()
+    assert StateStore(db).load_controls() == {}
+
+
+def test_run_history_is_bounded_and_newest_first(tmp_path: Path):
+    store = StateStore(tmp_path / "state.sqlite3", debounce_ms=10_000, max_runs=3)
+    s = State()
+    s.attach_store(store)
+    for i in range(5):
+        s.record_run(f"in{i}.csv", rows=i, elapsed=1.0, throughput=float(i))
+    runs = store.runs(limit=10)
+    assert [r["source"] for r in runs] == ["in4.csv", "in3.csv", "in2.csv"]
+
+
+def test_default_store_falls_back_without_platformdirs(monkeypatch):
+    # A None entry makes the import raise ImportError
+    monkeypatch.setitem(sys.modules, "platformdirs", None)
+    store = default_state_store()
+    assert store.path == setup.FALLBACK_USER_DIR / "data" / "state.sqlite3"
@@ -0,0 +1,64 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run(code: str) -> str:
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return out.stdout.strip()
+
+
+def test_cli_and_factory_import_without_pandas_or_qt():
+    code = (
+        "import sys\n"
+        "import src.table_modifier.cli\n"
+        "import src.table_modifier.config.state\n"
+        "from src.table_modifier.file_interface.factory import FileInterfaceFactory\n"
+        "print(sorted(m for m in ('pandas', 'PyQt6', 'qasync') if m in sys.modules))\n"
+    )
+    assert _run(code) == "[]"
+
+
+def test_handler_is_imported_on_first_matching_file():
+    code = (
+        "import sys\n"
+        "from src.table_modifier.file_interface.factory import FileInterfaceFactory\n"
+        "assert FileInterfaceFactory.can_handle('a.csv.gz')\n"
+        "print('src.table_modifier.file_interface.csv' in sys.modules,"
+        " 'src.table_modifier.file_interface.excel' in sys.modules)\n"
+    )
+    assert _run(code) == "True False"
+
+
+def test_unmatched_file_does_not_import_handlers(tmp_path):
+    notes = tmp_path / "notes.txt"
+    notes.write_text("plain text, not a table\n")
+    code = (
+        "import sys\n"
+        "from src.table_modifier.file_interface.factory import FileInterfaceFactory\n"
+        f"path = {str(notes)!r}\n"
+        "assert not FileInterfaceFactory.can_handle(path)\n"
+        "assert not FileInterfaceFactory.can_handle(path, sniff=True)\n"
+        "try:\n"
+        "    FileInterfaceFactory.create(path)\n"
+        "except ValueError:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('pandas', 'openpyxl',"
+        " 'src.table_modifier.file_interface.csv',"
+        " 'src.table_modifier.file_interface.excel') if m in sys.modules))\n"
+    )
+    assert _run(code) == "[]"
+
+
+def test_detectors_are_instantiated_on_first_use():
+    code = (
+        "from src.table_modifier.classifier import DetectorRegistry\n"
+        "before = len(DetectorRegistry._registry)\n"
+        "after = len(DetectorRegistry.get_detectors())\n"
+        "print(before, after > 0)\n"
+    )
+    assert _run(code) == "0 True"
@@ -1,7 +1,9 @@
+import gc
+import threading
 import time
 from typing import Any, List
 
-from src.table_modifier.signals import EMIT, ON
+from src.table_modifier.signals import DEBOUNCE, EMIT, ON, Throttle
 
 
 def test_emit_with_delay_delivers_later():
@@ -23,3 +25,79 @@ def test_emit_with_delay_delivers_later():
     finally:
         unsub()
 
+
+
+def test_throttle_drops_small_changes_and_flushes_last():
+    sent: List[Any] = []
+    t = Throttle("unit.throttle", min_interval_ms=10_000, min_delta=5,
+                 emit=lambda name, **kw: sent.append(kw["value"]))
+    for v in range(0, 13):
+        t(value=v)
+    # first call, then each 5-point step
+    assert sent == [0, 5, 10]
+    assert t.flush() is True
+    assert sent == [0, 5, 10, 12]
+    assert t.flush() is False
+
+
+def test_throttle_sends_small_changes_after_interval_with_fixed_sender():
+    calls: List[Any] = []
+
+    def handler(sender: Any, signal: str, **kwargs: Any) -> None:
+        calls.append((sender, kwargs["value"]))
+
+    unsub = ON("unit.throttle.bus", handler)
+    try:
+        t = Throttle("unit.throttle.bus", min_interval_ms=20, min_delta=100)
+        assert t(value=1) is True
+        assert t(value=2) is False
+        assert t(value=1) is False  # unchanged from the last dispatch
+        time.sleep(0.03)
+        assert t(value=3) is True
+        assert [v for _, v in calls] == [1, 3]
+        assert all(s == t.sender for s, _ in calls)
+    finally:
+        unsub()
+
+
+def test_delayed_emits_share_one_thread_and_coalesce_by_name():
+    calls: List[Any] = []
+
+    def handler(sender: Any, signal: str, **kwargs: Any) -> None:
+        calls.append(kwargs["payload"])
+
+    unsub = ON("unit.delay.coalesce", handler)
+    try:
+        before = threading.active_count()
+        for i in range(50):
+            EMIT("unit.delay.coalesce", delay_ms=60, payload=i)
+        assert threading.active_count() <= before + 1
+        time.sleep(0.2)
+        # One delivery, carrying the latest payload
+        assert calls == [49]
+    finally:
+        unsub()
+
+
+def test_debounce_restarts_wait_on_each_call():
+    calls: List[Any] = []
+
+    def handler(sender: Any, signal: str, **kwargs: Any) -> None:
+        calls.append((time.monotonic(), kwargs["payload"]))
+
+    unsub = ON("unit.debounce", handler)
+    # A full collection late in a long test run can outlast the 30ms gaps below
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.monotonic()
+        for i in range(3):
+            DEBOUNCE("unit.debounce", delay_ms=60, payload=i)
+            time.sleep(0.03)
+        time.sleep(0.15)
+        assert [p for _, p in calls] == [2]
+        # Last call came ~60ms after the first, so delivery is later than one delay
+        assert calls[0][0] - start >= 0.11
+    finally:
+        gc.enable()
+        unsub()
@@ -31,3 +31,49 @@ def test_off_nonexistent_signal_no_error():
     # And on wildcard
     OFF("no.such.*", handler)
 
+
+
+def test_wildcard_prefix_matching_and_cache_invalidation():
+    from src.table_modifier.signals import EventBus
+
+    bus = EventBus()
+    got = []
+
+    def handler(sender, signal: str, **kwargs):
+        got.append(signal)
+
+    bus.emit("p.q.r")  # resolve and cache before anyone subscribes
+    bus.on("p.q.*", handler)
+    for name in ("p.q", "p.q.r", "p.q.r.s", "p.qq.r"):
+        bus.emit(name)
+    assert got == ["p.q.r", "p.q.r.s"]
+
+    bus.off("p.q.*", handler)
+    got.clear()
+    bus.emit("p.q.r")
+    assert got == []
+
+    bus.on("p.q.r", handler)
+    bus.emit("p.q.r")
+    assert got == ["p.q.r"]
+
+
+def test_sender_is_inferred_lazily_from_caller():
+    from src.table_modifier.signals import EventBus
+
+    bus = EventBus()
+    senders = []
+
+    def handler(sender, signal: str, **kwargs):
+        senders.append(sender)
+
+    bus.on("lazy.sender", handler)
+
+    def emitting_function():
+        bus.emit("lazy.sender")
+
+    emitting_function()
+    assert senders[0] == f"{__name__}:emitting_function"
+    assert str(senders[0]).split(":")[-1] == "emitting_function"
+    bus.emit("lazy.sender", sender="explicit")
+    assert senders[1] == "explicit"
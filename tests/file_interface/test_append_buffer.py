@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.table_modifier.file_interface.base import AppendBuffer
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.factory import save
+
+
+def test_buffer_keeps_order_and_compacts():
+    buf = AppendBuffer(compact_rows=2, compact_frames=2)
+    buf.add_records([{"a": 1}])
+    buf.add_frame(pd.DataFrame({"a": [2, 3]}))
+    buf.add_records([{"a": 4}, {"a": 5}])
+    buf.add_frame(pd.DataFrame({"a": [6]}))
+    assert len(buf) == 6
+    df = buf.materialize(pd.DataFrame({"a": [0]}))
+    assert df["a"].tolist() == [0, 1, 2, 3, 4, 5, 6]
+    assert not buf
+    assert buf.materialize() is None
+
+
+def test_appended_frame_is_isolated_from_later_edits():
+    buf = AppendBuffer()
+    df = pd.DataFrame({"a": [1]})
+    buf.add_frame(df)
+    df.loc[0, "a"] = 99
+    assert buf.materialize()["a"].tolist() == [1]
+
+
+def test_csv_appends_are_combined_on_read_and_dropped_on_load(tmp_path: Path):
+    p = tmp_path / "d.csv"
+    p.write_text("a,b\n1,2\n", encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+    for i in range(3):
+        iface.append_list([{"a": i, "b": i}])
+    iface.append_df(pd.DataFrame({"a": [9], "b": [9]}))
+    assert iface._frame is None
+    assert iface._df["a"].tolist() == [0, 1, 2, 9]
+
+    iface.append_list([{"a": 5, "b": 5}])
+    assert iface.load()["a"].tolist() == [1]
+
+
+def test_factory_save_in_a_loop(tmp_path: Path):
+    out = tmp_path / "out.csv"
+    iface = CSVFileInterface(out.as_posix())
+    for i in range(500):
+        iface.append_list([{"n": i}])
+    save(iface, [{"n": 500}])
+    assert out.read_text(encoding="utf-8").splitlines()[-1] == "500"
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 502
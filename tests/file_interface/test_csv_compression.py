@@ -0,0 +1,130 @@
+import gzip
+import threading
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.table_modifier.file_interface.compression import (
+    open_text,
+    split_compression,
+    write_compression,
+)
+from src.table_modifier.config.state import state
+from src.table_modifier.file_interface.csv import CSVFileInterface, CSVStreamWriter
+from src.table_modifier.file_interface.dialect import CSVDialect
+from src.table_modifier.file_interface.factory import FileInterfaceFactory
+from src.table_modifier.processing import engine
+
+CONTENT = "a,b\n1,2\n3,4\n5,6\n"
+
+
+def test_split_compression():
+    assert split_compression("x.csv") == (".csv", None)
+    assert split_compression("x.v2.CSV.GZ") == (".csv", "gzip")
+    assert split_compression("x.zip") == ("", "zip")
+    assert split_compression("x") == ("", None)
+
+
+def test_gzip_csv_is_handled_and_streamed(tmp_path: Path):
+    p = tmp_path / "data.csv.gz"
+    with gzip.open(p, "wt", encoding="utf-8") as f:
+        f.write(CONTENT)
+    assert CSVFileInterface.can_handle(p.as_posix())
+    iface = FileInterfaceFactory.create(p.as_posix())
+    assert isinstance(iface, CSVFileInterface)
+    assert iface.compression == "gzip"
+    assert iface.get_headers() == ["a", "b"]
+    chunks = list(iface.iter_load(chunksize=2))
+    assert [len(c) for c in chunks] == [2, 1]
+
+
+def test_zstd_roundtrip(tmp_path: Path):
+    pytest.importorskip("zstandard")
+    src = tmp_path / "src.csv"
+    src.write_text(CONTENT, encoding="utf-8")
+    iface = CSVFileInterface(src)
+    iface.load()
+    out = tmp_path / "out.csv.zst"
+    iface.save_as(out.as_posix())
+    back = CSVFileInterface(out)
+    assert back.get_headers() == ["a", "b"]
+    assert back.load()["b"].tolist() == [2, 4, 6]
+
+
+def test_zip_with_single_csv_member(tmp_path: Path):
+    p = tmp_path / "export.zip"
+    with zipfile.ZipFile(p, "w") as zf:
+        zf.writestr("inner.csv", CONTENT)
+    assert CSVFileInterface.can_handle(p.as_posix())
+    iface = CSVFileInterface(p)
+    assert iface.get_headers() == ["a", "b"]
+    assert len(iface.load()) == 3
+    with open_text(p) as f:
+        assert f.readline().strip() == "a,b"
+
+    multi = tmp_path / "multi.zip"
+    with zipfile.ZipFile(multi, "w") as zf:
+        zf.writestr("one.csv", CONTENT)
+        zf.writestr("two.csv", CONTENT)
+    assert not CSVFileInterface.can_handle(multi.as_posix())
+
+
+def test_write_compression_options():
+    assert write_compression("x.csv") is None
+    assert write_compression("x.csv.gz") == "gzip"
+    assert write_compression("x.csv.zst") == {"method": "zstd", "threads": -1}
+    assert write_compression("x.csv.zip") == {"method": "zip", "archive_name": "x.csv"}
+
+
+def test_build_output_path_keeps_or_overrides_compression(tmp_path: Path):
+    assert engine.build_output_path("/d/in.csv.gz").name == "in_processed.csv.gz"
+    assert engine.build_output_path("/d/in.csv.gz", "none").name == "in_processed.csv"
+    assert engine.build_output_path("/d/in.csv", "zstd").name == "in_processed.csv.zst"
+    assert engine.build_output_path("/d/in.zip").name == "in_processed.csv.zip"
+    # Non-CSV outputs ignore the compression preference
+    assert engine.build_output_path("/d/in.xlsx", "gzip").name == "in_processed.xlsx"
+
+
+@pytest.mark.parametrize("name", ["out.csv.gz", "out.csv.zst", "out.csv.zip", "out.csv"])
+def test_stream_writer_writes_chunks_through_the_compressed_stream(tmp_path: Path, name: str):
+    if name.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    target = tmp_path / name
+    writer = CSVStreamWriter(CSVDialect(delimiter=";"))
+    writer.open(target.as_posix())
+    writer.append_df(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+    writer.append_df(pd.DataFrame({"b": ["z"], "a": [3]}))
+    # Nothing is kept in memory, and the target only appears once saved
+    assert writer.rows_written == 3 and not writer._buffered
+    assert not target.exists()
+    writer.save_as(target.as_posix())
+    assert [p.name for p in tmp_path.iterdir()] == [name]
+    with open_text(target) as f:
+        assert f.read() == "a;b\n1;x\n2;y\n3;z\n"
+
+
+def test_engine_streams_compressed_csv_output(tmp_path: Path, monkeypatch):
+    src = tmp_path / "in.csv.gz"
+    with gzip.open(src, "wt", encoding="utf-8") as f:
+        f.write("a,b\n" + "".join(f"{i},v{i}\n" for i in range(10)))
+    writes = []
+    real_write = CSVStreamWriter._write
+    monkeypatch.setattr(CSVStreamWriter, "_write", lambda self, df: writes.append(len(df)) or real_write(self, df))
+    chunk_size = state.controls.get("processing.chunk_size")
+    state.update_control("processing.chunk_size", 4)
+    state.update_control("processing.output_path", None)
+    try:
+        engine._run_processing(
+            {"source": src.as_posix(), "mapping": [{"sources": ["b"]}], "skip_rows": []},
+            emit=lambda *a, **k: None,
+            cancel_event=threading.Event(),
+            record=lambda **k: None,
+        )
+    finally:
+        state.update_control("processing.chunk_size", chunk_size)
+    out = tmp_path / "in_processed.csv.gz"
+    assert writes == [4, 4, 2]
+    with gzip.open(out, "rt", encoding="utf-8") as f:
+        assert f.read().splitlines() == ["b"] + [f"v{i}" for i in range(10)]
@@ -0,0 +1,131 @@
+import codecs
+import gzip
+import os
+import threading
+from pathlib import Path
+
+from src.table_modifier.config.state import state
+from src.table_modifier.file_interface import dialect as dialect_mod
+from src.table_modifier.file_interface.csv import CSVFileInterface, CSVStreamWriter
+from src.table_modifier.file_interface.dialect import CSVDialect, detect_dialect, sniff_dialect
+from src.table_modifier.processing import engine
+
+
+def test_sniff_semicolon_crlf_and_quotes():
+    d = sniff_dialect(b'name;city\r\n"Doe; J";Oslo\r\nAnn;Bergen\r\n')
+    assert d.delimiter == ";"
+    assert d.quotechar == '"'
+    assert d.lineterminator == "\r\n"
+    assert d.has_header
+    assert d.encoding == "utf-8"
+
+
+def test_sniff_bom_backslash_escape_and_headerless():
+    d = sniff_dialect(codecs.BOM_UTF8 + b'id,text\n1,"a \\"b\\" c"\n')
+    assert d.encoding == "utf-8-sig"
+    assert d.escapechar == "\\"
+    assert not d.doublequote
+    assert d.has_header
+    assert not sniff_dialect(b"1,2.5\n3,4\n").has_header
+
+
+def test_sniff_forced_delimiter_and_truncated_sample():
+    d = sniff_dialect(b"a|b,c\n1|2,3\n4|5,", truncated=True, delimiter=",")
+    assert d.delimiter == ","
+    assert sniff_dialect(b"a|b\n1|2\n3|").delimiter == "|"
+
+
+def test_semicolon_file_is_read_as_columns_by_every_path(tmp_path: Path):
+    p = tmp_path / "semi.csv"
+    p.write_bytes(codecs.BOM_UTF8 + "a;b\n1;ö\n2;x\n".encode("utf-8"))
+    iface = CSVFileInterface(p.as_posix())
+
+    assert iface.get_headers() == ["a", "b"]
+    assert list(iface.load().columns) == ["a", "b"]
+    assert list(next(iter(iface.iter_load(chunksize=10))).columns) == ["a", "b"]
+    assert set(iface.get_schema()) == {"a", "b"}
+    assert [df.columns[0] for df in iface.iter_columns(chunksize=10)] == ["a", "b"]
+    assert iface.load()["b"].tolist() == ["ö", "x"]
+
+
+def test_writer_keeps_the_source_dialect(tmp_path: Path):
+    p = tmp_path / "in.csv"
+    p.write_bytes(b"a;b\r\n1;2\r\n")
+    iface = CSVFileInterface(p.as_posix())
+    iface.load()
+    out = tmp_path / "out.csv"
+    iface.save_as(out.as_posix())
+    assert out.read_bytes() == b"a;b\r\n1;2\r\n"
+
+    iface.set_delimiter(",")
+    iface.save_as(out.as_posix())
+    assert out.read_bytes().startswith(b"a,b\r\n")
+
+
+def test_headerless_file_gets_generated_names(tmp_path: Path):
+    p = tmp_path / "nohead.csv"
+    p.write_text("1,2\n3,4\n", encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+    assert iface.get_headers() == ["column_1", "column_2"]
+    df = iface.load()
+    assert list(df.columns) == ["column_1", "column_2"]
+    assert len(df) == 2
+
+
+def test_compressed_file_dialect(tmp_path: Path):
+    p = tmp_path / "data.csv.gz"
+    with gzip.open(p, "wb") as f:
+        f.write(b"a\tb\n1\t2\n")
+    assert detect_dialect(p).delimiter == "\t"
+    assert CSVFileInterface(p.as_posix()).get_headers() == ["a", "b"]
+
+
+def test_detection_is_cached_by_fingerprint(tmp_path: Path, monkeypatch):
+    p = tmp_path / "c.csv"
+    p.write_text("a,b\n1,2\n", encoding="utf-8")
+    calls = []
+    real = dialect_mod.sniff_dialect
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(dialect_mod, "sniff_dialect", counting)
+    dialect_mod.clear_cache()
+    assert detect_dialect(p).delimiter == ","
+    assert CSVFileInterface(p.as_posix()).dialect.delimiter == ","
+    assert len(calls) == 1
+
+    p.write_text("a;b\n1;2\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert detect_dialect(p).delimiter == ";"
+    assert len(calls) == 2
+
+
+def test_missing_file_falls_back_to_defaults(tmp_path: Path):
+    iface = CSVFileInterface((tmp_path / "missing.csv").as_posix(), delimiter=";")
+    assert iface.dialect == CSVDialect(delimiter=";")
+
+
+def test_engine_writes_output_in_the_configured_encoding(tmp_path: Path, monkeypatch):
+    src = tmp_path / "in.csv"
+    src.write_bytes("city;zip\nMalmö;211\nGöteborg;411\n".encode("cp1252"))
+    # An output that knows nothing of the source: the settings must reach it directly
+    monkeypatch.setattr(engine, "_create_output_interface_like", lambda iface: CSVStreamWriter())
+    saved = {k: state.controls.get(k) for k in ("processing.csv_encoding", "processing.csv_delimiter")}
+    state.update_control("processing.csv_encoding", "cp1252")
+    state.update_control("processing.csv_delimiter", ";")
+    state.update_control("processing.output_path", None)
+    try:
+        engine._run_processing(
+            {"source": src.as_posix(), "mapping": [{"sources": ["city"]}, {"sources": ["zip"]}], "skip_rows": []},
+            emit=lambda *a, **k: None,
+            cancel_event=threading.Event(),
+            record=lambda **k: None,
+        )
+    finally:
+        for k, v in saved.items():
+            state.update_control(k, v)
+    out = (tmp_path / "in_processed.csv").read_bytes()
+    assert out == "city;zip\nMalmö;211\nGöteborg;411\n".encode("cp1252")
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+
+from src.table_modifier.config.state import state
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.dialect import (
+    CP1252_FALLBACK,
+    CSVEncodingError,
+    check_encoding,
+    detect_encoding,
+    sniff_dialect,
+)
+from src.table_modifier.processing import engine
+
+
+def test_detect_encoding_by_bom_and_statistics():
+    assert detect_encoding("a,b\nå,ø\n".encode("utf-8")) == "utf-8"
+    assert detect_encoding("a,b\nå,ø\n".encode("utf-16")) == "utf-16"
+    assert detect_encoding("a,b\n1,2\n".encode("utf-16-le")) == "utf-16-le"
+    assert detect_encoding("a;b\nMalmö;€\n".encode("cp1252")) == "cp1252"
+    assert detect_encoding(b"a\n\x81\xe5\n") == "latin-1"
+    # A multi-byte character cut off by the sample boundary is still UTF-8
+    assert detect_encoding("xå".encode("utf-8")[:-1], truncated=True) == "utf-8"
+
+
+def test_utf8_sample_falls_back_to_cp1252_for_stray_bytes():
+    d = sniff_dialect(b"a,b\n1,2\n")
+    assert d.encoding == "utf-8"
+    assert d.encoding_errors == CP1252_FALLBACK
+    assert b"Malm\xf6".decode("utf-8", errors=CP1252_FALLBACK) == "Malmö"
+
+
+def test_check_encoding_fails_on_mismatch():
+    check_encoding("å".encode("utf-8"), "utf-8")
+    with pytest.raises(CSVEncodingError):
+        check_encoding("a\nå\n".encode("cp1252"), "utf-8")
+    with pytest.raises(CSVEncodingError):
+        check_encoding(b"a", "no-such-codec")
+
+
+def test_cp1252_file_reads_without_mojibake(tmp_path: Path):
+    p = tmp_path / "nordic.csv"
+    p.write_bytes("namn;stad\nÅsa;Malmö\nJörg;Århus\n".encode("cp1252"))
+    iface = CSVFileInterface(p.as_posix())
+    assert iface.encoding == "cp1252"
+    assert iface.get_headers() == ["namn", "stad"]
+    chunks = list(iface.iter_load(chunksize=1))
+    assert [c.iloc[0]["stad"] for c in chunks] == ["Malmö", "Århus"]
+
+
+def test_late_legacy_bytes_in_utf8_file(tmp_path: Path):
+    p = tmp_path / "mixed.csv"
+    body = b"".join(b"%d,plain\n" % i for i in range(200_000))
+    p.write_bytes(b"id,city\n" + body + b"200000,Malm\xf6\n")
+    iface = CSVFileInterface(p.as_posix())
+    assert iface.encoding == "utf-8"
+    last = list(iface.iter_load(chunksize=50_000))[-1]
+    assert last.iloc[-1]["city"] == "Malmö"
+
+
+def test_engine_fails_fast_on_wrong_configured_encoding(tmp_path: Path):
+    src = tmp_path / "in.csv"
+    src.write_bytes("a\nå\n".encode("cp1252"))
+    state.update_control("processing.csv_delimiter", ",")
+    state.update_control("processing.csv_encoding", "utf-8")
+    events = []
+    try:
+        engine._run_processing(
+            {"source": src.as_posix(), "mapping": [{"sources": ["a"], "separator": " "}]},
+            emit=lambda name, **kw: events.append((name, kw)),
+        )
+    finally:
+        state.update_control("processing.csv_encoding", "auto")
+    assert "processing.error" in [name for name, _ in events]
+    assert [p.name for p in tmp_path.iterdir()] == ["in.csv"]
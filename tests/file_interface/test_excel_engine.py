@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from src.table_modifier.file_interface import excel
+from src.table_modifier.file_interface.excel import ExcelFileInterface, select_engine
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    installed = {"calamine", "openpyxl", "xlrd"}
+    monkeypatch.setattr(excel, "engine_available", lambda name: name in installed)
+    return installed
+
+
+def test_select_engine_prefers_calamine(engines, tmp_path):
+    assert select_engine(tmp_path / "a.xlsx") == "calamine"
+    assert select_engine(tmp_path / "a.xls") == "calamine"
+    engines.discard("calamine")
+    # pandas' own defaults (openpyxl / xlrd) apply
+    assert select_engine(tmp_path / "a.xlsx") is None
+    assert select_engine(tmp_path / "a.xls") is None
+
+
+def test_partial_reads_of_large_workbooks_stream(engines, tmp_path, monkeypatch):
+    big = tmp_path / "big.xlsx"
+    big.write_bytes(b"\0" * 16)
+    monkeypatch.setattr(excel, "PARTIAL_READ_STREAMING_MIN_BYTES", 8)
+    assert select_engine(big, partial=True) == "openpyxl"
+    assert select_engine(big) == "calamine"
+    monkeypatch.setattr(excel, "PARTIAL_READ_STREAMING_MIN_BYTES", 32)
+    assert select_engine(big, partial=True) == "calamine"
+
+
+def test_preferred_engine_when_supported(engines, tmp_path):
+    assert select_engine(tmp_path / "a.xlsx", preferred="openpyxl") == "openpyxl"
+    assert select_engine(tmp_path / "a.xls", preferred="xlrd") == "xlrd"
+    # Unsupported combination or missing engine falls back to auto
+    assert select_engine(tmp_path / "a.xlsx", preferred="xlrd") == "calamine"
+    engines.discard("openpyxl")
+    assert select_engine(tmp_path / "a.xlsx", preferred="openpyxl") == "calamine"
+
+
+def test_interface_reads_with_selected_engine(tmp_path, monkeypatch):
+    path = tmp_path / "book.xlsx"
+    pd.DataFrame({"A": [1, 2], "B": ["x", "y"]}).to_excel(path, index=False, sheet_name="S")
+    seen = []
+    real = pd.read_excel
+
+    def spy(*args, **kwargs):
+        seen.append(kwargs.get("engine"))
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_excel", spy)
+    iface = ExcelFileInterface(path)
+    iface.engine_preference = "openpyxl"
+    assert iface.get_headers() == ["A", "B"]
+    assert iface.load()["B"].tolist() == ["x", "y"]
+    assert seen == ["openpyxl", "openpyxl"]
+
+    try:
+        ExcelFileInterface.set_default_engine("openpyxl")
+        assert ExcelFileInterface(path)._engine() == {"engine": "openpyxl"}
+    finally:
+        ExcelFileInterface.set_default_engine("auto")
+    assert ExcelFileInterface.default_engine is None
@@ -33,7 +33,7 @@ def test_excel_interface_core(monkeypatch, tmp_path):
 
     calls: dict[str, Any] = {"writer_called": False, "to_excel_called": False}
 
-    def fake_read_excel(path, sheet_name=0, nrows=None, skiprows=0):  # noqa: ANN001
+    def fake_read_excel(path, sheet_name=0, nrows=None, skiprows=0, engine=None):  # noqa: ANN001
         if nrows == 0:
             return headers_df
         return sample_df
@@ -48,7 +48,7 @@ def test_excel_interface_core(monkeypatch, tmp_path):
 
     # Patch pandas I/O
     monkeypatch.setattr(pd, "read_excel", fake_read_excel)
-    monkeypatch.setattr(pd, "ExcelFile", lambda p: DummyExcelFile(p))
+    monkeypatch.setattr(pd, "ExcelFile", lambda p, engine=None: DummyExcelFile(p))
     monkeypatch.setattr(pd, "ExcelWriter", fake_excel_writer)
     monkeypatch.setattr(pd.DataFrame, "to_excel", fake_to_excel, raising=True)
 
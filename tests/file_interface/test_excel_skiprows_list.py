@@ -7,7 +7,7 @@ from src.table_modifier.file_interface.excel import ExcelFileInterface
 def test_excel_set_rows_to_skip_list(monkeypatch, tmp_path):
     calls = {"args": []}
 
-    def fake_read_excel(path, sheet_name=0, nrows=None, skiprows=0):  # noqa: ANN001
+    def fake_read_excel(path, sheet_name=0, nrows=None, skiprows=0, engine=None):  # noqa: ANN001
         calls["args"].append({"sheet_name": sheet_name, "nrows": nrows, "skiprows": skiprows})
         # return headers or data accordingly
         if nrows == 0:
@@ -15,7 +15,7 @@ def test_excel_set_rows_to_skip_list(monkeypatch, tmp_path):
         return pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
 
     monkeypatch.setattr(pd, "read_excel", fake_read_excel)
-    monkeypatch.setattr(pd, "ExcelFile", lambda p: type("X", (), {"sheet_names": ["S1"], "engine": "openpyxl"})())
+    monkeypatch.setattr(pd, "ExcelFile", lambda p, engine=None: type("X", (), {"sheet_names": ["S1"], "engine": "openpyxl"})())
 
     p = tmp_path / "test.xlsx"
     p.write_bytes(b"")
@@ -30,3 +30,16 @@ def test_excel_set_rows_to_skip_list(monkeypatch, tmp_path):
     assert list(df.columns) == ["A", "B"]
     assert any(isinstance(call["skiprows"], list) for call in calls["args"])  # at least once a list
 
+
+
+def test_changing_skips_rereads_loaded_sheet(tmp_path):
+    p = tmp_path / "d.xlsx"
+    pd.DataFrame({"n": [1, 2, 3, 4]}).to_excel(p, index=False)
+    iface = ExcelFileInterface(p.as_posix())
+    assert iface.read_rows(0, 10)["n"].tolist() == [1, 2, 3, 4]
+    iface.set_rows_to_skip([1, 2])
+    assert iface.read_rows(0, 10)["n"].tolist() == [3, 4]
+    assert iface.count_rows() == 2
+    loaded = iface._df
+    iface.set_rows_to_skip([2, 1])
+    assert iface._df is loaded
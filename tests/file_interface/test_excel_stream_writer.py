@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from src.table_modifier.file_interface.excel import ExcelFileInterface, ExcelStreamWriter
+from src.table_modifier.processing import engine
+
+
+def test_stream_writer_rolls_over_sheets(tmp_path):
+    w = ExcelStreamWriter(sheet_name="Data", max_rows=4)  # header + 3 rows per sheet
+    w.append_df(pd.DataFrame({"A": [1, 2], "B": ["x", None]}))
+    w.append_df(pd.DataFrame({"A": [3, 4, 5], "B": ["y", "z", np.nan]}))
+    out = tmp_path / "out.xlsx"
+    w.save_as(out.as_posix())
+
+    assert w.rows_written == 5
+    assert w.sheet_names == ["Data", "Data_2"]
+    sheets = pd.read_excel(out, sheet_name=None)
+    assert list(sheets) == ["Data", "Data_2"]
+    assert sheets["Data"]["A"].tolist() == [1, 2, 3]
+    assert sheets["Data_2"]["A"].tolist() == [4, 5]
+    assert sheets["Data"]["B"].isna().tolist() == [False, True, False]
+
+
+def test_stream_writer_header_only_and_empty(tmp_path):
+    w = ExcelStreamWriter()
+    w.append_df(pd.DataFrame(columns=["X", "Y"]))
+    w.save_as((tmp_path / "h.xlsx").as_posix())
+    assert list(pd.read_excel(tmp_path / "h.xlsx").columns) == ["X", "Y"]
+
+    empty = ExcelStreamWriter("S")
+    empty.save_as((tmp_path / "e.xlsx").as_posix())
+    assert pd.ExcelFile(tmp_path / "e.xlsx").sheet_names == ["S"]
+
+
+def test_engine_uses_stream_writer_for_excel_without_reading_input(tmp_path, monkeypatch):
+    iface = ExcelFileInterface(tmp_path / "missing.xlsx", sheet_name="Sheet9")
+    monkeypatch.setattr(ExcelFileInterface, "load", lambda self: (_ for _ in ()).throw(AssertionError("loaded")))
+    out = engine._create_output_interface_like(iface)
+    assert isinstance(out, ExcelStreamWriter)
+    out.append_df(pd.DataFrame({"A": [1]}))
+    out.save_as((tmp_path / "o.xlsx").as_posix())
+    assert pd.ExcelFile(tmp_path / "o.xlsx").sheet_names == ["Sheet9"]
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.excel import ExcelFileInterface
+from src.table_modifier.file_interface.factory import FileInterfaceFactory
+
+
+class CountingHandler:
+    extensions = (".cnt",)
+    calls = 0
+
+    def __init__(self, file_path):
+        self.path = Path(file_path)
+
+    @classmethod
+    def can_handle(cls, file_path: str) -> bool:
+        cls.calls += 1
+        return str(file_path).endswith(".cnt")
+
+
+def test_lookup_only_probes_handlers_indexed_for_the_suffix():
+    orig = FileInterfaceFactory._handlers
+    try:
+        FileInterfaceFactory.register(CountingHandler)
+        CountingHandler.calls = 0
+        for i in range(100):
+            assert FileInterfaceFactory.can_handle(f"f{i}.csv")
+        assert CountingHandler.calls == 0
+        assert isinstance(FileInterfaceFactory.create("x.cnt"), CountingHandler)
+        assert CountingHandler.calls == 1
+    finally:
+        FileInterfaceFactory._handlers = orig
+
+
+def test_registration_does_not_mutate_published_handler_list():
+    orig = FileInterfaceFactory._handlers
+    try:
+        before = FileInterfaceFactory._handlers
+        FileInterfaceFactory.register(CountingHandler)
+        assert CountingHandler not in before
+        assert CountingHandler in FileInterfaceFactory._handlers
+    finally:
+        FileInterfaceFactory._handlers = orig
+
+
+def test_content_sniffing_for_unknown_names(tmp_path: Path):
+    book = tmp_path / "export"
+    pd.DataFrame({"A": [1]}).to_excel(tmp_path / "tmp.xlsx", index=False)
+    (tmp_path / "tmp.xlsx").rename(book)
+    # Name-based checks don't open files; create() sniffs by default
+    assert not FileInterfaceFactory.can_handle(book.as_posix())
+    assert FileInterfaceFactory.can_handle(book.as_posix(), sniff=True)
+    iface = FileInterfaceFactory.create(book.as_posix())
+    assert isinstance(iface, ExcelFileInterface)
+    assert iface.get_headers() == ["A"]
+
+    legacy = tmp_path / "legacy.bin"
+    legacy.write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 16)
+    assert FileInterfaceFactory._find_handler(legacy.as_posix(), sniff=True) is ExcelFileInterface
+
+    text = tmp_path / "notes.bin"
+    text.write_text("a,b\n1,2\n")
+    assert not FileInterfaceFactory.can_handle(text.as_posix(), sniff=True)
+
+
+def test_zip_sniffing_tells_workbooks_from_zipped_csv(tmp_path: Path):
+    import zipfile
+
+    archive = tmp_path / "data.pkg"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("data.csv", "A\n1\n")
+    assert FileInterfaceFactory._find_handler(archive.as_posix(), sniff=True) is CSVFileInterface
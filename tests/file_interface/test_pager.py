@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.excel import ExcelFileInterface
+from src.table_modifier.file_interface.pager import RowPager
+
+
+def _csv(tmp_path: Path, rows: int) -> Path:
+    p = tmp_path / "d.csv"
+    p.write_text("n,sq\n" + "".join(f"{i},{i * i}\n" for i in range(rows)), encoding="utf-8")
+    return p
+
+
+def test_pager_reads_pages_and_bounds_memory(tmp_path: Path):
+    iface = CSVFileInterface(_csv(tmp_path, 95).as_posix())
+    pager = RowPager(iface, page_size=10, max_pages=3)
+    assert pager.total_rows() == 95
+    assert pager.columns() == ["n", "sq"]
+    assert pager.cell(57, 1) == 57 * 57
+    assert pager.row(94)["n"] == 94
+    assert pager.cell(95, 0) is None
+    for page in range(10):
+        pager.page(page)
+    assert len(pager._pages) == 3
+    assert pager.exhausted and pager.rows_seen == 95
+
+
+def test_pager_applies_transform_per_page(tmp_path: Path):
+    iface = CSVFileInterface(_csv(tmp_path, 30).as_posix())
+    pager = RowPager(iface, page_size=7, transform=lambda df: df[["sq"]].rename(columns={"sq": "square"}))
+    assert pager.columns() == ["square"]
+    assert pager.cell(20, 0) == 400
+
+
+def test_excel_and_generic_read_rows(tmp_path: Path):
+    p = tmp_path / "d.xlsx"
+    pd.DataFrame({"a": range(12)}).to_excel(p, index=False)
+    iface = ExcelFileInterface(p.as_posix())
+    assert iface.count_rows() == 12
+    assert iface.read_rows(10, 5)["a"].tolist() == [10, 11]
+
+    gz = tmp_path / "d.csv.gz"
+    pd.DataFrame({"a": range(30)}).to_csv(gz, index=False)
+    csv_gz = CSVFileInterface(gz.as_posix())
+    assert csv_gz.count_rows() is None
+    pager = RowPager(csv_gz, page_size=8)
+    assert pager.total_rows() is None
+    assert pager.cell(29, 0) == 29
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.table_modifier.file_interface.cache import ParseCache
+from src.table_modifier.file_interface.excel import ExcelFileInterface
+from src.table_modifier.file_interface.factory import FileInterfaceFactory
+
+
+def make_xlsx(tmp_path: Path, rows: int = 5) -> Path:
+    p = tmp_path / "book.xlsx"
+    pd.DataFrame({"A": list(range(rows)), "B": [f"v{i}" for i in range(rows)]}).to_excel(
+        p, index=False, sheet_name="Data"
+    )
+    return p
+
+
+def test_key_changes_with_source_and_options(tmp_path: Path):
+    src = tmp_path / "x.csv"
+    src.write_text("a\n1\n")
+    cache = ParseCache(tmp_path / "cache")
+    k1 = cache.key_for(src, "Sheet1", 0)
+    assert k1 == cache.key_for(src, "Sheet1", 0)
+    assert k1 != cache.key_for(src, "Sheet2", 0)
+    assert k1 != cache.key_for(src, "Sheet1", [1, 2])
+    src.write_text("a\n1\n2\n")
+    assert k1 != cache.key_for(src, "Sheet1", 0)
+    assert cache.key_for(tmp_path / "missing.csv") is None
+
+
+def test_put_get_and_iter_batches(tmp_path: Path):
+    cache = ParseCache(tmp_path / "cache")
+    df = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]})
+    assert cache.get("k") is None
+    assert cache.put("k", df)
+    pd.testing.assert_frame_equal(cache.get("k"), df, check_dtype=False)
+    assert list(cache.get("k", columns=["B"]).columns) == ["B"]
+    chunks = list(cache.iter_batches("k", 2))
+    assert [len(c) for c in chunks] == [2, 1]
+    assert list(chunks[1].index) == [2]
+    assert list(cache.schema("k").columns) == ["A", "B"]
+
+
+def test_evicts_least_recently_used(tmp_path: Path):
+    cache = ParseCache(tmp_path / "cache", max_bytes=10**9)
+    df = pd.DataFrame({"A": list(range(100))})
+    cache.put("old", df)
+    cache.put("new", df)
+    old_path = tmp_path / "cache" / "old.parquet"
+    os.utime(old_path, (1, 1))
+    cache.max_bytes = (tmp_path / "cache" / "new.parquet").stat().st_size
+    cache.evict()
+    assert not cache.contains("old")
+    assert cache.contains("new")
+
+
+def test_factory_wires_cache_and_excel_reads_sidecar(tmp_path: Path, monkeypatch):
+    p = make_xlsx(tmp_path)
+    cache = ParseCache(tmp_path / "cache")
+    FileInterfaceFactory.set_parse_cache(cache)
+    try:
+        iface = FileInterfaceFactory.create(p.as_posix())
+        assert iface.parse_cache is cache
+        first = iface.load()
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("read_excel should not be called on a cache hit")
+
+        monkeypatch.setattr(pd, "read_excel", fail)
+        again = FileInterfaceFactory.create(p.as_posix())
+        again.sheet_name = "Data"
+        pd.testing.assert_frame_equal(again.load(), first, check_dtype=False)
+
+        streamed = FileInterfaceFactory.create(p.as_posix())
+        streamed.sheet_name = "Data"
+        assert sum(len(c) for c in streamed.iter_load(chunksize=2)) == 5
+        assert streamed.get_headers() == ["A", "B"]
+        cols = list(streamed.iter_columns(value_count=2))
+        assert [c.columns[0] for c in cols] == ["A", "B"]
+        assert all(len(c) == 2 for c in cols)
+    finally:
+        FileInterfaceFactory.set_parse_cache(None)
+
+
+def test_interfaces_without_cache_support_are_untouched(tmp_path: Path):
+    p = tmp_path / "data.csv"
+    p.write_text("a\n1\n")
+    FileInterfaceFactory.set_parse_cache(ParseCache(tmp_path / "cache"))
+    try:
+        iface = FileInterfaceFactory.create(p.as_posix())
+        assert iface.parse_cache is None
+    finally:
+        FileInterfaceFactory.set_parse_cache(None)
+    assert ExcelFileInterface(p).parse_cache is None
+
+
+def test_sheet_key_depends_on_engine(tmp_path: Path):
+    pytest.importorskip("python_calamine")
+    iface = ExcelFileInterface(make_xlsx(tmp_path))
+    iface.parse_cache = ParseCache(tmp_path / "cache")
+    iface.engine_preference = "openpyxl"
+    openpyxl_key = iface._sheet_cache_key("Data")
+    iface.engine_preference = "calamine"
+    assert iface._sheet_cache_key("Data") != openpyxl_key
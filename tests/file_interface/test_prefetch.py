@@ -0,0 +1,121 @@
+import threading
+
+import pandas as pd
+
+from src.table_modifier.file_interface.prefetch import (
+    FileMetadata,
+    MetadataPrefetcher,
+    PRIORITY_HIGH,
+    collect_metadata,
+    collect_sheet_metadata,
+    estimate_rows,
+)
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.signals import EMIT
+
+
+def _csv(tmp_path, name="a.csv", rows=5):
+    p = tmp_path / name
+    p.write_text("id,name\n" + "".join(f"{i},n{i}\n" for i in range(rows)), encoding="utf-8")
+    return p
+
+
+def test_collect_metadata_csv(tmp_path):
+    p = _csv(tmp_path)
+    meta = collect_metadata(p)
+    assert meta.sheets == [None]
+    sheet = meta.sheet()
+    assert sheet.headers == ["id", "name"]
+    assert set(sheet.schema) == {"id", "name"}
+    assert sheet.estimated_rows == 5
+    assert set(sheet.classifications) == {"id", "name"}
+
+
+def test_collect_metadata_excel_sheets(tmp_path):
+    p = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(p, engine="openpyxl") as w:
+        pd.DataFrame({"A": [1, 2]}).to_excel(w, sheet_name="First", index=False)
+        pd.DataFrame({"B": ["x"], "C": ["y"]}).to_excel(w, sheet_name="Second", index=False)
+    meta = collect_metadata(p)
+    assert meta.sheets == ["First", "Second"]
+    assert meta.sheet().headers == ["A"]
+    assert set(meta.sheet().classifications) == {"A"}
+    # Only the sheet a workbook opens on is read up front
+    assert meta.sheet("Second") is None
+    second = collect_sheet_metadata(p, "Second")
+    assert second.headers == ["B", "C"]
+    assert set(second.classifications) == {"B", "C"}
+
+
+def test_excel_sample_reads_only_sample_rows(tmp_path, monkeypatch):
+    p = tmp_path / "big.xlsx"
+    pd.DataFrame({"A": list(range(500))}).to_excel(p, index=False)
+    reads = []
+    real_read_excel = pd.read_excel
+
+    def read_excel(*args, **kwargs):
+        reads.append(kwargs.get("nrows"))
+        return real_read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_excel", read_excel)
+    sheet = collect_metadata(p, sample_rows=10).sheet()
+    assert sheet.headers == ["A"]
+    assert reads and None not in reads  # no full-sheet read
+
+
+def test_estimate_rows_samples_large_files(tmp_path, monkeypatch):
+    import src.table_modifier.file_interface.prefetch as prefetch
+
+    monkeypatch.setattr(prefetch, "ESTIMATE_SAMPLE_BYTES", 100)
+    p = tmp_path / "wide.csv"
+    p.write_text("id,name\n" + "".join(f"{i:05d},n\n" for i in range(1000)), encoding="utf-8")
+    estimate = estimate_rows(CSVFileInterface(p))
+    assert 800 <= estimate <= 1200
+
+
+def test_prefetcher_priority_order_and_invalidation(tmp_path):
+    started, gate = threading.Event(), threading.Event()
+    order = []
+
+    def collect(path, sample_rows=100):
+        started.set()
+        gate.wait(5)
+        order.append(path)
+        return FileMetadata(path=path)
+
+    paths = [str(_csv(tmp_path, f"{n}.csv")) for n in "abcd"]
+    pf = MetadataPrefetcher(max_workers=1, collect=collect)
+    pf.submit(paths[0])
+    assert started.wait(5)  # the only worker is now busy with a.csv
+    for p in paths[1:]:
+        pf.submit(p)
+    pf.submit(paths[3], PRIORITY_HIGH)
+    gate.set()
+    assert pf.wait(paths[2], 5) is not None
+    pf.shutdown()
+    assert order == [paths[0], paths[3], paths[1], paths[2]]
+    assert all(pf.get(p) is not None for p in paths)
+
+    # Changed files are read again
+    _csv(tmp_path, "a.csv", rows=50)
+    assert pf.get(paths[0]) is None
+
+
+def test_prefetcher_follows_tracked_file_signals(tmp_path):
+    done = threading.Event()
+    pf = MetadataPrefetcher(collect=lambda path, sample_rows=100: FileMetadata(path=path))
+    stop = pf.start()
+    try:
+        p = _csv(tmp_path)
+        from src.table_modifier.signals import ON
+
+        unsub = ON("prefetch.file.ready", lambda sender, **kw: done.set())
+        EMIT("state.file.tracked_files.added", file=CSVFileInterface(p))
+        assert done.wait(5)
+        unsub()
+        assert pf.get(p) is not None
+        EMIT("state.file.tracked_files.deleted", file=CSVFileInterface(p))
+        assert pf.get(p) is None
+    finally:
+        stop()
+        pf.shutdown()
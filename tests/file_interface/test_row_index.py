@@ -0,0 +1,152 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.row_index import RowIndexCache, build_row_index
+
+CONTENT = (
+    'id,text\r\n'
+    '0,plain\r\n'
+    '1,"two\r\nlines"\r\n'
+    '\r\n'
+    '2,"quoted ""x"", y"\r\n'
+    '3,d\r\n'
+    '4,e\r\n'
+    '5,"f\nf"\r\n'
+    '6,g'
+)
+
+
+@pytest.fixture
+def small_step(monkeypatch):
+    monkeypatch.setattr(CSVFileInterface, "row_indexes", RowIndexCache())
+    monkeypatch.setattr(CSVFileInterface, "row_index_step", 3)
+
+
+def test_build_row_index_is_quote_aware_and_skips_blank_lines(tmp_path: Path):
+    p = tmp_path / "d.csv"
+    p.write_bytes(CONTENT.encode("utf-8"))
+    index = build_row_index(p, step=2)
+    data = CONTENT.encode("utf-8")
+    assert index.records == 8  # header + 7 rows
+    assert index.blank_lines.tolist() == [3] and index.lines == 9
+    assert index.line_of(3) == 4 and index.record_of(3) is None and index.record_of(4) == 3
+    assert [data[o:o + 2] for o in index.offsets] == [b"id", b"1,", b"3,", b"5,"]
+    offset, lead = index.seek(5)
+    assert (data[offset:offset + 2], lead) == (b"3,", 1)
+
+
+def test_read_rows_matches_full_load(tmp_path: Path, small_step):
+    p = tmp_path / "d.csv"
+    p.write_bytes(CONTENT.encode("utf-8"))
+    iface = CSVFileInterface(p.as_posix())
+    assert iface.row_index() is not None
+    full = iface.load()
+    for start in range(len(full) + 1):
+        for count in (1, 2, 5):
+            page = iface.read_rows(start, count)
+            expected = full.iloc[start:start + count].reset_index(drop=True)
+            assert page["id"].tolist() == expected["id"].tolist()
+            assert page["text"].tolist() == expected["text"].tolist()
+
+
+def test_read_rows_with_skipped_rows(tmp_path: Path, small_step):
+    p = tmp_path / "s.csv"
+    p.write_text("junk\nmore junk\na,b\n" + "".join(f"{i},{i}\n" for i in range(20)), encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+    iface.set_rows_to_skip([0, 1, 7, 8])
+    full = iface.load()
+    assert list(iface.read_rows(0, 100).columns) == ["a", "b"]
+    for start in range(len(full)):
+        assert iface.read_rows(start, 4)["a"].tolist() == full["a"].iloc[start:start + 4].tolist()
+
+
+def test_read_rows_with_blank_line_inside_window(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(CSVFileInterface, "row_indexes", RowIndexCache())
+    monkeypatch.setattr(CSVFileInterface, "row_index_step", 4)
+    p = tmp_path / "b.csv"
+    p.write_text("a,b\n0,x\n1,y\n2,z\n3,y\n\n4,w\n5,v\n6,u\n", encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+    assert iface.read_rows(5, 1)["a"].tolist() == [5]
+    assert iface.read_rows(3, 3)["a"].tolist() == [3, 4, 5]
+
+
+def test_read_rows_with_skips_and_blank_lines_match_pandas(tmp_path: Path, small_step):
+    lines = ["junk", "", "a,b"]
+    for i in range(40):
+        lines.append(f'{i},"multi\nline"' if i % 7 == 3 else f"{i},v{i}")
+        if i % 5 == 2:
+            lines.append("")
+    p = tmp_path / "sb.csv"
+    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+    for skips in ([0], [0, 1], [0, 6, 7, 12], [0, 20, 21, 22, 30]):
+        iface.set_rows_to_skip(skips)
+        full = iface.load()
+        assert iface.count_rows() == len(full)
+        for start in range(len(full) + 1):
+            page = iface.read_rows(start, 3)
+            expected = full.iloc[start:start + 3]
+            assert page["a"].tolist() == expected["a"].tolist(), (skips, start)
+            assert page["b"].tolist() == expected["b"].tolist(), (skips, start)
+
+
+def test_reads_within_first_step_do_not_build_the_index(tmp_path: Path, small_step):
+    p = tmp_path / "f.csv"
+    p.write_text("a\n" + "".join(f"{i}\n" for i in range(20)), encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+    assert iface.read_rows(2, 5)["a"].tolist() == [2, 3, 4, 5, 6]
+    assert not CSVFileInterface.row_indexes._entries
+    assert iface.read_rows(3, 1)["a"].tolist() == [3]
+    assert CSVFileInterface.row_indexes._entries
+
+
+def test_unindexable_files_fall_back(tmp_path: Path, small_step):
+    p = tmp_path / "u.csv"
+    p.write_text("a\n1\n2\n3\n", encoding="utf-16")
+    iface = CSVFileInterface(p.as_posix())
+    assert iface.row_index() is None
+    assert iface.read_rows(1, 5)["a"].tolist() == [2, 3]
+
+
+def test_sidecar_round_trip_and_byte_ranges(tmp_path: Path):
+    p = tmp_path / "big.csv"
+    p.write_text("a\n" + "".join(f"{i}\n" for i in range(100)), encoding="utf-8")
+    cache = RowIndexCache(tmp_path / "idx")
+    index = cache.get(p, step=10)
+    assert list((tmp_path / "idx").glob("*.rowidx.npz"))
+    again = RowIndexCache(tmp_path / "idx").get(p, step=10)
+    assert np.array_equal(index.offsets, again.offsets) and again.records == 101
+
+    ranges = index.byte_ranges(4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == p.stat().st_size
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    data = p.read_bytes()
+    # Every range starts on a record boundary, so each parses on its own
+    assert sum(data[a:b].count(b"\n") for a, b in ranges) == 101
+    assert all(data[a - 1:a] == b"\n" for a, _ in ranges[1:])
+
+
+def test_sidecars_are_evicted_least_recently_used(tmp_path: Path):
+    idx = tmp_path / "idx"
+    files = []
+    for name in "abc":
+        p = tmp_path / f"{name}.csv"
+        p.write_text("a\n" + "".join(f"{i}\n" for i in range(100)), encoding="utf-8")
+        files.append(p)
+    cache = RowIndexCache(idx, max_bytes=10**9)
+    cache.get(files[0], step=10)
+    (first,) = idx.glob("*.rowidx.npz")
+    cache.get(files[1], step=10)
+    (second,) = set(idx.glob("*.rowidx.npz")) - {first}
+    os.utime(first, (1, 1))
+    os.utime(second, (2, 2))
+    # A sidecar read from disk counts as used, so second is now the oldest
+    RowIndexCache(idx).get(files[0], step=10)
+    cache.max_bytes = 2 * second.stat().st_size
+    cache.get(files[2], step=10)
+    remaining = set(idx.glob("*.rowidx.npz"))
+    assert len(remaining) == 2 and first in remaining and second not in remaining
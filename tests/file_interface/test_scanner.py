@@ -0,0 +1,55 @@
+import os
+import threading
+
+from src.table_modifier.file_interface.scanner import DirectoryScanner, diff_listing
+
+
+def _touch(d, *names):
+    for n in names:
+        (d / n).write_text("a\n1\n", encoding="utf-8")
+
+
+def test_scan_filters_and_batches(tmp_path):
+    _touch(tmp_path, "a.csv", "b.csv", "c.csv", "notes.txt")
+    (tmp_path / "sub.csv").mkdir()
+    batches = []
+    listing = DirectoryScanner(batch_size=2).scan(str(tmp_path), on_batch=batches.append)
+    assert sorted(os.path.basename(p) for p in listing) == ["a.csv", "b.csv", "c.csv"]
+    assert [len(b) for b in batches] == [2, 1]
+    assert [p for b in batches for p in b] == listing
+
+
+def test_listing_cached_until_directory_changes(tmp_path):
+    _touch(tmp_path, "a.csv")
+    calls = []
+
+    def accept(path):
+        calls.append(path)
+        return path.endswith(".csv")
+
+    scanner = DirectoryScanner(accept=accept)
+    first = scanner.scan(str(tmp_path))
+    assert scanner.scan(str(tmp_path)) == first
+    assert len(calls) == 1  # second scan served from the cache
+
+    _touch(tmp_path, "b.csv")
+    st = os.stat(tmp_path)
+    # Make sure the mtime differs even on coarse-grained filesystems
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert sorted(os.path.basename(p) for p in scanner.scan(str(tmp_path))) == ["a.csv", "b.csv"]
+
+
+def test_scan_cancel_and_missing_directory(tmp_path):
+    _touch(tmp_path, "a.csv")
+    cancel = threading.Event()
+    cancel.set()
+    scanner = DirectoryScanner()
+    assert scanner.scan(str(tmp_path), cancel=cancel) is None
+    assert scanner.cached(str(tmp_path)) is None
+    assert scanner.scan(str(tmp_path / "missing")) is None
+
+
+def test_diff_listing():
+    removed, added = diff_listing(["a", "b", "c"], ["c", "d", "a"])
+    assert removed == ["b"]
+    assert added == ["d"]
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.table_modifier.file_interface.base import iter_records
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.excel import ExcelFileInterface
+
+
+def test_iter_records_native_values():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None], "c": [0.5, float("nan")]})
+    rows = list(iter_records(df))
+    assert rows[0] == {"a": 1, "b": "x", "c": 0.5}
+    assert type(rows[0]["a"]) is int
+    assert pd.isna(rows[1]["b"])
+
+
+def test_csv_stream_rows_across_chunks_with_projection(tmp_path: Path):
+    p = tmp_path / "d.csv"
+    p.write_text("a,b,c\n" + "".join(f"{i},x{i},{i * 2}\n" for i in range(25)), encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+
+    rows = list(iface.stream_rows(chunksize=10))
+    assert len(rows) == 25
+    assert rows[24] == {"a": 24, "b": "x24", "c": 48}
+
+    projected = list(iface.stream_rows(columns=["c", "a"], chunksize=10))
+    assert projected[3] == {"c": 6, "a": 3}
+    assert list(projected[3]) == ["c", "a"]
+
+    with pytest.raises(KeyError):
+        next(iface.stream_rows(columns=["nope"]))
+
+
+def test_excel_stream_rows_projection(tmp_path: Path):
+    p = tmp_path / "d.xlsx"
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).to_excel(p, index=False)
+    iface = ExcelFileInterface(p.as_posix())
+    assert list(iface.stream_rows(columns=["b"], chunksize=2)) == [{"b": "x"}, {"b": "y"}, {"b": "z"}]
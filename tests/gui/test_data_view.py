@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from PyQt6.QtCore import QModelIndex, Qt
+
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.file_interface.pager import RowPager
+from src.table_modifier.gui.main_window.data_view import PagedTableModel
+
+
+def _model(tmp_path: Path, name: str, rows: int, page_size: int) -> PagedTableModel:
+    p = tmp_path / name
+    text = "a,b\n" + "".join(f"{i},{'' if i % 2 else 'x'}\n" for i in range(rows))
+    if name.endswith(".gz"):
+        import gzip
+
+        with gzip.open(p, "wt", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        p.write_text(text, encoding="utf-8")
+    return PagedTableModel(RowPager(CSVFileInterface(p.as_posix()), page_size=page_size))
+
+
+def test_known_length_is_fetched_in_growing_steps(tmp_path: Path):
+    model = _model(tmp_path, "d.csv", 100, 10)
+    assert model.rowCount() == 0 and model.columnCount() == 2
+    fetches = 0
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+        fetches += 1
+    assert model.rowCount() == 100
+    assert fetches < 10
+    assert model.data(model.index(98, 1)) == "x"
+    assert model.data(model.index(99, 1)) == ""
+    assert model.headerData(0, Qt.Orientation.Horizontal) == "a"
+    assert model.headerData(4, Qt.Orientation.Vertical) == "5"
+
+
+def test_unknown_length_reads_ahead_until_exhausted(tmp_path: Path):
+    model = _model(tmp_path, "d.csv.gz", 25, 10)
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+    assert model.rowCount() == 25
+    assert model.data(model.index(24, 0)) == "24"
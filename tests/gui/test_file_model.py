@@ -0,0 +1,40 @@
+import threading
+from pathlib import Path
+
+from src.table_modifier.gui.main_window.file_selector.models import FileModel
+
+
+def test_rescan_only_applies_the_difference(tmp_path: Path):
+    model = FileModel()
+    generation = model._generation
+    model._on_scan_batch(generation, [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")])
+    removed, inserted = [], []
+    model.rowsRemoved.connect(lambda *args: removed.append(args[1]))
+    model.rowsInserted.connect(lambda *args: inserted.append(args[1]))
+
+    # Native listings may spell paths differently (e.g. separators on Windows)
+    model._on_scan_finished(generation, [f"{tmp_path}//a.csv", f"{tmp_path}//b.csv"])
+    assert removed == [] and inserted == []
+
+    model._on_scan_finished(generation, [str(tmp_path / "b.csv"), str(tmp_path / "c.csv")])
+    assert [p.name for p in model.files] == ["b.csv", "c.csv"]
+    assert [p.name for p in model.filtered_files] == ["b.csv", "c.csv"]
+
+
+def test_scan_requests_are_started_on_the_gui_thread(monkeypatch, tmp_path: Path):
+    model = FileModel()
+    started = []
+    monkeypatch.setattr(
+        model, "_start_scan", lambda d, incremental: started.append(threading.current_thread())
+    )
+
+    # Delayed "directory.updated" emits arrive on the scheduler thread
+    worker = threading.Thread(
+        target=model.update_files_from_folder_path, args=("test",), kwargs={"directory": tmp_path}
+    )
+    worker.start()
+    worker.join()
+    assert started == []
+
+    model.update_files_from_folder_path("test", directory=tmp_path)
+    assert started == [threading.main_thread()]
@@ -0,0 +1,43 @@
+from PyQt6.QtCore import Qt
+
+from src.table_modifier.classifier.result import ClassificationResult
+from src.table_modifier.gui.main_window.map_screen.header_list import (
+    HEADER_MIME_TYPE,
+    BadgeRole,
+    HeaderListModel,
+    MappedRole,
+)
+
+
+def _headers(model: HeaderListModel):
+    return [model.data(model.index(r)) for r in range(model.rowCount())]
+
+
+def test_filter_is_indexed_case_insensitive_substring():
+    model = HeaderListModel([f"Column {i}" for i in range(3000)] + ["E-mail (work)"])
+    model.set_filter("umn 299")
+    assert _headers(model) == ["Column 299"] + [f"Column {i}" for i in range(2990, 3000)]
+    model.set_filter("(WORK")
+    assert _headers(model) == ["E-mail (work)"]
+    assert model.index_of("E-mail (work)").row() == 0
+    assert not model.index_of("Column 1").isValid()
+    model.set_filter("")
+    assert model.rowCount() == 3001
+
+
+def test_roles_mime_and_rename():
+    model = HeaderListModel(["name", "email"])
+    model.set_classifications({"email": ClassificationResult({"email": 0.9, "text": 0.2}, "email", ["a@b.c"])})
+    model.set_mapped(["email"])
+    email = model.index_of("email")
+    assert model.data(email, BadgeRole) == "email"
+    assert model.data(email, MappedRole) is True
+    assert "a@b.c" in model.data(email, Qt.ItemDataRole.ToolTipRole)
+    assert model.data(model.index_of("name"), BadgeRole) is None
+
+    mime = model.mimeData([email])
+    assert bytes(mime.data(HEADER_MIME_TYPE).data()).decode() == "email"
+
+    assert model.setData(model.index_of("name"), "full name")
+    model.set_filter("full")
+    assert _headers(model) == ["full name"]
@@ -0,0 +1,64 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from src.table_modifier.gui.main_window.file_selector.name_index import (
+    NameIndex,
+    required_literals,
+)
+
+NAMES = [
+    "ABC123_orders.csv",
+    "abc_customers.xlsx",
+    "report_2024.csv",
+    "Report_2023.CSV",
+    "xyz.csv",
+    "a.csv",
+]
+
+
+def _index():
+    index = NameIndex()
+    index.add(Path("/data") / n for n in NAMES)
+    return index
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["", "csv", "CSV", "report", "rep", "a", r"^.*[A-Z]{3}[0-9]{1,4}.*$", r"_20\d\d\.",
+     "(?i)report", "orders|customers", r"\.xlsx$", "zzz"],
+)
+def test_search_matches_plain_regex_scan(pattern):
+    expected = [n for n in NAMES if re.search(pattern, n)]
+    assert [p.name for p in _index().search(pattern)] == expected
+
+
+def test_search_narrows_when_query_extended():
+    index = _index()
+    assert len(index.search("rep")) == 1
+    assert index._last is not None and index._last[0] == "rep"
+    assert [p.name for p in index.search("report_2")] == ["report_2024.csv"]
+    assert index.search("report_9") == []
+
+
+def test_add_remove_and_version():
+    index = _index()
+    v = index.version
+    index.remove([Path("/data/report_2024.csv")])
+    index.add([Path("/data/report_2025.csv")])
+    assert index.version > v
+    assert len(index) == len(NAMES)
+    assert [p.name for p in index.search("report")] == ["report_2025.csv"]
+
+
+def test_invalid_pattern_raises():
+    with pytest.raises(re.error):
+        _index().search("(")
+
+
+def test_required_literals():
+    assert required_literals("report") == (["report"], True)
+    assert required_literals(r"ab(c|d)e*f") == (["ab", "f"], False)
+    assert required_literals("a|b")[0] == []
+    assert required_literals("(?i)abc") == (["abc"], False)
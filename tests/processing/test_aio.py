@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from src.table_modifier.config.state import state
+from src.table_modifier.processing import engine
+from src.table_modifier.processing.aio import JobEvent, ProcessingJob, coalesce, process, run_job
+from src.table_modifier.signals import ON
+
+
+class FakeInput:
+    def __init__(self, path: str, rows: int, chunk: int = 2):
+        self.path = Path(path)
+        self.df = pd.DataFrame({"A": [f"v{i}" for i in range(rows)]})
+        self.chunk = chunk
+        self.sheet_name = None
+        self.on_chunk = None
+
+    def get_headers(self):
+        return ["A"]
+
+    def set_rows_to_skip(self, rows: List[int]):
+        pass
+
+    def iter_load(self, chunksize: int = 1000):
+        for i, start in enumerate(range(0, len(self.df), self.chunk)):
+            if self.on_chunk:
+                self.on_chunk(i)
+            yield self.df.iloc[start:start + self.chunk]
+
+
+class FakeOutput:
+    def __init__(self):
+        self.rows = 0
+        self.saved_path = None
+
+    def append_df(self, df: pd.DataFrame) -> None:
+        self.rows += len(df)
+
+    def save_as(self, file_path: str) -> None:
+        self.saved_path = file_path
+
+
+def _setup(monkeypatch, tmp_path, rows: int = 10):
+    fin = FakeInput((tmp_path / "in.csv").as_posix(), rows)
+    fout = FakeOutput()
+    monkeypatch.setattr(engine, "_estimate_total_rows", lambda iface: rows)
+    monkeypatch.setattr(engine, "_create_output_interface_like", lambda iface: fout)
+    monkeypatch.setattr("src.table_modifier.file_interface.factory.FileInterfaceFactory.create", lambda path: fin)
+    state.update_control("processing.strict", False)
+    state.update_control("processing.output_path", None)
+    current = {"source": fin.path.as_posix(), "mapping": [{"sources": ["A"]}], "skip_rows": []}
+    return fin, fout, current
+
+
+def test_coalesce_keeps_latest_progress_only():
+    events = [
+        JobEvent("progress.update", {"value": 10}),
+        JobEvent("status.update", {"msg": "x"}),
+        JobEvent("progress.update", {"value": 20}),
+    ]
+    assert coalesce(events) == events[1:]
+
+
+def test_process_yields_events_on_loop_thread(monkeypatch, tmp_path):
+    _, fout, current = _setup(monkeypatch, tmp_path)
+
+    async def main():
+        return [ev async for ev in process(ProcessingJob(current))]
+
+    events = asyncio.run(main())
+    names = [e.name for e in events]
+    assert names[-1] == "processing.complete"
+    assert [e.kwargs["value"] for e in events if e.name == "progress.update"][-1] == 100
+    assert fout.rows == 10 and fout.saved_path
+
+
+def test_jobs_run_concurrently_and_cancel_independently(monkeypatch, tmp_path):
+    fin, _, current = _setup(monkeypatch, tmp_path)
+    first, second = ProcessingJob(current), ProcessingJob(dict(current))
+    fin.on_chunk = lambda i: first.cancel() if i == 1 else None
+
+    async def collect(job):
+        return [ev.name async for ev in process(job)]
+
+    async def main():
+        return await asyncio.gather(collect(first), collect(second))
+
+    a, b = asyncio.run(main())
+    assert "processing.canceled" in a
+    assert "processing.canceled" not in b and "processing.complete" in b
+
+
+def test_run_job_reemits_on_bus(monkeypatch, tmp_path):
+    _, _, current = _setup(monkeypatch, tmp_path)
+    seen: Dict[str, Any] = {}
+
+    def on_complete(sender, **kwargs):
+        seen["complete"] = kwargs.get("path")
+
+    def record(**kwargs):
+        seen["record_thread"] = threading.current_thread()
+        seen["rows"] = kwargs["rows"]
+
+    monkeypatch.setattr(engine, "_record_metrics", record)
+    ON("processing.complete", on_complete)
+    asyncio.run(run_job(ProcessingJob(current)))
+    assert seen["complete"].endswith("in_processed.csv")
+    # Metrics reach state from the loop's thread, not the executor
+    assert seen["record_thread"] is threading.main_thread()
+    assert seen["rows"] == 10
+
+
+def test_processing_start_uses_running_loop(monkeypatch, tmp_path):
+    _, _, current = _setup(monkeypatch, tmp_path)
+    state.update_control("processing.current", current)
+    done: List[Any] = []
+
+    def on_complete(sender, **kwargs):
+        done.append(kwargs)
+
+    ON("processing.complete", on_complete)
+
+    async def main():
+        engine._on_processing_start(None)
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert tasks, "expected the job to be scheduled on the running loop"
+        assert set(tasks) <= engine._tasks
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert done
+    assert not engine._tasks
@@ -13,7 +13,7 @@ def test_parse_source_id():
 
 def test_build_output_path(tmp_path):
     p = tmp_path / "file.csv"
-    res = engine._build_output_path(p.as_posix())
+    res = engine.build_output_path(p.as_posix())
     assert res.name == "file_processed.csv"
 
 
@@ -47,14 +47,14 @@ class DummyIfaceNoList(DummyIface):
 
 def test_apply_skip_rows_prefers_list():
     iface = DummyIface()
-    engine._apply_skip_rows(iface, [1, 3, 5])
+    engine.apply_skip_rows(iface, [1, 3, 5])
     assert iface.rows_skip == [1, 3, 5]
     assert iface.header_skip is None
 
 
 def test_apply_skip_rows_fallback_contiguous_header():
     iface = DummyIfaceNoList()
-    engine._apply_skip_rows(iface, [0, 1, 2])
+    engine.apply_skip_rows(iface, [0, 1, 2])
     assert iface.header_skip == 3
 
 
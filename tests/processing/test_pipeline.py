@@ -0,0 +1,109 @@
+import threading
+from typing import Any, List
+
+import pandas as pd
+
+from src.table_modifier.processing.pipeline import (
+    DedupeConcatStage,
+    DedupeDropStage,
+    Pipeline,
+    ProgressMonitor,
+    ProjectionStage,
+    SinkStage,
+    Stage,
+    TransformStage,
+)
+
+
+class ListSource(Stage):
+    name = "source"
+
+    def __init__(self, frames: List[pd.DataFrame], on_pull=None):
+        self.frames = frames
+        self.on_pull = on_pull
+
+    def process(self, chunks=None):
+        for i, df in enumerate(self.frames):
+            if self.on_pull:
+                self.on_pull(i)
+            yield df
+
+
+class Out:
+    def __init__(self):
+        self.frames: List[pd.DataFrame] = []
+
+    def append_df(self, df: pd.DataFrame) -> None:
+        self.frames.append(df)
+
+
+def _frames():
+    return [
+        pd.DataFrame({"K": ["a", "b"], "V": ["1", "2"], "X": [0, 0]}),
+        pd.DataFrame({"K": ["a", "c"], "V": ["3", "4"], "X": [0, 0]}),
+    ]
+
+
+def test_stages_are_composable_generators():
+    chunks = iter(_frames())
+    out = list(TransformStage([{"sources": ["K", "V"], "separator": "-"}]).process(
+        ProjectionStage(["K", "V", "missing"]).process(chunks)
+    ))
+    assert [df["Combined_1"].tolist() for df in out] == [["a-1", "b-2"], ["a-3", "c-4"]]
+
+
+def test_dedupe_stages():
+    dropped = list(DedupeDropStage("K").process(iter(_frames())))
+    assert len(dropped) == 1 and dropped[0]["K"].tolist() == ["a", "b", "c"]
+    assert dropped[0]["V"].tolist() == ["1", "2", "4"]
+
+    concat = list(DedupeConcatStage("K", ["K", "V"], sep="|").process(iter(_frames())))
+    assert concat[0].set_index("K")["V"].to_dict() == {"a": "1|3", "b": "2", "c": "4"}
+
+
+def test_pipeline_reports_progress_metrics_and_sink():
+    progress: List[Any] = []
+    out = Out()
+    sink = SinkStage(out)
+    monitor = ProgressMonitor(total_rows=4, chunksize=2, emit=lambda name, **kw: progress.append((name, kw)))
+    result = Pipeline(
+        ListSource(_frames()),
+        [ProjectionStage(["K"]), TransformStage([{"sources": ["K"]}])],
+        sink,
+        monitor=monitor,
+    ).run()
+    assert result.rows_read == 4 and result.any_data and not result.canceled
+    assert pd.concat(out.frames)["K"].tolist() == ["a", "b", "a", "c"]
+    assert [kw["value"] for name, kw in progress if name == "progress.update"] == [52, 99]
+    names = [m.name for m in result.metrics]
+    assert names == ["source", "progress", "projection", "transform", "sink"]
+    assert all(m.seconds >= 0 for m in result.metrics)
+    assert result.metrics[-1].rows == 4
+
+
+def test_pipeline_cancel_stops_pulling_but_flushes_buffered_stages():
+    cancel = threading.Event()
+    out = Out()
+    monitor = ProgressMonitor(0, 2, cancel_event=cancel, emit=lambda *a, **k: None)
+    source = ListSource(_frames(), on_pull=lambda i: cancel.set() if i == 1 else None)
+    result = Pipeline(source, [DedupeDropStage("K")], SinkStage(out), monitor=monitor).run()
+    assert result.canceled
+    assert result.rows_read == 2
+    # The first chunk was deduplicated and still written when the input stopped
+    assert pd.concat(out.frames)["K"].tolist() == ["a", "b"]
+
+
+def test_sink_falls_back_to_frame_accumulation():
+    class Failing:
+        _df = None
+        _delimiter = ","
+
+        def append_df(self, df):
+            raise RuntimeError("nope")
+
+    target = Failing()
+    sink = SinkStage(target, delimiter=";")
+    sink.write(pd.DataFrame({"A": [1]}))
+    sink.write(pd.DataFrame({"A": [2]}))
+    assert target._delimiter == ";"
+    assert target._df["A"].tolist() == [1, 2]
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.table_modifier.file_interface.csv import CSVFileInterface
+from src.table_modifier.processing.preview import MappingPreview, SampleCache, read_sample
+from src.table_modifier.processing.transform import apply_mapping
+
+
+def test_render_matches_apply_mapping_and_recomputes_only_changed_slots():
+    df = pd.DataFrame({"A": ["x", "y", None], "B": [1, 2, 3], "C": ["u", "v", "w"]})
+    preview = MappingPreview(df)
+    mapping = [
+        {"sources": ["A"], "separator": " "},
+        {"sources": ["B", "C"], "separator": "-"},
+    ]
+    pd.testing.assert_frame_equal(preview.render(mapping), apply_mapping(df, mapping))
+    assert preview.computed == 2
+
+    # Reordering reuses both columns
+    preview.render(list(reversed(mapping)))
+    assert preview.computed == 2
+
+    # A separator edit recomputes that slot alone
+    mapping[1] = {"sources": ["B", "C"], "separator": "/"}
+    out = preview.render(mapping)
+    assert preview.computed == 3
+    assert out["Combined_2"].tolist() == ["1/u", "2/v", "3/w"]
+    pd.testing.assert_frame_equal(out, apply_mapping(df, mapping))
+
+    assert preview.render([]).shape == (3, 0)
+
+
+def test_samples_are_read_once_per_key(tmp_path: Path):
+    p = tmp_path / "d.csv"
+    p.write_text("junk\na,b\n" + "".join(f"{i},{i * 2}\n" for i in range(100)), encoding="utf-8")
+    iface = CSVFileInterface(p.as_posix())
+    cache = SampleCache()
+    reads = []
+
+    def loader(skips):
+        reads.append(skips)
+        return read_sample(iface, skips, rows=10)
+
+    sample = cache.get(("d", (0,)), lambda: loader([0]))
+    assert list(sample.columns) == ["a", "b"] and len(sample) == 10
+    assert cache.get(("d", (0,)), lambda: loader([0])) is sample
+    assert reads == [[0]]
+
+    # Clearing the skips resets the interface too
+    assert list(cache.get(("d", ()), lambda: loader([])).columns) == ["junk"]
+    assert len(reads) == 2
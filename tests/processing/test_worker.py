@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from src.table_modifier.config.state import state
+from src.table_modifier.processing import worker
+
+
+def _job(tmp_path, rows=20):
+    src = tmp_path / "in.csv"
+    src.write_text("A,B\n" + "".join(f"a{i},b{i}\n" for i in range(rows)), encoding="utf-8")
+    state.update_control("processing.strict", False)
+    state.update_control("processing.strict_per_slot", False)
+    state.update_control("processing.csv_delimiter", ",")
+    state.update_control("processing.output_path", (tmp_path / "out.csv").as_posix())
+    return {"source": src.as_posix(), "mapping": [{"sources": ["B"]}], "skip_rows": []}
+
+
+def _run(current, **kwargs):
+    events, metrics = [], []
+    worker.run_in_process(
+        current,
+        emit=lambda name, **kw: events.append((name, kw)),
+        record=lambda **kw: metrics.append(kw),
+        **kwargs,
+    )
+    return events, metrics
+
+
+def test_run_in_process_streams_events_and_metrics(tmp_path):
+    events, metrics = _run(_job(tmp_path), cancel_event=threading.Event())
+    names = [n for n, _ in events]
+    assert names[-1] == "processing.complete", events
+    assert [kw["value"] for n, kw in events if n == "progress.update"][-1] == 100
+    assert (tmp_path / "out.csv").read_text(encoding="utf-8").splitlines()[:2] == ["B", "b0"]
+    assert metrics and metrics[0]["rows"] == 20
+
+
+def test_cancel_kills_worker(tmp_path):
+    cancel = threading.Event()
+    cancel.set()
+    events, metrics = _run(_job(tmp_path), cancel_event=cancel)
+    assert [n for n, _ in events] == ["status.update", "processing.canceled"]
+    assert metrics == []
+    assert not (tmp_path / "out.csv").exists()
+
+
+@pytest.mark.skipif(worker.resource is None, reason="needs resource.setrlimit")
+def test_memory_limit_fails_job_not_caller(tmp_path):
+    events, _ = _run(_job(tmp_path), cancel_event=threading.Event(), memory_limit_mb=1)
+    names = [n for n, _ in events]
+    assert "processing.error" in names
+    assert "processing.complete" not in names